@@ -6,10 +6,16 @@ NVDA ve diğer ekran okuyucu desteği ile.
 
 import os
 import time
-import pygame
 from config import AUDIO, ACCESSIBILITY
 from game.game_settings import get_settings
 
+# Headless (sunucu / simülasyon) ortamlarında pygame kurulu olmayabilir.
+# Bu durumda yalnızca NullAudioManager kullanılabilir.
+try:
+    import pygame
+except ImportError:
+    pygame = None
+
 # Erişilebilirlik için accessible_output2
 try:
     import accessible_output2.outputs.auto as ao2
@@ -474,12 +480,139 @@ class AudioManager:
             pygame.mixer.quit()
 
 
+class NullAudioManager:
+    """
+    Sessiz ses yöneticisi (headless mod).
+    AudioManager ile aynı arayüzü sunar ancak hiçbir şey çalmaz/seslendirmez;
+    pygame mixer'ı ve ekran okuyucuyu hiç başlatmaz.
+    """
+    
+    mixer_available = False
+    screen_reader = None
+    music_volume = 0.0
+    sfx_volume = 0.0
+    ui_volume = 0.0
+    ambient_volume = 0.0
+    current_music = None
+    
+    def get_screen_reader_name(self) -> str:
+        return "Yok"
+    
+    def reinitialize_screen_reader(self):
+        pass
+    
+    def load_sound(self, name: str, path: str) -> bool:
+        return False
+    
+    def load_sounds_from_directory(self, directory: str, prefix: str = ""):
+        pass
+    
+    def play_sound(self, name: str, volume: float = None):
+        pass
+    
+    def play_ui_sound(self, sound_type: str):
+        pass
+    
+    def play_game_sound(self, category: str, name: str, volume: float = None):
+        pass
+    
+    def play_game_sound_panned(self, category: str, name: str, pan: float = 0.0, volume: float = None):
+        pass
+    
+    def play_ambient(self, name: str, volume: float = None):
+        pass
+    
+    def stop_ambient(self):
+        pass
+    
+    def play_event_sound(self, event_type: str):
+        pass
+    
+    def play_music(self, name_or_path: str, loop: bool = True):
+        pass
+    
+    def stop_music(self):
+        pass
+    
+    def pause_music(self):
+        pass
+    
+    def resume_music(self):
+        pass
+    
+    def set_music_volume(self, volume: float):
+        pass
+    
+    def set_sfx_volume(self, volume: float):
+        pass
+    
+    def set_ui_volume(self, volume: float):
+        pass
+    
+    def set_ambient_volume(self, volume: float):
+        pass
+    
+    def speak(self, text: str, interrupt: bool = True):
+        pass
+    
+    def announce(self, text: str):
+        pass
+    
+    def announce_menu_item(self, item_name: str, position: int = None, total: int = None):
+        pass
+    
+    def announce_button(self, button_name: str, shortcut: str = None):
+        pass
+    
+    def announce_value(self, label: str, value: str, unit: str = None):
+        pass
+    
+    def announce_screen_change(self, screen_name: str):
+        pass
+    
+    def announce_action_result(self, action: str, success: bool, detail: str = None):
+        pass
+    
+    def cleanup(self):
+        pass
+
+
 # Global erişim için
 _audio_manager = None
+_null_audio_manager = NullAudioManager()
+_headless_depth = 0
+
+
+def push_headless():
+    """
+    Headless kapsamına gir.
+    Kapsam açıkken get_audio_manager() sessiz NullAudioManager döndürür ve
+    AudioManager singleton'ı (pygame mixer, ekran okuyucu) hiç oluşturulmaz.
+    Kapsamlar sayılır; her push_headless() bir pop_headless() ile kapatılmalıdır.
+    Böylece headless bir GameManager kapandığında aynı süreçteki normal
+    oyun yeniden sesli çalışır.
+    """
+    global _headless_depth
+    _headless_depth += 1
+
+
+def pop_headless():
+    """push_headless() ile açılan kapsamı kapat"""
+    global _headless_depth
+    if _headless_depth > 0:
+        _headless_depth -= 1
+
+
+def is_headless() -> bool:
+    """Headless mod açık mı?"""
+    return _headless_depth > 0
+
 
-def get_audio_manager() -> AudioManager:
-    """AudioManager singleton örneğini al"""
+def get_audio_manager():
+    """AudioManager singleton örneğini al (headless modda NullAudioManager)"""
     global _audio_manager
+    if _headless_depth > 0:
+        return _null_audio_manager
     if _audio_manager is None:
         _audio_manager = AudioManager()
     return _audio_manager
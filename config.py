@@ -11,6 +11,8 @@ FPS = 60
 # Sürüm ve GitHub
 VERSION = "v1.1.1" # Kod tabanlı sürüm numaramız (github etiketleriyle uyumlu olsun diye v kalabilir, ama oyunda v görünecek)
 SAVE_FORMAT_VERSION = "1.2" # Kayıt dosyası altyapısının sürümü (veri yapısı değiştikçe artar)
+SAVE_COMPRESSED = True # Kayıtlar sıkıştırılmış kompakt biçimde yazılır (eski düz JSON kayıtlar da okunur)
+SAVE_SLOT_COUNT = 9 # Kayıt menüsünde gösterilen yuva sayısı (1-9 tuşlarıyla seçilir)
 GITHUB_REPO = "m-enes-senovali/Osmanl-Eyalet-sim-lasyonu"
 
 GAME_TITLE = "Osmanlı Eyalet Yönetimi"
@@ -5,11 +5,13 @@ Tüm sistemleri koordine eden ana sınıf.
 """
 
 import os
-import json
+import re
 import logging
+import random
+import weakref
 from typing import Dict, List, Optional
 from dataclasses import dataclass
-from config import SAVE_FORMAT_VERSION
+from config import SAVE_FORMAT_VERSION, SAVE_SLOT_COUNT
 from game.player import PlayerCharacter
 from game.systems.economy import EconomySystem
 from game.systems.trade import TradeSystem
@@ -28,7 +30,12 @@ from game.systems.religion import ReligionSystem
 from game.systems.history import HistorySystem
 from game.systems.workers import WorkerSystem
 from game.systems.naval import NavalSystem
-from audio.audio_manager import get_audio_manager
+from game.rng import seed_rng, get_rng_state, set_rng_state
+from game.turn_profiler import TurnProfiler
+from game.save_writer import (
+    get_save_writer, snapshot_save_data, write_save_atomic, read_save_file, read_save_summary
+)
+from audio.audio_manager import get_audio_manager, push_headless, pop_headless
 import sys
 
 # Sabit takvim verileri (her turda yeniden oluşturmamak için modül seviyesinde)
@@ -36,6 +43,9 @@ DAYS_IN_MONTH = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
 MONTH_NAMES = ("", "Ocak", "Şubat", "Mart", "Nisan", "Mayıs", "Haziran",
                "Temmuz", "Ağustos", "Eylül", "Ekim", "Kasım", "Aralık")
 
+# Kayıt yuvası dosya adı (saves/slot_{n}.json)
+SLOT_FILE_PATTERN = re.compile(r'^slot_(\d+)\.json$')
+
 def get_base_path():
     """
     EXE veya Python script olarak çalışırken doğru temel yolu döndür.
@@ -77,7 +87,18 @@ SEASONS = {
 class GameManager:
     """Ana oyun yöneticisi"""
     
-    def __init__(self):
+    def __init__(self, headless: bool = False):
+        # Headless mod: pygame ekranı, ses ve ekran okuyucu olmadan tur motoru
+        # (simülasyon / dayanıklılık testleri için). Sistemler ses yöneticisini
+        # oluşturulurken aldığından kapsam tüm sistemlerden önce açılmalı.
+        # Kapsam close() (ya da with bloğunun sonu) ile kapanır; kapatılmayan
+        # yönetici çöp toplandığında finalize kapsamı yine serbest bırakır.
+        self.headless = headless
+        self._headless_scope = None
+        if headless:
+            push_headless()
+            self._headless_scope = weakref.finalize(self, pop_headless)
+        
         # Eyalet bilgisi
         self.province = ProvinceInfo()
         
@@ -86,7 +107,7 @@ class GameManager:
         
         # Oyun kimliği (aynı oyunun aynı yuvaya kaydı için)
         self.game_id = None
-        self.save_slot = None  # 1, 2, 3
+        self.save_slot = None  # Yuva numarası (1..SAVE_SLOT_COUNT)
         
         # Zaman (1 tur = 1 gün)
         self.current_year = 1520
@@ -100,38 +121,70 @@ class GameManager:
         self.game_over = False
         self.game_over_reason = ""
         
+        # Sefer rastgele sayı akışı: bu yöneticiye özel; sistemlere kurulurken
+        # verilir ve hepsi bundan çeker (new_game'de tohumlanır)
+        self.rng = random.Random()
+        self.seed = None
+        
         # Sistemler
-        self.economy = EconomySystem()
-        self.military = MilitarySystem()
+        self.economy = EconomySystem(rng=self.rng)
+        self.military = MilitarySystem(rng=self.rng)
         self.population = PopulationSystem()
         self.construction = ConstructionSystem()
-        self.diplomacy = DiplomacySystem()
-        self.events = EventSystem()
+        self.diplomacy = DiplomacySystem(rng=self.rng)
+        self.events = EventSystem(rng=self.rng)
         self.workers = WorkerSystem()
-        self.warfare = WarfareSystem()  # Savaş sistemi
-        self.trade = TradeSystem()  # Ticaret sistemi
-        self.naval = NavalSystem()  # Deniz kuvvetleri
-        self.artillery = ArtillerySystem()  # Topçu ocağı
-        self.espionage = EspionageSystem()  # Casusluk sistemi (YENİ)
-        self.religion = ReligionSystem()    # Din/Kültür sistemi (YENİ)
+        self.warfare = WarfareSystem(rng=self.rng)  # Savaş sistemi
+        self.trade = TradeSystem(rng=self.rng)  # Ticaret sistemi
+        self.naval = NavalSystem(rng=self.rng)  # Deniz kuvvetleri
+        self.artillery = ArtillerySystem(rng=self.rng)  # Topçu ocağı
+        self.espionage = EspionageSystem(rng=self.rng)  # Casusluk sistemi (YENİ)
+        self.religion = ReligionSystem(rng=self.rng)    # Din/Kültür sistemi (YENİ)
         self.history = HistorySystem()      # Geçmiş Olaylar (YENİ)
-        self.divan = DivanSystem()          # Eyalet Divanı (YENİ)
+        self.divan = DivanSystem(rng=self.rng)          # Eyalet Divanı (YENİ)
         self.advisor = AdvisorSystem(self)  # Danışman sistemi (YENİ)
         
         # Lazy-init edilmeyen yeni sistemler (önceden sadece new_game'de oluşuyordu)
         from game.systems.guilds import GuildSystem
         from game.systems.achievements import AchievementSystem
-        self.guilds = GuildSystem()
+        self.guilds = GuildSystem(rng=self.rng)
         self.achievements = AchievementSystem()
         
         # Ses yöneticisi
         self.audio = get_audio_manager()
+        
+        # Tur aşaması zamanlayıcısı (son turların süreleri, debug için)
+        self.profiler = TurnProfiler()
+        
+        # Otomatik kayıt durumu (arka plan yazıcısı tamamlandığında güncellenir)
+        # on_auto_save_complete(slot, error): UI'nin bağlayabileceği geri çağırma;
+        # yazıcı iş parçacığında çağrılır
+        self.last_auto_save: Optional[Dict] = None
+        self.on_auto_save_complete = None
     
-    def new_game(self, province_name: str = None):
-        """Yeni oyun başlat"""
+    def close(self):
+        """Headless ses kapsamını kapat (birden çok çağrı güvenlidir)"""
+        if self._headless_scope is not None:
+            self._headless_scope()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
+    
+    def new_game(self, province_name: str = None, seed: int = None):
+        """
+        Yeni oyun başlat
+        seed: Sefer tohumu. None ise rastgele üretilir; aynı tohum aynı turları üretir.
+        """
         import uuid
         from game.player import create_default_character
         
+        # Sistemler kurulurken de rastgele sayı çektiğinden önce tohumla
+        self.seed = seed_rng(self.rng, seed)
+        
         if province_name:
             self.province.name = province_name
         
@@ -144,17 +197,17 @@ class GameManager:
             self.player = create_default_character()
         
         # Sistemleri sıfırla
-        self.economy = EconomySystem()
-        self.military = MilitarySystem()
+        self.economy = EconomySystem(rng=self.rng)
+        self.military = MilitarySystem(rng=self.rng)
         self.population = PopulationSystem()
         self.construction = ConstructionSystem()
-        self.diplomacy = DiplomacySystem()
-        self.events = EventSystem()
+        self.diplomacy = DiplomacySystem(rng=self.rng)
+        self.events = EventSystem(rng=self.rng)
         self.workers = WorkerSystem()
-        self.warfare = WarfareSystem()
-        self.trade = TradeSystem()
-        self.naval = NavalSystem()
-        self.artillery = ArtillerySystem()
+        self.warfare = WarfareSystem(rng=self.rng)
+        self.trade = TradeSystem(rng=self.rng)
+        self.naval = NavalSystem(rng=self.rng)
+        self.artillery = ArtillerySystem(rng=self.rng)
         
         # YENİ SİSTEMLER (Kritik Düzeltme: Resetlenmediği için önceki oyun verisi kalıyordu)
         from game.systems.espionage import EspionageSystem
@@ -163,11 +216,12 @@ class GameManager:
         from game.systems.history import HistorySystem
         from game.systems.achievements import AchievementSystem
         
-        self.espionage = EspionageSystem()
-        self.religion = ReligionSystem()
-        self.guilds = GuildSystem()
+        self.espionage = EspionageSystem(rng=self.rng)
+        self.religion = ReligionSystem(rng=self.rng)
+        self.guilds = GuildSystem(rng=self.rng)
         self.history = HistorySystem()
         self.achievements = AchievementSystem()
+        self.divan = DivanSystem(rng=self.rng)  # Danışmanlar da sefer tohumundan üretilsin
         
         # Zaman sıfırla (1 tur = 1 gün)
         self.current_year = 1520
@@ -219,6 +273,8 @@ class GameManager:
         Tur işleme - tüm sistemleri güncelle (1 tur = 1 gün)
         """
         self.turn_count += 1
+        prof = self.profiler
+        prof.start_turn(self.turn_count)
         
         # Günü ilerlet
         self.current_day += 1
@@ -266,6 +322,7 @@ class GameManager:
             seasonal_trade_mod = 1.2  # Ticaret canlanır
         elif current_season == "Sonbahar":
             seasonal_food_mod = 1.5  # Hasat dönemi
+        prof.lap('calendar')
         
         # 1. Ekonomi
         building_maintenance = self.construction.get_total_maintenance()
@@ -294,6 +351,7 @@ class GameManager:
             military_count=self.military.get_total_soldiers(),
             building_maintenance=total_maintenance
         )
+        prof.lap('economy')
         
         # 2. Üretim (çiftlik, kereste ocağı, maden) - mevsimsel modifier
         farm_food = int(self.construction.get_food_production() * seasonal_food_mod)
@@ -336,6 +394,7 @@ class GameManager:
                 self.economy.resources.copper += copper_production
         except Exception:
             pass
+        prof.lap('production')
         
         # 3. Nüfus
         has_mosque = self.construction.has_building(BuildingType.MOSQUE)
@@ -387,10 +446,12 @@ class GameManager:
         self.economy.resources.food -= self.population.food_consumption
         if self.economy.resources.food < 0:
             self.economy.resources.food = 0
+        prof.lap('population')
         
         # 4. İnşaat
         construction_messages = self.construction.process_turn()
         messages.extend(construction_messages)
+        prof.lap('construction')
         
         # 5. İşçiler
         worker_result = self.workers.process_turn()
@@ -421,6 +482,7 @@ class GameManager:
             loyalty_boost = min(2, int(diplomacy_bonus * 10))
             if loyalty_boost > 0:
                 self.diplomacy.sultan_loyalty = min(100, self.diplomacy.sultan_loyalty + loyalty_boost)
+        prof.lap('workers')
         
         # 6. Askeri
         military_messages = self.military.process_turn()
@@ -445,13 +507,16 @@ class GameManager:
         if weariness >= 70:
             # Kritik yorgunluk: padişah memnuniyetsiz
             self.diplomacy.sultan_loyalty = max(0, self.diplomacy.sultan_loyalty - 2)
+        prof.lap('military')
         
         # 7. Topçu üretimi (Topçu Ocağı)
         self.artillery.process_production()
+        prof.lap('artillery')
         
         # 8. Deniz kuvvetleri (Tersane) - sadece kıyı eyaletlerinde
         if self.province.is_coastal:
             self.naval.process_construction()
+        prof.lap('naval')
         
         # 8b. Liman durumunu senkronize et (military tarafı)
         has_shipyard = self.construction.has_building(BuildingType.SHIPYARD)
@@ -476,6 +541,7 @@ class GameManager:
             mission['turns_remaining'] -= 1
             if mission['turns_remaining'] <= 0:
                 self.diplomacy.fail_mission(i)
+        prof.lap('diplomacy')
         
         # 10. Savaşlar - topçu ve deniz gücü desteği ile
         # Personel etkinliği çarpanı (Topçu-Cebeci oranı)
@@ -545,6 +611,7 @@ class GameManager:
                 if raid_bonus > 0:
                     loot = int(loot * (1.0 + raid_bonus))
                 self.economy.add_resources(gold=loot)
+        prof.lap('warfare')
                 
         # 10.5 DÜŞMAN İSTİLALARI (Savunma Savaşı Kontrolü)
         is_invaded, invader_name, invader_power = self.diplomacy.check_enemy_invasions(self.military.get_total_power())
@@ -558,6 +625,7 @@ class GameManager:
             audio.play_game_sound('ui', 'war_declare')
         else:
             self.current_invasion = None
+        prof.lap('invasions')
         
         # 11. Ticaret
         # Liman durumunu güncelle (Tersane binası)
@@ -579,11 +647,13 @@ class GameManager:
         
         # Ticaret işle
         trade_result = self.trade.process_turn(self.economy)
+        prof.lap('trade')
         
         # 13. Casusluk (Kadın +%15 bonus: espionage_screen → start_mission'da uygulanıyor)
         espionage_result = self.espionage.process_turn()
         espionage_messages = espionage_result.get('messages', [])
         messages.extend(espionage_messages)
+        prof.lap('espionage')
         
         # 14. Loncalar (Çeyreklik — her 90 turda = üç ayda bir)
         if hasattr(self, 'guilds') and self.turn_count % 90 == 0:
@@ -605,6 +675,7 @@ class GameManager:
             if total_supply > 0:
                 morale_boost = min(2, total_supply // 10)
                 self.military.morale = min(100, self.military.morale + morale_boost)
+        prof.lap('guilds')
         
         # Casusluk etkilerini oyuna yansıt (Keşif, Sabotaj, Fitne vb.)
         if espionage_result.get('completed'):
@@ -624,12 +695,14 @@ class GameManager:
                         self.espionage.intelligence_level = min(100, self.espionage.intelligence_level + value)
                     # Düşmana olan etkiler (Şimdilik varsayımsal global etki olarak tutuluyor)
                     # enemy_morale, enemy_stability vb. eklenebilir. Şimdilik pas geçiyoruz.
+        prof.lap('espionage')
         
         # 14. Din ve Kültür (YENİ)
         religion_result = self.religion.process_turn(self.economy)
         # Din sistemi uyarılarını oyuncuya bildir
         if religion_result.get('events'):
             messages.extend(religion_result['events'])
+        prof.lap('religion')
         
         # 15. Vakıf bonusu (Kadın karakter: +%30 vakıf etkisi)
         # Her 3 turda +1 huzur (küçük ama birikimli etki)
@@ -644,6 +717,7 @@ class GameManager:
         # 16. Oyuncu karakter tur güncellemesi (malus azalması vb.)
         if self.player:
             self.player.process_turn()
+        prof.lap('player')
         
         # 17. Olaylar
         game_state = {
@@ -669,6 +743,7 @@ class GameManager:
                     message=f"OLAY: {event.title} - {event.description}",
                     category="event"
                 )
+        prof.lap('events')
         
         # 18. Başarı kontrolü
         try:
@@ -677,6 +752,7 @@ class GameManager:
             achievement_system.on_turn_end(self)
         except Exception:
             pass  # Başarı sistemi yüklenemezse oyunu etkilemesin
+        prof.lap('achievements')
         
         # === OYUN SONU KONTROL ===
         self._check_game_over()
@@ -686,6 +762,12 @@ class GameManager:
         
         # === OTOMATİK KAYIT ===
         self._check_auto_save()
+        prof.lap('game_over_autosave')
+        
+        # Divan analizi
+        divan_reports = self.divan.analyze_turn(self)
+        prof.lap('divan')
+        prof.end_turn()
         
         # Toplanan mesajları döndür
         return {
@@ -696,9 +778,14 @@ class GameManager:
             'population_change': pop_result['population_change'],
             'event': event is not None,
             'messages': messages,
-            'divan_reports': len(self.divan.analyze_turn(self))
+            'divan_reports': len(divan_reports)
         }
     
+    def dump_turn_timings(self) -> str:
+        """Tur aşaması sürelerini debug/turn_timings.json dosyasına yaz"""
+        filepath = os.path.join(get_base_path(), 'debug', 'turn_timings.json')
+        return self.profiler.dump_json(filepath)
+    
     def _check_game_over(self):
         """Oyun sonu koşullarını kontrol et"""
         # 1. Zafer Kontrolü
@@ -767,7 +854,9 @@ class GameManager:
             
         # 5. Fetih Seferi
         if mem.get('conquest_joined') and not mem.get('conquest_completed'):
-            self.military.total_soldiers = max(0, self.military.total_soldiers - 5)
+            # Sefere giden kayıplar Azap'lardan düşülür (apply_event_effects ile aynı)
+            loss = min(5, self.military.units[UnitType.AZAP])
+            self.military.units[UnitType.AZAP] -= loss
             self.economy.resources.gold -= 30
             
         # 6. Celali İsyanları
@@ -836,6 +925,10 @@ class GameManager:
         """Otomatik kayıt kontrolü"""
         from game.game_settings import get_settings
         
+        # Headless simülasyonlar oyuncunun kayıt yuvalarına dokunmaz
+        if self.headless:
+            return
+        
         settings = get_settings()
         
         # Otomatik kayıt açık mı?
@@ -861,7 +954,11 @@ class GameManager:
             print(f"Otomatik kayıt hatası: {e}")
     
     def _silent_save(self, slot: int):
-        """Sessiz kayıt (bildirim olmadan)"""
+        """
+        Sessiz kayıt (bildirim olmadan).
+        Ana iş parçacığında yalnızca bellek içi kopya alınır; kodlama ve
+        atomik dosya yazımı arka plan yazıcısında yapılır.
+        """
         import uuid
         
         if self.game_id is None:
@@ -876,13 +973,19 @@ class GameManager:
             f'slot_{slot}.json'
         )
         
-        os.makedirs(os.path.dirname(filepath), exist_ok=True)
-        
-        save_data = self._build_save_data(slot)
+        save_data = snapshot_save_data(self._build_save_data(slot))
         save_data['auto_save'] = True  # Otomatik kayıt işareti
         
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(save_data, f, ensure_ascii=False, indent=2)
+        turn = self.turn_count
+        
+        def on_complete(path: str, error: Optional[Exception]):
+            self.last_auto_save = {'slot': slot, 'turn': turn, 'error': error}
+            if error:
+                print(f"Otomatik kayıt hatası: {error}")
+            if self.on_auto_save_complete:
+                self.on_auto_save_complete(slot, error)
+        
+        get_save_writer().submit(filepath, save_data, on_complete)
     
     def _build_save_data(self, slot: int) -> dict:
         """Ortak kayıt verisi oluştur (Çift dict sorunu önleme)"""
@@ -890,6 +993,7 @@ class GameManager:
             'version': SAVE_FORMAT_VERSION,
             'game_id': self.game_id,
             'save_slot': slot,
+            'rng': get_rng_state(self.rng, self.seed),
             'player': self.player.to_dict() if self.player else None,
             'province': {
                 'name': self.province.name,
@@ -1017,7 +1121,7 @@ class GameManager:
     def save_game(self, slot: int = None) -> bool:
         """
         Oyunu kaydet
-        slot: 1, 2, veya 3. None ise mevcut slot veya otomatik atama.
+        slot: Yuva numarası (1'den başlar). None ise mevcut slot veya otomatik atama.
         """
         # Slot belirleme
         if slot is None:
@@ -1035,14 +1139,12 @@ class GameManager:
             f'slot_{slot}.json'
         )
         
-        # Saves klasörünü oluştur
-        os.makedirs(os.path.dirname(filepath), exist_ok=True)
-        
         save_data = self._build_save_data(slot)
         
         try:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(save_data, f, ensure_ascii=False, indent=2)
+            # Bekleyen otomatik kayıt bu kaydın üzerine yazmasın
+            get_save_writer().flush()
+            write_save_atomic(filepath, save_data)
             
             self.audio.speak(f"Oyun Yuva {slot}'e kaydedildi.", interrupt=True)
             return True
@@ -1052,7 +1154,7 @@ class GameManager:
     
     def _find_empty_slot(self) -> int:
         """Boş kayıt yuvası bul"""
-        for slot in [1, 2, 3]:
+        for slot in range(1, SAVE_SLOT_COUNT + 1):
             filepath = os.path.join(
                 get_base_path(),
                 'saves',
@@ -1065,7 +1167,7 @@ class GameManager:
     def load_game(self, slot: int = None) -> bool:
         """
         Oyunu yükle
-        slot: 1, 2, veya 3.
+        slot: Yuva numarası (1'den başlar).
         """
         if slot is None:
             slot = 1
@@ -1076,13 +1178,16 @@ class GameManager:
             f'slot_{slot}.json'
         )
         
+        # Yazılmakta olan otomatik kaydın bitmesini bekle
+        get_save_writer().flush()
+        
         if not os.path.exists(filepath):
             self.audio.speak(f"Yuva {slot}'de kayıt bulunamadı.", interrupt=True)
             return False
         
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                raw_data = json.load(f)
+            # Kompakt veya eski düz JSON biçimi otomatik tanınır
+            raw_data = read_save_file(filepath)
             
             # Eski JSON formatlarını (v1.1 vb.) güncel yapıya uygun olarak dönüştür (Göç et)
             save_data = SaveMigrator.migrate(raw_data)
@@ -1101,28 +1206,28 @@ class GameManager:
             self.current_day = save_data['time'].get('day', 1)
             self.turn_count = save_data['time']['turn']
             
-            self.economy = EconomySystem.from_dict(save_data['economy'])
-            self.military = MilitarySystem.from_dict(save_data['military'])
+            self.economy = EconomySystem.from_dict(save_data['economy'], rng=self.rng)
+            self.military = MilitarySystem.from_dict(save_data['military'], rng=self.rng)
             self.population = PopulationSystem.from_dict(save_data['population'])
             self.construction = ConstructionSystem.from_dict(save_data['construction'])
-            self.diplomacy = DiplomacySystem.from_dict(save_data['diplomacy'])
-            self.events = EventSystem.from_dict(save_data['events'])
+            self.diplomacy = DiplomacySystem.from_dict(save_data['diplomacy'], rng=self.rng)
+            self.events = EventSystem.from_dict(save_data['events'], rng=self.rng)
             
             # Yeni sistemler (geriye uyumluluk için kontrol)
             if 'warfare' in save_data:
-                self.warfare = WarfareSystem.from_dict(save_data['warfare'])
+                self.warfare = WarfareSystem.from_dict(save_data['warfare'], rng=self.rng)
             if 'trade' in save_data:
-                self.trade = TradeSystem.from_dict(save_data['trade'])
+                self.trade = TradeSystem.from_dict(save_data['trade'], rng=self.rng)
             if 'workers' in save_data:
                 self.workers = WorkerSystem.from_dict(save_data['workers'])
             if 'naval' in save_data:
-                self.naval = NavalSystem.from_dict(save_data['naval'])
+                self.naval = NavalSystem.from_dict(save_data['naval'], rng=self.rng)
             if 'artillery' in save_data:
-                self.artillery = ArtillerySystem.from_dict(save_data['artillery'])
+                self.artillery = ArtillerySystem.from_dict(save_data['artillery'], rng=self.rng)
             if 'espionage' in save_data:
-                self.espionage = EspionageSystem.from_dict(save_data['espionage'])
+                self.espionage = EspionageSystem.from_dict(save_data['espionage'], rng=self.rng)
             if 'religion' in save_data:
-                self.religion = ReligionSystem.from_dict(save_data['religion'])
+                self.religion = ReligionSystem.from_dict(save_data['religion'], rng=self.rng)
             if 'guilds' in save_data:
                 self.guilds.from_dict(save_data['guilds'])
             if 'history' in save_data:
@@ -1130,7 +1235,14 @@ class GameManager:
             if 'achievements' in save_data:
                 self.achievements.from_dict(save_data['achievements'])
             if 'divan' in save_data:
-                self.divan = DivanSystem.from_dict(save_data['divan'])
+                self.divan = DivanSystem.from_dict(save_data['divan'], rng=self.rng)
+            
+            # Rastgele akışı en son geri yükle (from_dict'ler de sayı çekebilir)
+            if save_data.get('rng'):
+                self.seed = set_rng_state(self.rng, save_data['rng'])
+            else:
+                # Eski kayıtlar: akış durumu yok, yeni tohumla devam et
+                self.seed = seed_rng(self.rng)
             
             # Oyuncu karakteri yükle (YENİ)
             if 'player' in save_data and save_data['player']:
@@ -1152,31 +1264,40 @@ class GameManager:
             return False
     
     def get_save_slots_info(self) -> list:
-        """Tüm kayıt yuvalarının bilgilerini al"""
+        """
+        Tüm kayıt yuvalarının bilgilerini al.
+        Kompakt kayıtlarda yalnızca başlık satırı okunur; saves klasöründe
+        SAVE_SLOT_COUNT üzerindeki yuva dosyaları da listelenir.
+        """
+        saves_dir = os.path.join(get_base_path(), 'saves')
+        existing = {}
+        if os.path.isdir(saves_dir):
+            for entry in os.scandir(saves_dir):
+                match = SLOT_FILE_PATTERN.match(entry.name)
+                if match and entry.is_file():
+                    existing[int(match.group(1))] = entry.path
+        
         slots = []
-        for slot in [1, 2, 3]:
-            filepath = os.path.join(
-                get_base_path(),
-                'saves',
-                f'slot_{slot}.json'
-            )
+        for slot in sorted(set(range(1, SAVE_SLOT_COUNT + 1)) | set(existing)):
+            filepath = existing.get(slot)
+            if not filepath:
+                slots.append({'slot': slot, 'empty': True})
+                continue
             
-            if os.path.exists(filepath):
-                try:
-                    with open(filepath, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                    
-                    slots.append({
-                        'slot': slot,
-                        'empty': False,
-                        'province': data['province']['name'],
-                        'year': data['time']['year'],
-                        'turn': data['time']['turn'],
-                        'game_id': data.get('game_id', 'unknown')
-                    })
-                except:
-                    slots.append({'slot': slot, 'empty': True})
-            else:
+            try:
+                summary = read_save_summary(filepath)
+                slots.append({
+                    'slot': slot,
+                    'empty': False,
+                    'province': summary['province'],
+                    'year': summary['year'],
+                    'month': summary.get('month'),
+                    'turn': summary['turn'],
+                    'gold': summary.get('gold'),
+                    'game_id': summary.get('game_id', 'unknown'),
+                    'auto_save': summary.get('auto_save', False),
+                })
+            except Exception:
                 slots.append({'slot': slot, 'empty': True})
         
         return slots
@@ -1184,10 +1305,10 @@ class GameManager:
     def delete_save(self, slot: int) -> bool:
         """
         Kayıt yuvasını sil
-        slot: 1, 2, veya 3
+        slot: 1 ve üzeri yuva numarası
         Returns: True if deleted, False otherwise
         """
-        if slot not in [1, 2, 3]:
+        if slot < 1:
             return False
         
         filepath = os.path.join(
@@ -1196,6 +1317,8 @@ class GameManager:
             f'slot_{slot}.json'
         )
         
+        get_save_writer().flush()
+        
         if os.path.exists(filepath):
             try:
                 os.remove(filepath)
@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+"""
+Osmanlı Eyalet Yönetim Simülasyonu - Sefer Rastgele Sayı Üreteci
+Tohumlanabilir sefer akışı için yardımcılar.
+
+Her GameManager kendi `random.Random` örneğini (gm.rng) taşır ve bunu
+oluşturduğu sistemlere verir; sistemler global `random` modülü yerine
+self.rng'den çeker:
+
+    roll = self.rng.randint(1, 100)
+
+Modül seviyesinde paylaşılan bir akış yoktur; aynı süreçteki iki sefer
+(ör. sunucu odaları, paralel simülasyonlar) birbirinin zarını tüketmez.
+GameManager seferin başında akışı tohumlar ve durumunu kayda yazar;
+böylece aynı tohum + aynı girdiler her zaman aynı turları üretir.
+Yalnızca görsel/kozmetik rastgelelik (UI efektleri, ipuçları) global
+`random` modülünde kalmalıdır, aksi halde sefer akışı kayar.
+"""
+
+import random
+from typing import Dict, Optional
+
+
+def new_seed() -> int:
+    """İşletim sistemi entropisinden yeni bir sefer tohumu üret"""
+    return random.SystemRandom().getrandbits(32)
+
+
+def ensure_rng(rng: Optional[random.Random] = None) -> random.Random:
+    """
+    Verilen akışı döndür; None ise bağımsız yeni bir akış oluştur.
+    GameManager dışında tek başına kurulan sistemler (kayıt göçü, araçlar)
+    için varsayılan.
+    """
+    return rng if rng is not None else random.Random()
+
+
+def seed_rng(rng: random.Random, seed: Optional[int] = None) -> int:
+    """
+    Sefer akışını tohumla.
+    seed None ise yeni bir tohum üretilir. Kullanılan tohumu döndürür.
+    """
+    if seed is None:
+        seed = new_seed()
+    rng.seed(seed)
+    return seed
+
+
+def get_rng_state(rng: random.Random, seed: Optional[int] = None) -> Dict:
+    """Akış durumunu (ve seferin tohumunu) JSON'a yazılabilir biçimde döndür"""
+    version, internal, gauss_next = rng.getstate()
+    return {
+        'seed': seed,
+        'version': version,
+        'internal': list(internal),
+        'gauss_next': gauss_next,
+    }
+
+
+def set_rng_state(rng: random.Random, data: Dict) -> Optional[int]:
+    """get_rng_state() çıktısından akış durumunu geri yükle; kayıttaki tohumu döndür"""
+    rng.setstate((data['version'], tuple(data['internal']), data.get('gauss_next')))
+    return data.get('seed')
@@ -6,17 +6,23 @@ yeni eklenen sistemler (donanma, topçu vb.) için varsayılan değerlerle
 doldurarak çökmeden yüklenmesini sağlar.
 """
 
-from typing import Dict, Any
+from typing import Dict, Any, Union
 from config import SAVE_FORMAT_VERSION
+from game.save_writer import decode_save_data
 
 class SaveMigrator:
     
     @classmethod
-    def migrate(cls, save_data: Dict[str, Any]) -> Dict[str, Any]:
+    def migrate(cls, save_data: Union[Dict[str, Any], bytes]) -> Dict[str, Any]:
         """
         Verilen save datasının versiyonunu kontrol eder,
         gerekliyse sıralı göç (migration) adımlarını uygular.
+        save_data ham dosya içeriği (bytes) de olabilir; kompakt ve
+        eski düz JSON biçimleri otomatik tanınır.
         """
+        if isinstance(save_data, (bytes, bytearray)):
+            save_data = decode_save_data(bytes(save_data))
+        
         # Eski save'lerde 'version' anahtarı olmayabiliyor veya "1.1" olabiliyor
         version = save_data.get('version', '1.0')
         
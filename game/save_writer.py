@@ -0,0 +1,220 @@
+# -*- coding: utf-8 -*-
+"""
+Osmanlı Eyalet Yönetim Simülasyonu - Kayıt Yazıcı
+Kayıt dosyalarını atomik olarak ve (otomatik kayıtta) arka planda yazar.
+
+Atomik yazım: veri önce aynı klasördeki geçici dosyaya yazılır, diske
+indirilir ve os.replace ile asıl dosyanın yerine konur. Yazım sırasında
+çökme olursa eski kayıt bozulmadan kalır.
+
+Arka plan yazımı: ana iş parçacığı yalnızca kayıt verisinin bellek içi
+kopyasını (snapshot) alır; kodlama ve disk G/Ç tek bir işçi iş
+parçacığında yapılır. Böylece "sonraki tur" disk yazımını beklemez.
+
+Dosya biçimleri:
+    - Kompakt (varsayılan): tek satırlık başlık + zlib ile sıkıştırılmış
+      girintisiz JSON. Başlık satırı "OESAVE " ile başlar ve
+      {"version": SAVE_FORMAT_VERSION, "encoding": "json+zlib", "summary": {...}}
+      içerir. summary yuva listesinde gösterilen özet bilgidir (eyalet, tarih,
+      altın); kayıt menüsü tüm kaydı açmadan yalnızca bu satırı okur.
+    - Eski: girintili düz JSON. Okuma her iki biçimi de tanır.
+"""
+
+import json
+import os
+import queue
+import tempfile
+import threading
+import zlib
+from typing import Any, Callable, Dict, Optional
+from config import SAVE_FORMAT_VERSION, SAVE_COMPRESSED
+
+# Kompakt kayıt dosyasının ilk baytları
+SAVE_MAGIC = b'OESAVE '
+COMPACT_ENCODING = 'json+zlib'
+MAX_HEADER_BYTES = 64 * 1024  # Başlık satırı için okuma sınırı
+
+
+def snapshot_save_data(data: Any) -> Any:
+    """
+    Kayıt verisinin derin kopyası (yalnızca dict/list kopyalanır).
+    to_dict() çıktıları canlı listelere referans verebilir; işçi iş parçacığı
+    kodlarken ana iş parçacığı oyunu değiştirmeye devam eder.
+    """
+    if isinstance(data, dict):
+        return {key: snapshot_save_data(value) for key, value in data.items()}
+    if isinstance(data, (list, tuple)):
+        return [snapshot_save_data(value) for value in data]
+    return data
+
+
+def make_save_summary(data: Dict) -> Dict:
+    """Kayıt verisinden yuva listesi özeti çıkar"""
+    province = data.get('province') or {}
+    time_data = data.get('time') or {}
+    resources = (data.get('economy') or {}).get('resources') or {}
+    return {
+        'province': province.get('name'),
+        'year': time_data.get('year'),
+        'month': time_data.get('month'),
+        'turn': time_data.get('turn'),
+        'gold': resources.get('gold'),
+        'game_id': data.get('game_id', 'unknown'),
+        'auto_save': data.get('auto_save', False),
+    }
+
+
+def encode_save_data(data: Dict, compressed: bool = SAVE_COMPRESSED) -> bytes:
+    """Kayıt verisini dosya içeriğine kodla (kompakt veya girintili JSON)"""
+    if not compressed:
+        return json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8')
+    
+    header = {
+        'version': data.get('version', SAVE_FORMAT_VERSION),
+        'encoding': COMPACT_ENCODING,
+        'summary': make_save_summary(data),
+    }
+    body = json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    header_line = json.dumps(header, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    return SAVE_MAGIC + header_line + b'\n' + zlib.compress(body)
+
+
+def is_compact_save(payload: bytes) -> bool:
+    """İçerik kompakt kayıt biçiminde mi?"""
+    return payload.startswith(SAVE_MAGIC)
+
+
+def decode_save_data(payload: bytes) -> Dict:
+    """Dosya içeriğini kayıt verisine çöz (her iki biçim)"""
+    if is_compact_save(payload):
+        header_end = payload.index(b'\n')
+        header = json.loads(payload[len(SAVE_MAGIC):header_end].decode('utf-8'))
+        if header.get('encoding') != COMPACT_ENCODING:
+            raise ValueError(f"Bilinmeyen kayıt kodlaması: {header.get('encoding')}")
+        return json.loads(zlib.decompress(payload[header_end + 1:]).decode('utf-8'))
+    return json.loads(payload.decode('utf-8-sig'))
+
+
+def read_save_file(filepath: str) -> Dict:
+    """Kayıt dosyasını oku ve çöz"""
+    with open(filepath, 'rb') as f:
+        return decode_save_data(f.read())
+
+
+def read_save_header(filepath: str) -> Optional[Dict]:
+    """
+    Kompakt kaydın yalnızca başlık satırını oku.
+    Eski düz JSON kayıtlarda None döner.
+    """
+    with open(filepath, 'rb') as f:
+        line = f.readline(MAX_HEADER_BYTES)
+    if not is_compact_save(line) or not line.endswith(b'\n'):
+        return None
+    return json.loads(line[len(SAVE_MAGIC):].decode('utf-8'))
+
+
+def read_save_summary(filepath: str) -> Dict:
+    """
+    Yuva listesi özeti: kompakt kayıtta başlıktan, eski kayıtta tüm
+    dosya çözülerek alınır.
+    """
+    header = read_save_header(filepath)
+    if header and header.get('summary'):
+        return header['summary']
+    return make_save_summary(read_save_file(filepath))
+
+
+def write_file_atomic(filepath: str, payload: bytes):
+    """İçeriği geçici dosyaya yaz ve asıl dosyanın yerine koy"""
+    directory = os.path.dirname(filepath) or '.'
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(
+        prefix=os.path.basename(filepath) + '.', suffix='.tmp', dir=directory
+    )
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, filepath)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def write_save_atomic(filepath: str, data: Dict,
+                      encoder: Callable[[Dict], bytes] = encode_save_data):
+    """Kayıt verisini kodla ve atomik olarak yaz"""
+    write_file_atomic(filepath, encoder(data))
+
+
+class BackgroundSaveWriter:
+    """
+    Tek işçili arka plan kayıt yazıcısı.
+    İşler sırayla yazılır; callback(filepath, error) işçi iş parçacığında
+    çağrılır (error başarılıysa None).
+    """
+
+    def __init__(self):
+        self._queue: "queue.Queue" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def _ensure_thread(self):
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name="SaveWriter", daemon=True
+                )
+                self._thread.start()
+
+    def submit(self, filepath: str, data: Dict,
+               callback: Optional[Callable[[str, Optional[Exception]], None]] = None,
+               encoder: Callable[[Dict], bytes] = encode_save_data):
+        """
+        Yazım işini kuyruğa ekle.
+        data çağırandan bağımsız olmalı (bkz. snapshot_save_data).
+        """
+        self._ensure_thread()
+        self._queue.put((filepath, data, callback, encoder))
+
+    def _run(self):
+        while True:
+            filepath, data, callback, encoder = self._queue.get()
+            try:
+                error = None
+                try:
+                    write_save_atomic(filepath, data, encoder)
+                except Exception as e:
+                    error = e
+                if callback:
+                    try:
+                        callback(filepath, error)
+                    except Exception as e:
+                        print(f"Kayıt geri çağırma hatası: {e}")
+            finally:
+                self._queue.task_done()
+
+    def pending(self) -> int:
+        """Kuyrukta bekleyen iş sayısı (yaklaşık)"""
+        return self._queue.unfinished_tasks
+
+    def flush(self):
+        """Bekleyen tüm yazımlar bitene kadar bekle"""
+        if self._thread is not None:
+            self._queue.join()
+
+
+# Global instance
+_save_writer: Optional[BackgroundSaveWriter] = None
+
+
+def get_save_writer() -> BackgroundSaveWriter:
+    """Global BackgroundSaveWriter instance"""
+    global _save_writer
+    if _save_writer is None:
+        _save_writer = BackgroundSaveWriter()
+    return _save_writer
@@ -7,10 +7,10 @@ import json
 import os
 import sys
 from dataclasses import dataclass, field
-from typing import Dict, List, Callable, Optional, Any
+from typing import Dict, List, Callable, Optional, Any, Set, Tuple
 from enum import Enum
 from datetime import datetime
-from audio.audio_manager import get_audio_manager
+from audio.audio_manager import get_audio_manager, is_headless
 try:
     from game.systems.military import UnitType
 except ImportError:
@@ -309,6 +309,134 @@ def _init_achievements():
 _init_achievements()
 
 
+# ===== BAĞIMLILIK TABLOSU =====
+# Her başarı koşulu okuduğu girdileri (istatistik / oyun durumu) bildirir.
+# Tur sonunda yalnızca kilitli başarıların ihtiyaç duyduğu girdiler bir kez
+# okunur; değeri değişmeyen girdilere bağlı başarılar yeniden değerlendirilmez.
+
+def _safe_input(getter: Callable, default: Any = 0) -> Callable:
+    """Erişim hatasında varsayılan değer döndüren girdi okuyucu"""
+    def sample(system, gm):
+        try:
+            return getter(system, gm)
+        except Exception:
+            return default
+    return sample
+
+
+def _stat_input(stat_name: str) -> Callable:
+    """AchievementSystem.stats içinden okuyan girdi"""
+    return _safe_input(lambda system, gm: system.stats.get(stat_name, 0))
+
+
+def _janissary_count(system, gm) -> int:
+    if UnitType:
+        return gm.military.units.get(UnitType.YENICHERI, 0)
+    return 0
+
+
+def _min_millet_loyalty(system, gm) -> int:
+    if not getattr(gm, 'religion', None) or not getattr(gm.religion, 'millet_states', None):
+        return 0
+    return min(state.get('loyalty', 0) for state in gm.religion.millet_states.values())
+
+
+# Girdi adı -> okuyucu(system, gm)
+ACHIEVEMENT_INPUTS: Dict[str, Callable] = {
+    # Oyun durumu
+    'gold': _safe_input(lambda s, gm: gm.economy.resources.gold),
+    'trade_routes': _safe_input(lambda s, gm: len(getattr(gm.economy, 'active_trade_routes', []))),
+    'tax_rate': _safe_input(lambda s, gm: getattr(gm.economy, 'tax_rate', 0)),
+    'active_revolt': _safe_input(lambda s, gm: getattr(gm.population, 'active_revolt', False), False),
+    'income': _safe_input(lambda s, gm: gm.economy.calculate_tax_income() + gm.economy.calculate_trade_income()),
+    'workers': _safe_input(lambda s, gm: len(gm.workers.workers)),
+    'ships': _safe_input(lambda s, gm: len(getattr(gm.naval, 'ships', []))),
+    'cannons': _safe_input(lambda s, gm: len(getattr(gm.artillery, 'cannons', []))),
+    'janissaries': _safe_input(_janissary_count),
+    'marriage_alliances': _safe_input(lambda s, gm: len(getattr(gm.diplomacy, 'marriage_alliances', []))),
+    'spy_missions': _safe_input(lambda s, gm: getattr(gm.espionage, 'successful_missions', 0)),
+    'vassals': _safe_input(lambda s, gm: len(getattr(gm.diplomacy, 'vassals', []))),
+    'population': _safe_input(lambda s, gm: gm.population.population.total),
+    'min_millet_loyalty': _safe_input(_min_millet_loyalty),
+    'ulema': _safe_input(lambda s, gm: len(gm.religion.ulema)),
+    'vakifs': _safe_input(lambda s, gm: len(gm.religion.vakifs)),
+    'education': _safe_input(lambda s, gm: gm.religion.education_level),
+    'happiness': _safe_input(lambda s, gm: gm.population.happiness),
+    
+    # Başarı istatistikleri
+    'buildings_built': _stat_input('buildings_built'),
+    'battles_won': _stat_input('battles_won'),
+    'defense_victories': _stat_input('defense_victories'),
+    'raids_completed': _stat_input('raids_completed'),
+    'negotiations_completed': _stat_input('negotiations_completed'),
+    'turns_played': _stat_input('turns_played'),
+    'turns_without_war': _stat_input('turns_without_war'),
+    'turns_without_tax': _stat_input('turns_without_tax'),
+    'rebellions_crushed': _stat_input('rebellions_crushed'),
+}
+
+
+@dataclass(frozen=True)
+class AchievementRule:
+    """Başarı koşulu: bağımlı girdiler, mevcut değer ve açılma koşulu"""
+    inputs: Tuple[str, ...]
+    value: Callable[[Dict[str, Any]], int]
+    condition: Callable[[Dict[str, Any]], bool]
+
+
+def _at_least(input_name: str, target: int) -> AchievementRule:
+    """Tek girdinin hedefe ulaşmasını bekleyen koşul"""
+    return AchievementRule(
+        inputs=(input_name,),
+        value=lambda v: int(v[input_name]),
+        condition=lambda v: v[input_name] >= target,
+    )
+
+
+# condition_key -> kural
+ACHIEVEMENT_RULES: Dict[str, AchievementRule] = {
+    # Ekonomik
+    "gold_100k": _at_least('gold', 100000),
+    "trade_routes_5": _at_least('trade_routes', 5),
+    "buildings_50": _at_least('buildings_built', 50),
+    "high_tax_no_revolt": AchievementRule(
+        inputs=('tax_rate', 'active_revolt'),
+        value=lambda v: int(v['tax_rate'] * 100),
+        condition=lambda v: v['tax_rate'] >= 0.20 and not v['active_revolt'],
+    ),
+    "income_10k": _at_least('income', 10000),
+    "workers_100": _at_least('workers', 100),
+    
+    # Askeri
+    "victories_10": _at_least('battles_won', 10),
+    "ships_50": _at_least('ships', 50),
+    "cannons_100": _at_least('cannons', 100),
+    "janissaries_10k": _at_least('janissaries', 10000),
+    "defense_wins_5": _at_least('defense_victories', 5),
+    "raids_20": _at_least('raids_completed', 20),
+    
+    # Diplomatik
+    "alliances_5": _at_least('marriage_alliances', 5),
+    "spy_missions_20": _at_least('spy_missions', 20),
+    "negotiations_10": _at_least('negotiations_completed', 10),
+    "tributes_3": _at_least('vassals', 3),
+    
+    # Sosyal
+    "population_100k": _at_least('population', 100000),
+    "all_millets_loyal": _at_least('min_millet_loyalty', 80),
+    "ulema_10": _at_least('ulema', 10),
+    "vakifs_20": _at_least('vakifs', 20),
+    "education_80": _at_least('education', 80),
+    "happiness_90": _at_least('happiness', 90),
+    
+    # Gizli
+    "turns_100": _at_least('turns_played', 100),
+    "no_war_50_turns": _at_least('turns_without_war', 50),
+    "no_tax_10_turns": _at_least('turns_without_tax', 10),
+    "crush_5_rebellions": _at_least('rebellions_crushed', 5),
+}
+
+
 class AchievementSystem:
     """Başarı yönetim sistemi"""
     
@@ -338,8 +466,14 @@ class AchievementSystem:
             'turns_without_tax': 0,
         }
         
+        # Bağımlılık tablosu: girdi -> o girdiye bağlı kilitli başarılar
+        self._dependents: Dict[str, List[str]] = {}
+        self._order: Dict[str, int] = {}
+        self._last_inputs: Dict[str, Any] = {}
+        
         self._init_achievements()
         self._load_progress()
+        self.reset_evaluation()
     
     def _init_achievements(self):
         """Başarıları kopyala (global değişmemesi için)"""
@@ -384,6 +518,10 @@ class AchievementSystem:
     
     def save_progress(self):
         """İlerlemeyi kaydet"""
+        # Headless simülasyonlar oyuncunun kalıcı başarılarını değiştirmez
+        if is_headless():
+            return
+        
         save_path = self._get_save_path()
         
         data = {
@@ -405,6 +543,39 @@ class AchievementSystem:
         except Exception as e:
             print(f"Başarı kayıt hatası: {e}")
     
+    def reset_evaluation(self):
+        """
+        Bağımlılık tablosunu kilitli başarılardan yeniden derle ve son girdi
+        örneklerini unut; sonraki kontrolde tüm kilitli başarılar değerlendirilir.
+        Başarı durumları dışarıdan değiştirildiğinde (yükleme vb.) çağrılmalı.
+        """
+        self._dependents = {}
+        self._order = {ach_id: index for index, ach_id in enumerate(self.achievements)}
+        for ach_id, ach in self.achievements.items():
+            if ach.unlocked:
+                continue
+            rule = ACHIEVEMENT_RULES.get(ach.condition_key)
+            if not rule:
+                continue
+            for input_name in rule.inputs:
+                self._dependents.setdefault(input_name, []).append(ach_id)
+        self._last_inputs = {}
+    
+    def _collect_changed(self, game_manager) -> Tuple[Set[str], Dict[str, Any]]:
+        """
+        Kilitli başarıların ihtiyaç duyduğu girdileri oku.
+        Returns: (değeri değişen girdilere bağlı başarı ID'leri, girdi değerleri)
+        """
+        values = {}
+        changed_ids: Set[str] = set()
+        for input_name, dependents in self._dependents.items():
+            value = ACHIEVEMENT_INPUTS[input_name](self, game_manager)
+            values[input_name] = value
+            if input_name not in self._last_inputs or self._last_inputs[input_name] != value:
+                changed_ids.update(dependents)
+        self._last_inputs = values
+        return changed_ids, values
+    
     def _update_counts(self):
         """Toplam puan ve açılan sayısını güncelle"""
         self.total_points = 0
@@ -422,12 +593,18 @@ class AchievementSystem:
         """
         newly_unlocked = []
         
-        for ach in self.achievements.values():
+        changed_ids, values = self._collect_changed(game_manager)
+        if not changed_ids:
+            return newly_unlocked
+        
+        # Yalnızca girdisi değişen başarılar (tanım sırasıyla)
+        for ach_id in sorted(changed_ids, key=self._order.__getitem__):
+            ach = self.achievements[ach_id]
             if ach.unlocked:
                 continue
             
             # Koşulu kontrol et
-            result = self._check_condition(ach, game_manager)
+            result = self._check_condition(ach, values)
             
             if result:
                 ach.unlocked = True
@@ -437,11 +614,15 @@ class AchievementSystem:
                 newly_unlocked.append(ach)
             else:
                 # İlerlemeyi güncelle
-                progress = self._get_progress(ach, game_manager)
+                progress = self._get_progress(ach, values)
                 ach.progress = min(100.0, progress)
-                ach.current_value = self._get_current_value(ach, game_manager)
+                ach.current_value = self._get_current_value(ach, values)
         
         if newly_unlocked:
+            # Açılan başarılar bağımlılık tablosundan çıkar
+            last_inputs = self._last_inputs
+            self.reset_evaluation()
+            self._last_inputs = last_inputs
             self._update_counts()
             self.save_progress()
             
@@ -451,181 +632,33 @@ class AchievementSystem:
         
         return newly_unlocked
     
-    def _check_condition(self, ach: Achievement, gm) -> bool:
-        """Başarı koşulunu kontrol et — tüm erişimler güvenli"""
-        key = ach.condition_key
-        
+    def _check_condition(self, ach: Achievement, values: Dict[str, Any]) -> bool:
+        """Başarı koşulunu örneklenmiş girdilerle kontrol et"""
+        rule = ACHIEVEMENT_RULES.get(ach.condition_key)
+        if not rule:
+            return False
         try:
-            # Ekonomik
-            if key == "gold_100k":
-                return gm.economy.resources.gold >= 100000
-            elif key == "trade_routes_5":
-                return len(getattr(gm.economy, 'active_trade_routes', [])) >= 5
-            elif key == "buildings_50":
-                return self.stats['buildings_built'] >= 50
-            elif key == "high_tax_no_revolt":
-                tax_rate = getattr(gm.economy, 'tax_rate', 0)
-                active_revolt = getattr(gm.population, 'active_revolt', False)
-                return tax_rate >= 0.20 and not active_revolt
-            elif key == "income_10k":
-                # Gelir hesapla
-                try:
-                    income = gm.economy.calculate_tax_income() + gm.economy.calculate_trade_income()
-                    return income >= 10000
-                except Exception:
-                    return False
-            elif key == "workers_100":
-                return len(gm.workers.workers) >= 100
-            
-            # Askeri
-            elif key == "victories_10":
-                return self.stats['battles_won'] >= 10
-            elif key == "ships_50":
-                return len(getattr(gm.naval, 'ships', [])) >= 50
-            elif key == "cannons_100":
-                return len(getattr(gm.artillery, 'cannons', [])) >= 100
-            elif key == "janissaries_10k":
-                if UnitType:
-                    return gm.military.units.get(UnitType.YENICHERI, 0) >= 10000
-                return False
-            elif key == "defense_wins_5":
-                return self.stats.get('defense_victories', 0) >= 5
-            elif key == "raids_20":
-                return self.stats['raids_completed'] >= 20
-            
-            # Diplomatik
-            elif key == "alliances_5":
-                alliances = len(getattr(gm.diplomacy, 'marriage_alliances', []))
-                return alliances >= 5
-            elif key == "spy_missions_20":
-                return getattr(gm.espionage, 'successful_missions', 0) >= 20
-            elif key == "negotiations_10":
-                return self.stats['negotiations_completed'] >= 10
-            elif key == "tributes_3":
-                vassals = len(getattr(gm.diplomacy, 'vassals', []))
-                return vassals >= 3
-            
-            # Sosyal
-            elif key == "population_100k":
-                return gm.population.population.total >= 100000
-            elif key == "all_millets_loyal":
-                if not getattr(gm, 'religion', None) or not getattr(gm.religion, 'millet_states', None):
-                    return False
-                for state in gm.religion.millet_states.values():
-                    if state.get('loyalty', 0) < 80:
-                        return False
-                return True
-            elif key == "ulema_10":
-                return len(gm.religion.ulema) >= 10
-            elif key == "vakifs_20":
-                return len(gm.religion.vakifs) >= 20
-            elif key == "education_80":
-                return gm.religion.education_level >= 80
-            elif key == "happiness_90":
-                return gm.population.happiness >= 90
-            
-            # Gizli
-            elif key == "turns_100":
-                return self.stats['turns_played'] >= 100
-            elif key == "no_war_50_turns":
-                return self.stats['turns_without_war'] >= 50
-            elif key == "no_tax_10_turns":
-                return self.stats['turns_without_tax'] >= 10
-            elif key == "crush_5_rebellions":
-                return self.stats['rebellions_crushed'] >= 5
+            return bool(rule.condition(values))
         except Exception:
-            pass
-        
-        return False
+            return False
     
-    def _get_progress(self, ach: Achievement, gm) -> float:
+    def _get_progress(self, ach: Achievement, values: Dict[str, Any]) -> float:
         """Başarı ilerlemesini hesapla (%)"""
         if ach.target_value <= 1:
             return 0.0
         
-        current = self._get_current_value(ach, gm)
+        current = self._get_current_value(ach, values)
         return (current / ach.target_value) * 100.0
     
-    def _get_current_value(self, ach: Achievement, gm) -> int:
-        """Mevcut değeri al — tüm başarılar için"""
-        key = ach.condition_key
-        
+    def _get_current_value(self, ach: Achievement, values: Dict[str, Any]) -> int:
+        """Mevcut değeri örneklenmiş girdilerden al"""
+        rule = ACHIEVEMENT_RULES.get(ach.condition_key)
+        if not rule:
+            return 0
         try:
-            # Ekonomik
-            if key == "gold_100k":
-                return int(gm.economy.resources.gold)
-            elif key == "trade_routes_5":
-                return len(getattr(gm.economy, 'active_trade_routes', []))
-            elif key == "buildings_50":
-                return self.stats['buildings_built']
-            elif key == "high_tax_no_revolt":
-                return int(getattr(gm.economy, 'tax_rate', 0) * 100)
-            elif key == "income_10k":
-                try:
-                    return int(gm.economy.calculate_tax_income() + gm.economy.calculate_trade_income())
-                except Exception:
-                    return 0
-            elif key == "workers_100":
-                return len(gm.workers.workers)
-            
-            # Askeri
-            elif key == "victories_10":
-                return self.stats['battles_won']
-            elif key == "ships_50":
-                return len(getattr(gm.naval, 'ships', []))
-            elif key == "cannons_100":
-                return len(getattr(gm.artillery, 'cannons', []))
-            elif key == "janissaries_10k":
-                if UnitType:
-                    return gm.military.units.get(UnitType.YENICHERI, 0)
-                return 0
-            elif key == "defense_wins_5":
-                return self.stats.get('defense_victories', 0)
-            elif key == "raids_20":
-                return self.stats['raids_completed']
-            
-            # Diplomatik
-            elif key == "alliances_5":
-                return len(getattr(gm.diplomacy, 'marriage_alliances', []))
-            elif key == "spy_missions_20":
-                return getattr(gm.espionage, 'successful_missions', 0)
-            elif key == "negotiations_10":
-                return self.stats['negotiations_completed']
-            elif key == "tributes_3":
-                return len(getattr(gm.diplomacy, 'vassals', []))
-            
-            # Sosyal
-            elif key == "population_100k":
-                return gm.population.population.total
-            elif key == "all_millets_loyal":
-                if not getattr(gm, 'religion', None) or not getattr(gm.religion, 'millet_states', None):
-                    return 0
-                millets = gm.religion.millet_states.values()
-                if not millets:
-                    return 0
-                return int(min(state.get('loyalty', 0) for state in millets))
-            elif key == "ulema_10":
-                return len(gm.religion.ulema)
-            elif key == "vakifs_20":
-                return len(gm.religion.vakifs)
-            elif key == "education_80":
-                return int(gm.religion.education_level)
-            elif key == "happiness_90":
-                return int(gm.population.happiness)
-            
-            # Gizli
-            elif key == "turns_100":
-                return self.stats['turns_played']
-            elif key == "no_war_50_turns":
-                return self.stats['turns_without_war']
-            elif key == "no_tax_10_turns":
-                return self.stats['turns_without_tax']
-            elif key == "crush_5_rebellions":
-                return self.stats['rebellions_crushed']
+            return int(rule.value(values))
         except Exception:
-            pass
-        
-        return 0
+            return 0
     
     def _announce_unlock(self, ach: Achievement):
         """Başarı açıldığını duyur"""
@@ -725,6 +758,7 @@ class AchievementSystem:
                 ach.current_value = ach_data.get('current_value', 0)
         
         system._update_counts()
+        system.reset_evaluation()
         return system
 
 
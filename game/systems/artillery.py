@@ -9,9 +9,10 @@ barut tüketimi ve detaylı savaş istatistikleri.
 """
 
 from dataclasses import dataclass, field
+import random
 from typing import Dict, List, Optional
 from enum import Enum
-import random
+from game.rng import ensure_rng
 from audio.audio_manager import get_audio_manager
 
 
@@ -427,10 +428,10 @@ class Cannon:
         
         return min(50, int(base_risk * condition_factor * fatigue_factor))
     
-    def fire(self) -> dict:
+    def fire(self, rng: random.Random) -> dict:
         """
         Bir atış yap — yıpranma, patlama kontrolü, barut tüketimi.
-        Mühimmat çarpanı uygulanır.
+        Mühimmat çarpanı uygulanır. rng: Sefer akışı (ArtillerySystem.rng)
         Returns: {'success': bool, 'burst': bool, 'gunpowder_used': int,
                   'iron_used': int, 'wear': int, 'message': str}
         """
@@ -453,16 +454,16 @@ class Cannon:
         
         # Yıpranma
         if self.material == "iron":
-            wear = random.randint(1, 3)  # Demir: 1-3 yıpranma
+            wear = rng.randint(1, 3)  # Demir: 1-3 yıpranma
         else:
-            wear = random.randint(0, 1)  # Bronz: 0-1 yıpranma
+            wear = rng.randint(0, 1)  # Bronz: 0-1 yıpranma
         
         self.condition = max(0, self.condition - wear)
         result['wear'] = wear
         
         # Patlama riski kontrolü
         burst_chance = self.get_burst_risk()
-        if random.randint(1, 100) <= burst_chance:
+        if rng.randint(1, 100) <= burst_chance:
             result['burst'] = True
             result['success'] = False
             result['message'] = f"{self.name} yarıldı ve patladı! Mürettebat kaybı!"
@@ -470,7 +471,7 @@ class Cannon:
         
         # Hasar kontrolü (condition çok düşükse)
         if self.condition < 20 and not self.damaged:
-            if random.randint(1, 100) <= 30:
+            if rng.randint(1, 100) <= 30:
                 self.damaged = True
                 result['message'] = f"{self.name} hasarlı! Tamir gerekiyor."
         
@@ -528,7 +529,9 @@ class CannonProduction:
 class ArtillerySystem:
     """Topçu yönetim sistemi (Topçu Ocağı) — Geliştirilmiş"""
     
-    def __init__(self):
+    def __init__(self, rng: Optional[random.Random] = None):
+        # Sefer akışı (GameManager verir; tek başına kurulumda bağımsız akış)
+        self.rng = ensure_rng(rng)
         self.cannons: List[Cannon] = []
         self.production_queue: List[CannonProduction] = []
         self.total_cannons_produced: int = 0
@@ -698,7 +701,7 @@ class ArtillerySystem:
                 continue
             
             # Ateş et
-            fire_result = cannon.fire()
+            fire_result = cannon.fire(self.rng)
             result['gunpowder_used'] += fire_result['gunpowder_used']
             
             if fire_result['burst']:
@@ -742,7 +745,7 @@ class ArtillerySystem:
             if cannon.condition <= 0:
                 continue
             
-            fire_result = cannon.fire()
+            fire_result = cannon.fire(self.rng)
             result['gunpowder_used'] += fire_result['gunpowder_used']
             
             if fire_result['burst']:
@@ -987,9 +990,9 @@ class ArtillerySystem:
         }
     
     @classmethod
-    def from_dict(cls, data: Dict) -> 'ArtillerySystem':
+    def from_dict(cls, data: Dict, rng: Optional[random.Random] = None) -> 'ArtillerySystem':
         """Dictionary'den yükle — eski kayıtlarla uyumlu"""
-        system = cls()
+        system = cls(rng=rng)
         
         for cannon_data in data.get("cannons", []):
             try:
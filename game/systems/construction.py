@@ -1719,6 +1719,13 @@ BUILDING_DEFINITIONS = {
 
 
 
+# ConstructionSystem önbelleğinde bina başına tutulan toplu değerler
+AGGREGATE_KEYS = (
+    'maintenance', 'happiness_bonus', 'trade_bonus', 'military_bonus',
+    'food_production', 'gold_per_turn', 'pop_capacity',
+)
+
+
 @dataclass
 class Building:
     """İnşa edilmiş bina"""
@@ -1790,8 +1797,15 @@ class ConstructionSystem:
         # İnşaat kuyruğu
         self.construction_queue: List[ConstructionQueue] = []
         
+        # Toplu değer önbelleği (bina tamamlanınca/yükseltilince/yıkılınca
+        # ya da modül kurulunca artımlı güncellenir)
+        self._contributions: Dict[BuildingType, Dict[str, int]] = {}
+        self._totals: Dict[str, int] = dict.fromkeys(AGGREGATE_KEYS, 0)
+        self._synergy_cache: Dict[BuildingType, float] = {}
+        
         # Başlangıç binaları
         self._initialize_starting_buildings()
+        self.rebuild_aggregate_cache()
     
     def _initialize_starting_buildings(self):
         """Başlangıç binalarını oluştur"""
@@ -1812,6 +1826,80 @@ class ConstructionSystem:
     def get_building(self, building_type: BuildingType):
         """Bina nesnesini döndür (yoksa None)"""
         return self.buildings.get(building_type, None)
+    
+    # ===== TOPLU DEĞER ÖNBELLEĞİ =====
+    
+    @staticmethod
+    def _building_contribution(building: Building) -> Dict[str, int]:
+        """Tek binanın toplu değerlere katkısı"""
+        stats = building.get_stats()
+        building_type = building.building_type
+        
+        pop_capacity = 0
+        if building_type == BuildingType.INN:
+            pop_capacity = building.level * 10000  # Han: +10,000/seviye
+        elif building_type in (BuildingType.HOSPITAL, BuildingType.WAREHOUSE, BuildingType.AQUEDUCT):
+            pop_capacity = building.get_unique_effect('pop_capacity')
+        
+        return {
+            'maintenance': stats.maintenance * building.level,
+            'happiness_bonus': building.get_effective_bonus('happiness_bonus'),
+            'trade_bonus': building.get_effective_bonus('trade_bonus'),
+            'military_bonus': building.get_effective_bonus('military_bonus'),
+            'food_production': building.get_effective_bonus('food_production'),
+            'gold_per_turn': (building.get_unique_effect('gold_per_turn')
+                              + building.get_unique_effect('gold_income')
+                              + building.get_unique_effect('gold_from_ore')),
+            'pop_capacity': pop_capacity,
+        }
+    
+    def refresh_building(self, building_type: BuildingType):
+        """
+        Tek binanın önbellek katkısını yenile (eski katkıyı çıkar, yenisini ekle).
+        Bina eklendiyse veya kaldırıldıysa sinerji önbelleği de sıfırlanır.
+        """
+        old = self._contributions.pop(building_type, None)
+        if old:
+            for key, value in old.items():
+                self._totals[key] -= value
+        
+        building = self.buildings.get(building_type)
+        if building:
+            new = self._building_contribution(building)
+            self._contributions[building_type] = new
+            for key, value in new.items():
+                self._totals[key] += value
+        
+        if (old is None) != (building is None):
+            self._synergy_cache.clear()
+    
+    def rebuild_aggregate_cache(self):
+        """
+        Önbelleği baştan kur.
+        buildings sözlüğü sistem metodları dışında değiştirildiyse çağrılmalı.
+        """
+        self._contributions = {}
+        self._totals = dict.fromkeys(AGGREGATE_KEYS, 0)
+        self._synergy_cache = {}
+        for building_type in self.buildings:
+            self.refresh_building(building_type)
+    
+    def install_module(self, building_type: BuildingType, module_id: str) -> bool:
+        """Binaya modül kur ve önbelleği güncelle"""
+        building = self.buildings.get(building_type)
+        if not building:
+            return False
+        building.install_module(module_id)
+        self.refresh_building(building_type)
+        return True
+    
+    def demolish_building(self, building_type: BuildingType) -> bool:
+        """Binayı yık ve önbelleği güncelle"""
+        if building_type not in self.buildings:
+            return False
+        del self.buildings[building_type]
+        self.refresh_building(building_type)
+        return True
         
     def get_defense_bonus(self) -> int:
         """Kuşatmalarda kale ve kulelerden gelen savunma/moral bonusu"""
@@ -1840,12 +1928,13 @@ class ConstructionSystem:
         Sinerji bonusu çarpanı (mevcut sinerji binalarına göre)
         Her mevcut sinerji binası +%15 bonus verir
         """
-        stats = BUILDING_DEFINITIONS[building_type]
-        if not stats.synergy_with:
-            return 1.0
+        cached = self._synergy_cache.get(building_type)
+        if cached is not None:
+            return cached
         
+        stats = BUILDING_DEFINITIONS[building_type]
         synergy_count = 0
-        for synergy_value in stats.synergy_with:
+        for synergy_value in stats.synergy_with or ():
             try:
                 synergy_type = BuildingType(synergy_value)
                 if synergy_type in self.buildings:
@@ -1853,7 +1942,9 @@ class ConstructionSystem:
             except ValueError:
                 continue
         
-        return 1.0 + (synergy_count * 0.15)
+        multiplier = 1.0 + (synergy_count * 0.15)
+        self._synergy_cache[building_type] = multiplier
+        return multiplier
     
     def get_synergy_info(self, building_type: BuildingType) -> List[tuple]:
         """
@@ -2045,6 +2136,7 @@ class ConstructionSystem:
             if item.is_upgrade:
                 if item.building_type in self.buildings:
                     self.buildings[item.building_type].level += 1
+                    self.refresh_building(item.building_type)
                     building = self.buildings[item.building_type]
                     level_name = building.get_level_name()
                     audio.play_ui_sound('complete')
@@ -2058,6 +2150,7 @@ class ConstructionSystem:
                         audio.announce(f"Sinerji bonusu: +%{bonus_pct}")
             else:
                 self.buildings[item.building_type] = Building(item.building_type, level=1)
+                self.refresh_building(item.building_type)
                 building = self.buildings[item.building_type]
                 level_name = building.get_level_name()
                 audio.play_ui_sound('complete')
@@ -2074,39 +2167,23 @@ class ConstructionSystem:
     
     def get_total_maintenance(self) -> int:
         """Toplam bina bakım maliyeti"""
-        total = 0
-        for building in self.buildings.values():
-            stats = building.get_stats()
-            total += stats.maintenance * building.level
-        return total
+        return self._totals['maintenance']
     
     def get_total_happiness_bonus(self) -> int:
         """Toplam mutluluk bonusu"""
-        total = 0
-        for building in self.buildings.values():
-            total += building.get_effective_bonus('happiness_bonus')
-        return total
+        return self._totals['happiness_bonus']
     
     def get_total_trade_bonus(self) -> int:
         """Toplam ticaret bonusu"""
-        total = 0
-        for building in self.buildings.values():
-            total += building.get_effective_bonus('trade_bonus')
-        return total
+        return self._totals['trade_bonus']
     
     def get_total_military_bonus(self) -> int:
         """Toplam askeri bonus"""
-        total = 0
-        for building in self.buildings.values():
-            total += building.get_effective_bonus('military_bonus')
-        return total
+        return self._totals['military_bonus']
     
     def get_food_production(self) -> int:
         """Toplam yiyecek üretimi"""
-        total = 0
-        for building in self.buildings.values():
-            total += building.get_effective_bonus('food_production')
-        return total
+        return self._totals['food_production']
     
     def get_wood_production(self) -> int:
         """Toplam kereste üretimi (Kereste Ocağından)"""
@@ -2160,34 +2237,12 @@ class ConstructionSystem:
     
     def get_population_capacity(self) -> int:
         """Maksimum nüfus kapasitesi (taşıma kapasitesi)"""
-        base_capacity = 50000  # Temel kapasite
-        
-        # Han bonusu: +10,000/seviye
-        if BuildingType.INN in self.buildings:
-            base_capacity += self.buildings[BuildingType.INN].level * 10000
-        
-        # Hastane bonusu (unique_effects)
-        if BuildingType.HOSPITAL in self.buildings:
-            base_capacity += self.buildings[BuildingType.HOSPITAL].get_unique_effect('pop_capacity')
-        
-        # Ambar bonusu (unique_effects)
-        if BuildingType.WAREHOUSE in self.buildings:
-            base_capacity += self.buildings[BuildingType.WAREHOUSE].get_unique_effect('pop_capacity')
-        
-        # Su Kemeri bonusu (unique_effects)
-        if BuildingType.AQUEDUCT in self.buildings:
-            base_capacity += self.buildings[BuildingType.AQUEDUCT].get_unique_effect('pop_capacity')
-        
-        return base_capacity
+        # Temel kapasite + Han (+10,000/seviye), Hastane, Ambar ve Su Kemeri bonusları
+        return 50000 + self._totals['pop_capacity']
     
     def get_gold_per_turn(self) -> int:
         """Binalardan gelen toplam tur başına altın geliri"""
-        total = 0
-        for building_type, building in self.buildings.items():
-            total += building.get_unique_effect('gold_per_turn')
-            total += building.get_unique_effect('gold_income')
-            total += building.get_unique_effect('gold_from_ore')
-        return total
+        return self._totals['gold_per_turn']
     
     def get_building_list(self) -> List[tuple]:
         """Bina listesi [(tip, isim, seviye), ...]"""
@@ -2265,6 +2320,7 @@ class ConstructionSystem:
                 system.buildings[bt] = building
             except ValueError:
                 continue  # Bilinmeyen bina tipi (eski kayıt uyumluluğu)
+        system.rebuild_aggregate_cache()
         
         system.construction_queue = []
         for item in data.get('construction_queue', []):
@@ -4,9 +4,11 @@ Osmanlı Eyalet Yönetim Simülasyonu - Diplomasi Sistemi
 """
 
 from dataclasses import dataclass
+import random
 from typing import Dict, List, Optional
 from enum import Enum
 from audio.audio_manager import get_audio_manager
+from game.rng import ensure_rng
 
 
 class RelationType(Enum):
@@ -158,7 +160,9 @@ for name, territory in TERRITORIES.items():
 class DiplomacySystem:
     """Diplomasi ve ilişkiler sistemi"""
     
-    def __init__(self):
+    def __init__(self, rng: Optional[random.Random] = None):
+        # Sefer akışı (GameManager verir; tek başına kurulumda bağımsız akış)
+        self.rng = ensure_rng(rng)
         # Padişah ilişkisi (en önemli!)
         self.sultan_loyalty = 90  # 0-100 (increased starting value)
         self.sultan_favor = 50    # 0-100 (lütuf)
@@ -196,8 +200,6 @@ class DiplomacySystem:
     
     def update_neighbors(self, province_name: str):
         """Eyalete göre komşuları güncelle"""
-        import random
-        
         self.neighbors.clear()
         neighbor_list = PROVINCE_NEIGHBORS.get(province_name, [
             ("Komşu Beylik", 20), ("Diğer Eyalet", 30)  # Varsayılan
@@ -207,7 +209,7 @@ class DiplomacySystem:
         personalities = list(AIPersonality)
         
         for name, value in neighbor_list:
-            personality = random.choice(personalities)
+            personality = self.rng.choice(personalities)
             self.neighbors[name] = Relation(name, value, RelationType.NEUTRAL, personality)
     
     def get_loyalty_description(self) -> str:
@@ -327,9 +329,8 @@ class DiplomacySystem:
         economy.spend(gold=cost)
         
         # Başarı şansı
-        import random
         success_chance = 50 + relation.value
-        success = random.randint(1, 100) <= success_chance
+        success = self.rng.randint(1, 100) <= success_chance
         
         audio = get_audio_manager()
         if success:
@@ -380,7 +381,6 @@ class DiplomacySystem:
             return False
         
         # Başarı şansı (ilişkiye göre)
-        import random
         success_chance = 40 + relation.value  # %40 + ilişki değeri
         
         # Kadın karakter evlilik bonusu (+%25)
@@ -391,7 +391,7 @@ class DiplomacySystem:
             is_female = player.gender.value == 'female'
         success_chance += int(marriage_bonus * 100)
         
-        success = random.randint(1, 100) <= success_chance
+        success = self.rng.randint(1, 100) <= success_chance
         
         economy.spend(gold=dowry_cost)
         
@@ -439,13 +439,12 @@ class DiplomacySystem:
         relation = self.neighbors[target]
         
         # Başarı şansı (güce ve ilişkiye göre)
-        import random
         power_bonus = min(30, (military_power - min_power) // 50)
         success_chance = 30 + power_bonus - (relation.value // 2)
-        success = random.randint(1, 100) <= max(10, success_chance)
+        success = self.rng.randint(1, 100) <= max(10, success_chance)
         
         if success:
-            tribute_amount = random.randint(500, 2000)
+            tribute_amount = self.rng.randint(500, 2000)
             relation.value -= 20  # İlişki bozulur
             relation.update_type()
             audio.announce_action_result(
@@ -479,21 +478,20 @@ class DiplomacySystem:
             
         economy.spend(gold=cost)
         
-        import random
         success_chance = 60
         relation = self.neighbors[target]
         
-        roll = random.randint(1, 100)
+        roll = self.rng.randint(1, 100)
         
         if roll <= success_chance:
             # Başarılı yıpratma/yağma
-            stolen_gold = random.randint(1000, 4000)
-            enemy_casualty = random.randint(300, 1000)
+            stolen_gold = self.rng.randint(1000, 4000)
+            enemy_casualty = self.rng.randint(300, 1000)
             
             economy.add_resources(gold=stolen_gold)
             
             # Yarı yarıya deşifre olma ihtimali
-            if random.random() < 0.5:
+            if self.rng.random() < 0.5:
                 relation.value -= 40
                 relation.update_type()
                 msg = f"Sınır akınları başarılı! {target} zayiat verdi, {stolen_gold} altın ganimet elde edildi. Ancak izimiz deşifre oldu, gerilim arttı."
@@ -643,7 +641,6 @@ class DiplomacySystem:
         
         relation = self.neighbors[target]
         
-        import random
         power_bonus = min(40, (military_power - min_power) // 100)
         success_chance = 20 + power_bonus
         
@@ -651,15 +648,15 @@ class DiplomacySystem:
         if relation.value > 30:
             success_chance += 20
         
-        success = random.randint(1, 100) <= success_chance
+        success = self.rng.randint(1, 100) <= success_chance
         
         if success:
-            tribute = random.randint(100, 500)  # Yıllık haraç
+            tribute = self.rng.randint(100, 500)  # Yıllık haraç
             self.vassals.append({
                 'name': target,
                 'tribute': tribute,
                 'loyalty': 50,
-                'military_support': random.randint(50, 150)
+                'military_support': self.rng.randint(50, 150)
             })
             relation.value = 50  # Vassal ilişkisi
             relation.update_type()
@@ -682,8 +679,6 @@ class DiplomacySystem:
     def check_enemy_invasions(self, player_military_power: int) -> tuple:
         """Her tur düşmanların saldırı niyetini kontrol et (AI İstilası)
         Dönüş: (SaldırdıMı, DüşmanAdı, DüşmanAskeriGüç)"""
-        import random
-        
         for name, relation in self.neighbors.items():
             if relation.value > -70:
                 continue
@@ -710,7 +705,7 @@ class DiplomacySystem:
                 self.invasion_cooldown -= 1
                 continue
                 
-            if random.randint(1, 100) <= final_chance:
+            if self.rng.randint(1, 100) <= final_chance:
                 # Saldırdıktan sonra bir miktar barış payı bırak, 10 tur cooldown ver
                 self.invasion_cooldown = 10
                 relation.value = -30  # Savaş sonrası 'soğuk barış'
@@ -726,7 +721,6 @@ class DiplomacySystem:
     def process_turn(self) -> List[str]:
         """Tur sonunda diplomasiyi güncelle"""
         audio = get_audio_manager()
-        import random
         messages = []
         
         # Elçi bekleme süresini azalt
@@ -742,7 +736,7 @@ class DiplomacySystem:
             self.tribute_income += daily_tribute
             
             # Vassal sadakati zamanla azalabilir
-            if random.random() < 0.1:  # %10 şans
+            if self.rng.random() < 0.1:  # %10 şans
                 vassal['loyalty'] = max(0, vassal['loyalty'] - 1)
                 
                 if vassal['loyalty'] <= 0:
@@ -778,11 +772,11 @@ class DiplomacySystem:
         elif self.sultan_loyalty < 30:
             decay_chance = 0.25 # Padişah gözden düşene daha acımasızdır (%25 ihtimal)
             
-        if random.random() < decay_chance:
+        if self.rng.random() < decay_chance:
             self.sultan_loyalty = max(0, self.sultan_loyalty - 1)
         
         # Lütuf daha yavaş azalır
-        if self.sultan_favor > 30 and random.random() < 0.5:
+        if self.sultan_favor > 30 and self.rng.random() < 0.5:
             self.sultan_favor -= 1
         
         # Düşük sadakat uyarısı
@@ -801,14 +795,13 @@ class DiplomacySystem:
         
         # Padişah görevi oluşturma şansı
         if not self.active_missions and self.sultan_loyalty > 20:
-            if random.random() < 0.2:  # %20 şans
+            if self.rng.random() < 0.2:  # %20 şans
                 self._create_random_mission()
                 
         return messages
 
     def _create_random_mission(self):
         """Rastgele padişah görevi oluştur"""
-        import random
         missions = [
             {
                 'type': 'tribute',
@@ -836,7 +829,7 @@ class DiplomacySystem:
             }
         ]
         
-        mission = random.choice(missions)
+        mission = self.rng.choice(missions)
         self.active_missions.append(mission)
         
         audio = get_audio_manager()
@@ -929,9 +922,9 @@ class DiplomacySystem:
         }
     
     @classmethod
-    def from_dict(cls, data: Dict) -> 'DiplomacySystem':
+    def from_dict(cls, data: Dict, rng: Optional[random.Random] = None) -> 'DiplomacySystem':
         """Dictionary'den yükle"""
-        system = cls()
+        system = cls(rng=rng)
         system.sultan_loyalty = data.get('sultan_loyalty', 90)
         system.sultan_favor = data.get('sultan_favor', 50)
         system.sadrazam_relation = data.get('sadrazam_relation', 65)
@@ -1065,7 +1058,6 @@ class DiplomacySystem:
     
     def process_event_chains(self) -> List[str]:
         """Olay zincirlerini işle (her turda çağrılır) ve mesajları döndür"""
-        import random
         audio = get_audio_manager()
         messages = []
         
@@ -1082,7 +1074,7 @@ class DiplomacySystem:
                 if stage == 0:  # Elçi gönderildi, cevap bekleniyor
                     if chain['turns_in_stage'] >= 3:
                         # Cevap geldi
-                        if random.random() < 0.7:  # %70 olumlu cevap
+                        if self.rng.random() < 0.7:  # %70 olumlu cevap
                             msg = f"{target}'den elçi geldi: Evlilik teklifiniz değerlendiriliyor."
                             audio.speak(msg, interrupt=False)
                             messages.append(msg)
@@ -1135,7 +1127,7 @@ class DiplomacySystem:
                         power = chain['data'].get('military_power', 0)
                         chance = 30 + (power - 1000) // 100
                         
-                        if random.randint(1, 100) <= chance:
+                        if self.rng.randint(1, 100) <= chance:
                             msg = f"{target} boyun eğmeyi kabul etti! Şartlar görüşülecek."
                             audio.speak(msg, interrupt=False)
                             messages.append(msg)
@@ -1180,7 +1172,7 @@ class DiplomacySystem:
             elif chain_type == 'peace':
                 if stage == 0:  # Barış teklifi gönderildi
                     if chain['turns_in_stage'] >= 4:
-                        if random.random() < 0.6:
+                        if self.rng.random() < 0.6:
                             msg = f"{target} barış anlaşmasını kabul etti!"
                             audio.speak(msg, interrupt=False)
                             messages.append(msg)
@@ -13,9 +13,10 @@ Her türlü devlet işi müzakere edilir, karar verilir."
 """
 
 from dataclasses import dataclass, field
+import random
 from typing import Dict, List, Optional
 from enum import Enum
-import random
+from game.rng import ensure_rng
 from audio.audio_manager import get_audio_manager
 
 
@@ -109,7 +110,7 @@ class DivanAdvisor:
         )
 
 
-def _generate_advisor_name(role: AdvisorRole) -> str:
+def _generate_advisor_name(role: AdvisorRole, rng: random.Random) -> str:
     """Dönemin Osmanlı danışman ismi üret"""
     first_names = [
         "Mehmed", "Ahmed", "Mustafa", "Ali", "Süleyman", "İbrahim",
@@ -125,7 +126,7 @@ def _generate_advisor_name(role: AdvisorRole) -> str:
     else:
         suffixes = ["Efendi", "Çelebi"]
     
-    return f"{random.choice(first_names)} {random.choice(suffixes)}"
+    return f"{rng.choice(first_names)} {rng.choice(suffixes)}"
 
 
 class DivanSystem:
@@ -138,15 +139,17 @@ class DivanSystem:
     
     MAX_REPORT_HISTORY = 50  # Maksimum rapor geçmişi
     
-    def __init__(self):
+    def __init__(self, rng: Optional[random.Random] = None):
+        # Sefer akışı (GameManager verir; tek başına kurulumda bağımsız akış)
+        self.rng = ensure_rng(rng)
         # 4 danışman NPC
         self.advisors: Dict[AdvisorRole, DivanAdvisor] = {}
         for role in AdvisorRole:
             self.advisors[role] = DivanAdvisor(
                 role=role,
-                name=_generate_advisor_name(role),
-                skill=random.randint(5, 8),
-                loyalty=random.randint(65, 85)
+                name=_generate_advisor_name(role, self.rng),
+                skill=self.rng.randint(5, 8),
+                loyalty=self.rng.randint(65, 85)
             )
         
         # Rapor geçmişi
@@ -245,7 +248,7 @@ class DivanSystem:
         Skill 1  → %40 başarı, Skill 10 → %100 başarı
         """
         chance = 0.4 + (advisor.skill * 0.06)  # 5 skill = %70, 8 skill = %88
-        return random.random() < chance
+        return self.rng.random() < chance
     
     def _loyalty_tamper(self, advisor: DivanAdvisor, report: DivanReport) -> DivanReport:
         """
@@ -257,7 +260,7 @@ class DivanSystem:
         
         # Sadakat 0-60 arasında → manipulasyon şansı
         tamper_chance = (60 - advisor.loyalty) / 100  # loyalty 30 → %30
-        if random.random() < tamper_chance:
+        if self.rng.random() < tamper_chance:
             # Acil raporu uyarıya düşür veya tamamen sakla
             if report.severity == ReportSeverity.ACIL:
                 report.severity = ReportSeverity.UYARI
@@ -606,9 +609,9 @@ class DivanSystem:
         }
     
     @classmethod
-    def from_dict(cls, data: Dict) -> 'DivanSystem':
+    def from_dict(cls, data: Dict, rng: Optional[random.Random] = None) -> 'DivanSystem':
         """Dictionary'den yükle"""
-        system = cls()
+        system = cls(rng=rng)
         
         # Danışmanları yükle
         for role_val, adv_data in data.get('advisors', {}).items():
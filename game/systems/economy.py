@@ -4,8 +4,9 @@ Osmanlı Eyalet Yönetim Simülasyonu - Ekonomi Sistemi
 """
 
 from dataclasses import dataclass, field
-from typing import Dict
 import random
+from typing import Dict, Optional
+from game.rng import ensure_rng
 from audio.audio_manager import get_audio_manager
 
 
@@ -239,7 +240,9 @@ class EconomySystem:
         'indian_ocean': {'name': 'Hint Okyanusu', 'bonus': 0.30, 'goods': ['spice']}
     }
     
-    def __init__(self):
+    def __init__(self, rng: Optional[random.Random] = None):
+        # Sefer akışı (GameManager verir; tek başına kurulumda bağımsız akış)
+        self.rng = ensure_rng(rng)
         self.resources = Resources()
         self.income = Income()
         self.expense = Expense()
@@ -460,15 +463,15 @@ class EconomySystem:
         }
         
         # Gizli gelir kaynağı keşfi (%30 ihtimal)
-        if random.random() < 0.30:
+        if self.rng.random() < 0.30:
             discoveries = [
-                ("Kayıt dışı tarım arazileri tespit edildi", 'food', random.randint(500, 1500)),
-                ("Vergi kaçıran tüccarlar bulundu", 'gold', random.randint(300, 800)),
-                ("Beyan edilmemiş demir madeni keşfedildi", 'iron', random.randint(200, 600)),
-                ("Gizli kereste deposu ortaya çıktı", 'wood', random.randint(300, 700)),
-                ("Kayıtsız zanaatkar dükkânları tespit edildi", 'gold', random.randint(200, 500)),
+                ("Kayıt dışı tarım arazileri tespit edildi", 'food', self.rng.randint(500, 1500)),
+                ("Vergi kaçıran tüccarlar bulundu", 'gold', self.rng.randint(300, 800)),
+                ("Beyan edilmemiş demir madeni keşfedildi", 'iron', self.rng.randint(200, 600)),
+                ("Gizli kereste deposu ortaya çıktı", 'wood', self.rng.randint(300, 700)),
+                ("Kayıtsız zanaatkar dükkânları tespit edildi", 'gold', self.rng.randint(200, 500)),
             ]
-            disc_text, resource_type, amount = random.choice(discoveries)
+            disc_text, resource_type, amount = self.rng.choice(discoveries)
             result['discovery'] = disc_text
             
             if resource_type == 'gold':
@@ -602,9 +605,9 @@ class EconomySystem:
         }
     
     @classmethod
-    def from_dict(cls, data: Dict) -> 'EconomySystem':
+    def from_dict(cls, data: Dict, rng: Optional[random.Random] = None) -> 'EconomySystem':
         """Dictionary'den yükle"""
-        system = cls()
+        system = cls(rng=rng)
         system.resources = Resources.from_dict(data['resources'])
         system.tax_rate = data['tax_rate']
         system.trade_level = data['trade_level']
@@ -10,9 +10,10 @@ Osmanlı istihbarat sistemi:
 """
 
 from dataclasses import dataclass, field
+import random
 from typing import Dict, List, Optional
 from enum import Enum
-import random
+from game.rng import ensure_rng
 from audio.audio_manager import get_audio_manager
 
 
@@ -217,7 +218,9 @@ class Mission:
 class EspionageSystem:
     """Casusluk yönetim sistemi (1520 dönemi)"""
     
-    def __init__(self):
+    def __init__(self, rng: Optional[random.Random] = None):
+        # Sefer akışı (GameManager verir; tek başına kurulumda bağımsız akış)
+        self.rng = ensure_rng(rng)
         # Aktif casuslar
         self.spies: List[Spy] = []
         self.spy_counter = 0
@@ -265,7 +268,7 @@ class EspionageSystem:
             spy_id=f"spy_{self.spy_counter}",
             spy_type=spy_type,
             name=self._generate_spy_name(spy_type),
-            skill=stats.skill + random.randint(-1, 2),
+            skill=stats.skill + self.rng.randint(-1, 2),
         )
         
         self.spies.append(spy)
@@ -306,7 +309,7 @@ class EspionageSystem:
                 "Mahmud", "Süleyman", "İbrahim", "Osman", "Kasım"
             ]
             titles = ["Ağa", "Efendi", "Bey", "Çelebi", ""]
-        return f"{random.choice(first_names)} {random.choice(titles)}".strip()
+        return f"{self.rng.choice(first_names)} {self.rng.choice(titles)}".strip()
     
     def start_mission(self, spy_id: str, operation: OperationType, 
                       target: str, economy, player=None) -> Optional[Mission]:
@@ -392,7 +395,7 @@ class EspionageSystem:
             
             if mission.turns_remaining <= 0:
                 # Görev tamamlandı, sonucu belirle
-                success = random.random() * 100 < mission.success_chance
+                success = self.rng.random() * 100 < mission.success_chance
                 
                 # Casusu bul
                 spy = next((s for s in self.spies if s.spy_id == mission.spy_id), None)
@@ -419,7 +422,7 @@ class EspionageSystem:
                 else:
                     # Başarısız - yakalanma riski
                     capture_chance = op_stats.risk * 0.5
-                    if random.random() < capture_chance:
+                    if self.rng.random() < capture_chance:
                         # Yakalandı
                         spy.status = "captured"
                         self.spies_lost += 1
@@ -487,14 +490,14 @@ class EspionageSystem:
         detected = 0
         
         # Simüle edilen düşman casusu
-        if random.random() < detection_chance:
+        if self.rng.random() < detection_chance:
             detected += 1
             self.known_enemy_spies += 1
             self.security_level = min(100, self.security_level + 5)
             
             # Rastgele düşman kaynağı
             enemies = ['Safevi', 'Venedik', 'Macar', 'Şövalye']
-            source = random.choice(enemies)
+            source = self.rng.choice(enemies)
             
             audio.speak(
                 f"Karşı istihbarat başarılı! {source} casusu yakalandı! "
@@ -532,7 +535,7 @@ class EspionageSystem:
         economy.spend(gold=ransom_cost)
         
         # %60 başarı şansı
-        if random.random() < 0.6:
+        if self.rng.random() < 0.6:
             spy.status = "idle"
             spy.location = "home"
             audio.speak(f"{spy.name} kurtarıldı ve geri döndü!", interrupt=True)
@@ -593,9 +596,9 @@ class EspionageSystem:
         }
     
     @classmethod
-    def from_dict(cls, data: Dict) -> 'EspionageSystem':
+    def from_dict(cls, data: Dict, rng: Optional[random.Random] = None) -> 'EspionageSystem':
         """Dictionary'den yükle"""
-        system = cls()
+        system = cls(rng=rng)
         
         for s_data in data.get('spies', []):
             spy = Spy(
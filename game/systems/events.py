@@ -3,9 +3,11 @@
 Osmanlı Eyalet Yönetim Simülasyonu - Olay Sistemi
 """
 
-import random
+from bisect import bisect_right
+from game.rng import ensure_rng
 from dataclasses import dataclass
-from typing import Dict, List, Callable, Optional
+import random
+from typing import Dict, List, Callable, Optional, Tuple
 from enum import Enum
 from audio.audio_manager import get_audio_manager
 
@@ -1580,10 +1582,79 @@ except ImportError:
     pass  # events_expanded.py henüz yok
 
 
+class EventIndex:
+    """
+    Olay havuzu dizini.
+    id -> Event haritası ve (olay türü, yıl dönemi) kovaları tutar; her tur
+    yalnızca o yıl ateşlenebilecek olaylar değerlendirilir. Yıl dönemleri,
+    olayların min_year / max_year sınırlarıyla ayrılan aralıklardır; bir
+    dönem içindeki her yılda aynı olaylar geçerlidir.
+    Kovalar havuz sırasını korur (aynı tohum aynı olayı seçer).
+    """
+    
+    def __init__(self, pool: List[Event]):
+        self.pool = pool
+        self._indexed_count = -1
+        self.by_id: Dict[str, Event] = {}
+        self.by_type: Dict[EventType, List[Event]] = {}
+        self._boundaries: List[int] = []
+        self._buckets: Dict[Tuple[EventType, int], List[Event]] = {}
+        self.rebuild()
+    
+    def rebuild(self):
+        """Dizini havuzdan yeniden kur"""
+        self.by_id = {}
+        self.by_type = {event_type: [] for event_type in EventType}
+        boundaries = set()
+        for event in self.pool:
+            self.by_id.setdefault(event.id, event)  # İlk tanım geçerli
+            self.by_type[event.event_type].append(event)
+            boundaries.add(event.min_year)
+            boundaries.add(event.max_year + 1)
+        self._boundaries = sorted(boundaries)
+        self._buckets = {}
+        self._indexed_count = len(self.pool)
+    
+    def _ensure_current(self):
+        """Havuz sonradan genişletildiyse dizini tazele"""
+        if self._indexed_count != len(self.pool):
+            self.rebuild()
+    
+    def get(self, event_id: str) -> Optional[Event]:
+        """ID ile olay bul"""
+        self._ensure_current()
+        return self.by_id.get(event_id)
+    
+    def candidates(self, event_type: EventType, year: int) -> List[Event]:
+        """Verilen yılda geçerli olan bu türdeki olaylar (önbellekli kova)"""
+        self._ensure_current()
+        epoch = bisect_right(self._boundaries, year)
+        key = (event_type, epoch)
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = [
+                e for e in self.by_type.get(event_type, [])
+                if e.min_year <= year <= e.max_year
+            ]
+            self._buckets[key] = bucket
+        return bucket
+
+
+# Global olay dizini
+EVENT_INDEX = EventIndex(EVENT_POOL)
+
+
+def get_event_by_id(event_id: str) -> Optional[Event]:
+    """ID ile olay bul (EVENT_POOL üzerinde)"""
+    return EVENT_INDEX.get(event_id)
+
+
 class EventSystem:
     """Olay yönetim sistemi"""
     
-    def __init__(self):
+    def __init__(self, rng: Optional[random.Random] = None):
+        # Sefer akışı (GameManager verir; tek başına kurulumda bağımsız akış)
+        self.rng = ensure_rng(rng)
         self.current_event: Optional[Event] = None
         self.current_stage: Optional[str] = None  # Çok aşamalı olaylar için
         self.event_history: List[str] = []
@@ -1641,7 +1712,7 @@ class EventSystem:
         if game_state.get('at_war', False):
             self.event_weights[EventType.MILITARY] = 35
         
-        if random.randint(1, 100) > base_chance:
+        if self.rng.randint(1, 100) > base_chance:
             return None
         
         # Olay türü seç
@@ -1653,12 +1724,12 @@ class EventSystem:
         current_turn = game_state.get('turn_count', 0)
         self.player_title = game_state.get('player_title', None)
         
+        # Yalnızca bu tür ve yıl için geçerli kova değerlendirilir
+        recent_events = set(self.event_history[-5:])
         candidates = [
-            e for e in EVENT_POOL 
-            if e.event_type == event_type
-            and e.min_year <= year <= e.max_year
-            and e.min_turn <= current_turn  # Minimum tur kontrolü
-            and e.id not in self.event_history[-5:]  # Son 5 olayda tekrar yok
+            e for e in EVENT_INDEX.candidates(event_type, year)
+            if e.min_turn <= current_turn  # Minimum tur kontrolü
+            and e.id not in recent_events  # Son 5 olayda tekrar yok
             and self._check_memory_requirements(e)  # Hafıza koşulları
             and (e.gender_filter is None or e.gender_filter == player_gender)  # Cinsiyet filtresi
         ]
@@ -1666,7 +1737,7 @@ class EventSystem:
         if not candidates:
             return None
         
-        event = random.choice(candidates)
+        event = self.rng.choice(candidates)
         self.current_event = event
         self.events_this_year += 1
         
@@ -1685,9 +1756,9 @@ class EventSystem:
                     self.event_memory.update(trigger.memory_updates)
                 
                 # Olayı bul ve döndür
-                for event in EVENT_POOL:
-                    if event.id == trigger.event_id:
-                        return event
+                event = get_event_by_id(trigger.event_id)
+                if event:
+                    return event
         return None
     
     def _check_memory_requirements(self, event: Event) -> bool:
@@ -1716,7 +1787,7 @@ class EventSystem:
     def _weighted_random_type(self) -> EventType:
         """Ağırlıklı rastgele olay türü seç"""
         total = sum(self.event_weights.values())
-        r = random.randint(1, total)
+        r = self.rng.randint(1, total)
         
         cumulative = 0
         for event_type, weight in self.event_weights.items():
@@ -2008,9 +2079,9 @@ class EventSystem:
         }
     
     @classmethod
-    def from_dict(cls, data: Dict) -> 'EventSystem':
+    def from_dict(cls, data: Dict, rng: Optional[random.Random] = None) -> 'EventSystem':
         """Dictionary'den yükle"""
-        system = cls()
+        system = cls(rng=rng)
         system.event_history = data.get('event_history', [])
         system.events_this_year = data.get('events_this_year', 0)
         
@@ -2031,9 +2102,6 @@ class EventSystem:
         # Aktif olayı geri yükle
         current_id = data.get('current_event_id')
         if current_id:
-            for event in EVENT_POOL:
-                if event.id == current_id:
-                    system.current_event = event
-                    break
+            system.current_event = get_event_by_id(current_id)
         
         return system
@@ -13,8 +13,9 @@ Hiyerarşi: Şeyh → Kethüda → Yiğitbaşı → Ehli Hibre → Usta → Kalf
 
 from enum import Enum
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional
 import random
+from typing import Dict, List, Optional
+from game.rng import ensure_rng
 
 
 # ═══════════════════════════════════════════
@@ -173,7 +174,9 @@ class GuildSystem:
     - Terfi: Çırak→Kalfa→Usta (icazet sistemi)
     """
     
-    def __init__(self):
+    def __init__(self, rng: Optional[random.Random] = None):
+        # Sefer akışı (GameManager verir; tek başına kurulumda bağımsız akış)
+        self.rng = ensure_rng(rng)
         self.guilds: Dict[str, Guild] = {}
         self.muhtesip_active = True  # Muhtesip (narh denetçisi) aktif mi
         self.narh_strictness = 50    # Narh katılığı 0-100
@@ -209,7 +212,7 @@ class GuildSystem:
         
         # Narh uyum kontrolü
         compliance = guild.narh_compliance
-        violation = random.randint(0, 100) > compliance
+        violation = self.rng.randint(0, 100) > compliance
         
         result = {
             "guild": guild.name_tr,
@@ -219,7 +222,7 @@ class GuildSystem:
         
         if violation:
             # Ceza: üretim düşer, moral düşer
-            severity = random.choice(["minor", "major", "critical"])
+            severity = self.rng.choice(["minor", "major", "critical"])
             penalties = {
                 "minor": {"morale": -5, "gold_fine": 100},
                 "major": {"morale": -15, "gold_fine": 500, "production": -10},
@@ -260,7 +263,7 @@ class GuildSystem:
             total_tax += tax
             
             # Rastgele olay kontrolü
-            if random.random() < 0.15:
+            if self.rng.random() < 0.15:
                 event = self._random_guild_event(guild)
                 events.append(event)
             
@@ -322,7 +325,7 @@ class GuildSystem:
             {"type": "raw_material_shortage", "effect": {"production": -10},
              "message": f"{guild.name_tr}: hammadde sıkıntısı!"},
         ]
-        event = random.choice(events)
+        event = self.rng.choice(events)
         
         # Etkileri uygula
         effect = event.get("effect", {})
@@ -345,7 +348,7 @@ class GuildSystem:
             "Kasım", "Mahmud", "Abdülkerim", "Haydar", "Cafer"
         ]
         surnames = ["Efendi", "Ağa", "Çelebi"]
-        return f"{title} {random.choice(names)} {random.choice(surnames)}"
+        return f"{title} {self.rng.choice(names)} {self.rng.choice(surnames)}"
     
     def to_dict(self) -> Dict:
         """Kaydetmek için dict'e çevir"""
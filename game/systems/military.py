@@ -5,9 +5,11 @@ Osmanlı Eyalet Yönetim Simülasyonu - Askeri Sistem
 """
 
 from dataclasses import dataclass, field
+import random
 from typing import Dict, List, Optional
 from enum import Enum
 from audio.audio_manager import get_audio_manager
+from game.rng import ensure_rng
 
 
 class CommanderTrait(Enum):
@@ -292,7 +294,9 @@ class TrainingQueue:
 class MilitarySystem:
     """Askeri yönetim sistemi (1520 dönemi)"""
     
-    def __init__(self):
+    def __init__(self, rng: Optional[random.Random] = None):
+        # Sefer akışı (GameManager verir; tek başına kurulumda bağımsız akış)
+        self.rng = ensure_rng(rng)
         # Mevcut birlikler - 1520 başlangıç değerleri
         self.units: Dict[UnitType, int] = {
             # Kapıkulu Ordusu
@@ -341,9 +345,6 @@ class MilitarySystem:
         self._generate_initial_commanders()
     
     def _generate_initial_commanders(self):
-        import uuid
-        import random
-        
         # Eyalet komutanları (Sancakbeyi, Alaybeyi, Subaşı gibi jenerik ama döneme uygun isimler)
         names = [
             "Mustafa Bey", "Kasım Ağa", "Hızır Bey", "İskender Paşa", 
@@ -354,9 +355,9 @@ class MilitarySystem:
         
         for _ in range(2):
             self.commanders.append(Commander(
-                id=str(uuid.uuid4())[:8],
-                name=random.choice(names),
-                trait=random.choice(traits)
+                id=f"{self.rng.getrandbits(32):08x}",  # Sefer tohumundan (tekrarlanabilir)
+                name=self.rng.choice(names),
+                trait=self.rng.choice(traits)
             ))
     
     def get_total_soldiers(self) -> int:
@@ -679,9 +680,9 @@ class MilitarySystem:
         }
     
     @classmethod
-    def from_dict(cls, data: Dict) -> 'MilitarySystem':
+    def from_dict(cls, data: Dict, rng: Optional[random.Random] = None) -> 'MilitarySystem':
         """Dictionary'den yükle"""
-        system = cls()
+        system = cls(rng=rng)
         
         # Birimleri yükle (eski save uyumluluğu için try-except)
         try:
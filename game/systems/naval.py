@@ -5,9 +5,11 @@ Gemi inşası, deniz ticareti ve deniz savaşları
 """
 
 from dataclasses import dataclass, field
+import random
 from typing import Dict, List, Optional
 from enum import Enum
 from audio.audio_manager import get_audio_manager
+from game.rng import ensure_rng
 
 
 class ShipType(Enum):
@@ -216,7 +218,9 @@ class ShipRepair:
 class NavalSystem:
     """Deniz kuvvetleri yönetim sistemi"""
     
-    def __init__(self):
+    def __init__(self, rng: Optional[random.Random] = None):
+        # Sefer akışı (GameManager verir; tek başına kurulumda bağımsız akış)
+        self.rng = ensure_rng(rng)
         self.ships: List[Ship] = []
         self.construction_queue: List[ShipConstruction] = []
         self.repair_queue: List[ShipRepair] = []
@@ -485,9 +489,9 @@ class NavalSystem:
         }
     
     @classmethod
-    def from_dict(cls, data: Dict) -> 'NavalSystem':
+    def from_dict(cls, data: Dict, rng: Optional[random.Random] = None) -> 'NavalSystem':
         """Dictionary'den yükle"""
-        system = cls()
+        system = cls(rng=rng)
         
         for ship_data in data.get("ships", []):
             ship = Ship(
@@ -530,8 +534,6 @@ class NavalSystem:
         Deniz akını düzenle
         difficulty: 'easy' (Ticaret Rotası), 'medium' (Sahil Kasabası), 'hard' (Liman Kalesi)
         """
-        import random
-        
         # Savaş gemilerini seç
         warships = [s for s in self.ships if s.get_definition().is_warship and s.health > 50]
         if not warships:
@@ -546,23 +548,23 @@ class NavalSystem:
         }
         
         target = targets.get(difficulty, targets['easy'])
-        enemy_power = target['power'] * random.uniform(0.8, 1.2)
+        enemy_power = target['power'] * self.rng.uniform(0.8, 1.2)
         
         # Savaş sonucu
         success_chance = fleet_power / (fleet_power + enemy_power)
-        roll = random.random()
+        roll = self.rng.random()
         
         result = {'success': False, 'gold': 0, 'message': "", 'ships_lost': []}
         
         if roll < success_chance:
             # Zafer
             result['success'] = True
-            result['gold'] = random.randint(*target['gold'])
+            result['gold'] = self.rng.randint(*target['gold'])
             self.naval_victories += 1
             
             # Gemi deneyimi
             for ship in warships:
-                ship.experience += random.randint(5, 15)
+                ship.experience += self.rng.randint(5, 15)
                 
             result['message'] = f"ZAFER! {target['name']} yağmalandı. {result['gold']} altın kazanıldı."
         else:
@@ -571,14 +573,14 @@ class NavalSystem:
             result['message'] = f"YENİLGİ! {target['name']} savunması yarılamadı."
         
         # Hasar hesaplama (her durumda hasar alınabilir)
-        damage_roll = random.randint(*target['damage'])
+        damage_roll = self.rng.randint(*target['damage'])
         if not result['success']:
             damage_roll *= 1.5  # Yenilgide daha çok hasar
             
         loss_text = []
         for ship in warships:
             # Her gemiye hasar
-            dmg = int(damage_roll * random.uniform(0.5, 1.5))
+            dmg = int(damage_roll * self.rng.uniform(0.5, 1.5))
             ship.health -= dmg
             
             if ship.health <= 0:
@@ -11,9 +11,10 @@ Osmanlı dini yapısı:
 """
 
 from dataclasses import dataclass, field
+import random
 from typing import Dict, List, Optional
 from enum import Enum
-import random
+from game.rng import ensure_rng
 from audio.audio_manager import get_audio_manager
 
 
@@ -294,7 +295,9 @@ class Ulema:
 class ReligionSystem:
     """Din ve Kültür yönetim sistemi (1520 dönemi)"""
     
-    def __init__(self):
+    def __init__(self, rng: Optional[random.Random] = None):
+        # Sefer akışı (GameManager verir; tek başına kurulumda bağımsız akış)
+        self.rng = ensure_rng(rng)
         # Millet durumları
         self.millet_states: Dict[Millet, Dict] = {}
         for millet in Millet:
@@ -364,8 +367,8 @@ class ReligionSystem:
             ulema_id=f"ulema_{self.ulema_counter}",
             rank=rank,
             name=self._generate_ulema_name(rank),
-            skill=random.randint(4, 8),
-            loyalty=random.randint(60, 90)
+            skill=self.rng.randint(4, 8),
+            loyalty=self.rng.randint(60, 90)
         )
         
         self.ulema.append(ulema)
@@ -388,22 +391,22 @@ class ReligionSystem:
         
         if rank == UlemaRank.SEYHULISLAM:
             # 1520-1566 dönemi gerçek şeyhülislamları
-            return random.choice([
+            return self.rng.choice([
                 "Zenbilli Ali Efendi", "Kemalpaşazade", "İbn-i Kemal",
                 "Ebussuud Efendi", "Çivizade Muhyiddin", "Fenari Muhyiddin"
             ])
         elif rank == UlemaRank.KADIASKER:
             current_kadiaskers = [u.name for u in self.ulema if u.rank == UlemaRank.KADIASKER]
             if "Rumeli Kadıaskeri" not in [n.split(' - ')[0] for n in current_kadiaskers]:
-                return f"Rumeli Kadıaskeri - {random.choice(scholar_names)} Efendi"
+                return f"Rumeli Kadıaskeri - {self.rng.choice(scholar_names)} Efendi"
             else:
-                return f"Anadolu Kadıaskeri - {random.choice(scholar_names)} Efendi"
+                return f"Anadolu Kadıaskeri - {self.rng.choice(scholar_names)} Efendi"
         elif rank == UlemaRank.MUDERRIS:
             # Müderrisler — dönemin medrese hocaları
             surnames = ["Efendi", "Molla", "Hoca"]
-            return f"{random.choice(surnames)} {random.choice(scholar_names)}"
+            return f"{self.rng.choice(surnames)} {self.rng.choice(scholar_names)}"
         else:
-            return f"{random.choice(scholar_names)} Efendi"
+            return f"{self.rng.choice(scholar_names)} Efendi"
     
     def build_vakif(self, vakif_type: VakifType, economy, population: int, 
                     custom_name: str = None) -> Optional[Vakif]:
@@ -613,7 +616,7 @@ class ReligionSystem:
         
         # Kızılbaş tehdidi
         if self.kizilbas_threat > 50 and not self.kizilbas_suppressed:
-            if random.random() < 0.1:
+            if self.rng.random() < 0.1:
                 results['events'].append("Kızılbaş ayaklanması riski!")
                 self.millet_states[Millet.MUSLIM]['unrest'] += 10
         
@@ -767,9 +770,9 @@ class ReligionSystem:
         }
     
     @classmethod
-    def from_dict(cls, data: Dict) -> 'ReligionSystem':
+    def from_dict(cls, data: Dict, rng: Optional[random.Random] = None) -> 'ReligionSystem':
         """Dictionary'den yükle"""
-        system = cls()
+        system = cls(rng=rng)
         
         # Millet durumları
         for millet_value, state in data.get('millet_states', {}).items():
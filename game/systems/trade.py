@@ -5,9 +5,10 @@ Ticaret yolları, kervanlar ve liman mekanikleri
 """
 
 from dataclasses import dataclass
+import random
 from typing import Dict, List, Optional
 from enum import Enum
-import random
+from game.rng import ensure_rng
 from audio.audio_manager import get_audio_manager
 
 
@@ -171,7 +172,9 @@ DEFAULT_ROUTES = [
 class TradeSystem:
     """Ticaret yönetim sistemi"""
     
-    def __init__(self):
+    def __init__(self, rng: Optional[random.Random] = None):
+        # Sefer akışı (GameManager verir; tek başına kurulumda bağımsız akış)
+        self.rng = ensure_rng(rng)
         self.routes: Dict[str, TradeRoute] = {r.route_id: r for r in DEFAULT_ROUTES}
         self.active_caravans: List[Caravan] = []
         self.trade_agreements: Dict[str, int] = {}  # partner: bonus %
@@ -409,9 +412,9 @@ class TradeSystem:
             
             # Yolda risk kontrolü
             if caravan.status == CaravanStatus.TRAVELING:
-                if random.random() < caravan.route.risk_factor * 0.1:
+                if self.rng.random() < caravan.route.risk_factor * 0.1:
                     # Tehlike!
-                    if random.random() > caravan.get_success_chance():
+                    if self.rng.random() > caravan.get_success_chance():
                         caravan.status = CaravanStatus.LOST
                         lost.append(caravan)
                         results['events'].append(f"{caravan.route.name} kervanı kayboldu!")
@@ -562,9 +565,9 @@ class TradeSystem:
         }
     
     @classmethod
-    def from_dict(cls, data: Dict) -> 'TradeSystem':
+    def from_dict(cls, data: Dict, rng: Optional[random.Random] = None) -> 'TradeSystem':
         """Dictionary'den yükle"""
-        system = cls()
+        system = cls(rng=rng)
         system.trade_agreements = data.get('trade_agreements', {})
         system.total_trade_income = data.get('total_trade_income', 0)
         system.caravans_lost = data.get('caravans_lost', 0)
@@ -6,10 +6,11 @@ Akın, kuşatma, savunma ve sefer mekanikleri
 """
 
 from dataclasses import dataclass, field
+import random
 from typing import Dict, List, Optional, Tuple
 from enum import Enum
 from enum import Enum
-import random
+from game.rng import ensure_rng
 from audio.audio_manager import get_audio_manager
 from game.systems.military import Commander, CommanderTrait
 
@@ -421,8 +422,9 @@ class SiegeState:
         }
         return names.get(self.phase, "Bilinmeyen")
     
-    def process_turn(self, attacker_artillery: int, has_supply_line: bool = True) -> Dict:
-        """Kuşatma turunu işle"""
+    def process_turn(self, rng: random.Random, attacker_artillery: int,
+                     has_supply_line: bool = True) -> Dict:
+        """Kuşatma turunu işle (rng: sefer akışı, WarfareSystem.rng)"""
         self.siege_duration += 1
         result = {
             "wall_damage": 0,
@@ -433,7 +435,7 @@ class SiegeState:
         
         if self.phase == SiegePhase.BLOCKADE:
             # Abluka - erzak kesilir
-            supply_loss = random.randint(5, 15)
+            supply_loss = rng.randint(5, 15)
             if not has_supply_line:
                 supply_loss += 10
             self.defender_supplies = max(0, self.defender_supplies - supply_loss)
@@ -445,12 +447,12 @@ class SiegeState:
             
         elif self.phase == SiegePhase.BOMBARDMENT:
             # Bombardıman - surlar yıkılır
-            wall_damage = attacker_artillery * random.uniform(0.5, 1.5)
+            wall_damage = attacker_artillery * rng.uniform(0.5, 1.5)
             self.wall_integrity = max(0, self.wall_integrity - int(wall_damage))
             result["wall_damage"] = int(wall_damage)
             
             # Gedik açılma şansı
-            if random.random() < 0.1 + (100 - self.wall_integrity) / 200:
+            if rng.random() < 0.1 + (100 - self.wall_integrity) / 200:
                 self.breaches += 1
                 result["breach_created"] = True
         
@@ -563,7 +565,8 @@ class BattleResult:
 class EnemyAI:
     """Gelişmiş düşman yapay zekası"""
     
-    def __init__(self):
+    def __init__(self, rng: random.Random):
+        self.rng = rng  # Sahibi WarfareSystem'in sefer akışı
         # Oyuncu taktik geçmişi (öğrenme için)
         self.player_tactic_history: List[str] = []
         self.counter_tactics = {
@@ -601,7 +604,7 @@ class EnemyAI:
         
         # Oyuncu taktiğini tahmin et ve karşılık ver
         predicted_tactic = self.predict_player_tactic()
-        if predicted_tactic and random.random() < 0.6:  # %60 karşılık verme şansı
+        if predicted_tactic and self.rng.random() < 0.6:  # %60 karşılık verme şansı
             counter = self.counter_tactics.get(predicted_tactic)
             if counter:
                 return counter
@@ -610,24 +613,24 @@ class EnemyAI:
         if enemy_morale > 80:
             # Yüksek moral - agresif
             if terrain == TerrainType.PLAINS and enemy_army.cavalry > 30:
-                return random.choice(["charge", "flank", "charge"])
-            return random.choice(["attack", "attack", "flank", "artillery"])
+                return self.rng.choice(["charge", "flank", "charge"])
+            return self.rng.choice(["attack", "attack", "flank", "artillery"])
         
         elif enemy_morale > 50:
             # Orta moral - dengeli
             if enemy_army.artillery > 10:
-                return random.choice(["artillery", "defend", "attack"])
-            return random.choice(["flank", "defend", "attack"])
+                return self.rng.choice(["artillery", "defend", "attack"])
+            return self.rng.choice(["flank", "defend", "attack"])
         
         elif enemy_morale > 25:
             # Düşük moral - savunmacı
-            return random.choice(["defend", "defend", "retreat", "hold"])
+            return self.rng.choice(["defend", "defend", "retreat", "hold"])
         
         else:
             # Çok düşük moral - umutsuz
-            if random.random() < 0.3:
+            if self.rng.random() < 0.3:
                 return "desperate_attack"  # Umutsuz saldırı
-            return random.choice(["defend", "surrender_consider"])
+            return self.rng.choice(["defend", "surrender_consider"])
     
     def get_tactic_result(self, tactic: str, enemy_army: Army, 
                           player_army: Army, terrain: TerrainType) -> Dict:
@@ -647,41 +650,41 @@ class EnemyAI:
         base_power = enemy_army.get_power(terrain)
         
         if tactic == "attack":
-            damage = int(random.randint(15, 30) * attack_mod)
+            damage = int(self.rng.randint(15, 30) * attack_mod)
             result["damage_to_player"] = damage
-            result["morale_damage_to_player"] = random.randint(5, 15)
-            result["damage_to_enemy"] = random.randint(10, 20)
+            result["morale_damage_to_player"] = self.rng.randint(5, 15)
+            result["damage_to_enemy"] = self.rng.randint(10, 20)
             result["message"] = f"Düşman merkez hücumu! {damage} hasar aldık."
         
         elif tactic == "charge":
-            damage = int(random.randint(20, 40) * attack_mod * terrain_mod.get("cavalry", 1.0))
+            damage = int(self.rng.randint(20, 40) * attack_mod * terrain_mod.get("cavalry", 1.0))
             result["damage_to_player"] = damage
-            result["morale_damage_to_player"] = random.randint(10, 20)
-            result["damage_to_enemy"] = random.randint(15, 30)
+            result["morale_damage_to_player"] = self.rng.randint(10, 20)
+            result["damage_to_enemy"] = self.rng.randint(15, 30)
             result["message"] = f"Düşman süvari şarjı! Yoğun {damage} hasar!"
         
         elif tactic == "flank" or tactic == "counter_flank":
-            damage = int(random.randint(10, 25) * attack_mod)
+            damage = int(self.rng.randint(10, 25) * attack_mod)
             result["damage_to_player"] = damage
-            result["morale_damage_to_player"] = random.randint(8, 18)
+            result["morale_damage_to_player"] = self.rng.randint(8, 18)
             result["message"] = f"Düşman kanat manevrası! {damage} hasar."
         
         elif tactic == "defend" or tactic == "hold":
-            result["damage_to_player"] = random.randint(5, 15)
+            result["damage_to_player"] = self.rng.randint(5, 15)
             result["damage_to_enemy"] = 0
             result["message"] = "Düşman savunma pozisyonunda, kayıplarımız az."
         
         elif tactic == "artillery":
-            damage = int(random.randint(15, 35) * terrain_mod.get("artillery", 1.0))
+            damage = int(self.rng.randint(15, 35) * terrain_mod.get("artillery", 1.0))
             result["damage_to_player"] = damage
-            result["morale_damage_to_player"] = random.randint(5, 15)
+            result["morale_damage_to_player"] = self.rng.randint(5, 15)
             result["message"] = f"Düşman top ateşi! {damage} hasar."
         
         elif tactic == "desperate_attack":
-            damage = random.randint(25, 50)
+            damage = self.rng.randint(25, 50)
             result["damage_to_player"] = damage
-            result["damage_to_enemy"] = random.randint(30, 60)
-            result["morale_damage_to_player"] = random.randint(5, 15)
+            result["damage_to_enemy"] = self.rng.randint(30, 60)
+            result["morale_damage_to_player"] = self.rng.randint(5, 15)
             result["morale_damage_to_enemy"] = 20
             result["message"] = f"Düşman umutsuz saldırı! Ağır kayıplar: {damage} hasar."
         
@@ -704,7 +707,9 @@ class WarfareSystem:
     # Erken oyun koruması - bu turdan önce düşman saldırısı yok
     EARLY_GAME_PROTECTION = 30
     
-    def __init__(self):
+    def __init__(self, rng: Optional[random.Random] = None):
+        # Sefer akışı (GameManager verir; tek başına kurulumda bağımsız akış)
+        self.rng = ensure_rng(rng)
         self.active_battles: List[Battle] = []
         self.war_history: List[Dict] = []
         self.war_weariness = 0  # Savaş yorgunluğu
@@ -714,7 +719,7 @@ class WarfareSystem:
         self.protection_disabled = False
         
         # Gelişmiş AI
-        self.enemy_ai = EnemyAI()
+        self.enemy_ai = EnemyAI(self.rng)
         
         # Savaş raporları
         self.battle_reports: List[BattleReport] = []
@@ -776,12 +781,12 @@ class WarfareSystem:
         elif "Çöl" in target or "Mısır" in target:
             return TerrainType.DESERT
         else:
-            return random.choice([TerrainType.PLAINS, TerrainType.PLAINS, TerrainType.FOREST])
+            return self.rng.choice([TerrainType.PLAINS, TerrainType.PLAINS, TerrainType.FOREST])
     
     def get_random_weather(self) -> WeatherType:
         """Rastgele hava durumu"""
         weights = [0.5, 0.2, 0.1, 0.1, 0.1]  # Açık hava en olası
-        return random.choices(list(WeatherType), weights=weights)[0]
+        return self.rng.choices(list(WeatherType), weights=weights)[0]
     
     def start_raid(self, target: str, military_system, economy, turn_count: int, 
                    raid_bonus: float = 0.0, artillery_march_penalty: float = 0.0) -> Tuple[bool, str]:
@@ -947,8 +952,8 @@ class WarfareSystem:
         fleet_power = naval_system.get_fleet_power()
         
         # Düşman filosu oluştur (hedef bölgeye göre)
-        enemy_warships = random.randint(1, 5)
-        enemy_power = enemy_warships * random.randint(20, 40)
+        enemy_warships = self.rng.randint(1, 5)
+        enemy_power = enemy_warships * self.rng.randint(20, 40)
         
         battle = Battle(
             battle_id=f"naval_{self.battle_counter}",
@@ -966,7 +971,7 @@ class WarfareSystem:
                 infantry=0,
                 cavalry=0,
                 artillery=enemy_power,
-                morale=random.randint(60, 85)
+                morale=self.rng.randint(60, 85)
             ),
             phase=BattlePhase.MARCH,
             turns_remaining=3,
@@ -1131,8 +1136,8 @@ class WarfareSystem:
         defender_power = int(battle.defender_army.get_power(terrain, weather) * defense_mod)
         
         # Rastgelelik ekle
-        attacker_roll = random.uniform(0.8, 1.2)
-        defender_roll = random.uniform(0.8, 1.2)
+        attacker_roll = self.rng.uniform(0.8, 1.2)
+        defender_roll = self.rng.uniform(0.8, 1.2)
         
         final_attacker = int(attacker_power * attacker_roll)
         final_defender = int(defender_power * defender_roll)
@@ -1145,11 +1150,11 @@ class WarfareSystem:
         defender_total = max(1, battle.defender_army.get_total_soldiers())
         
         if victory:
-            att_rate = random.uniform(0.03, 0.10)  # Zafer: %3-10 kayıp
-            def_rate = random.uniform(0.15, 0.35)  # Yenilen: %15-35 kayıp
+            att_rate = self.rng.uniform(0.03, 0.10)  # Zafer: %3-10 kayıp
+            def_rate = self.rng.uniform(0.15, 0.35)  # Yenilen: %15-35 kayıp
         else:
-            att_rate = random.uniform(0.10, 0.25)  # Yenilen: %10-25 kayıp
-            def_rate = random.uniform(0.03, 0.12)  # Zafer: %3-12 kayıp
+            att_rate = self.rng.uniform(0.10, 0.25)  # Yenilen: %10-25 kayıp
+            def_rate = self.rng.uniform(0.03, 0.12)  # Zafer: %3-12 kayıp
         
         attacker_casualties = max(5, int(attacker_total * att_rate))
         defender_casualties = max(5, int(defender_total * def_rate))
@@ -1162,12 +1167,12 @@ class WarfareSystem:
         if battle.battle_type == BattleType.NAVAL_RAID and naval_system:
             # Gemi hasarları
             warships = [s for s in naval_system.ships if s.get_definition().is_warship]
-            damage_roll = random.randint(10, 30)
+            damage_roll = self.rng.randint(10, 30)
             if not victory:
                 damage_roll = int(damage_roll * 1.5)
                 
             for ship in warships:
-                dmg = int(damage_roll * random.uniform(0.5, 1.5))
+                dmg = int(damage_roll * self.rng.uniform(0.5, 1.5))
                 ship.health -= dmg
                 if ship.health <= 0:
                     naval_system.ships.remove(ship)
@@ -1176,7 +1181,7 @@ class WarfareSystem:
             if victory:
                 naval_system.naval_victories += 1
                 for ship in warships:
-                    ship.experience += min(50, random.randint(5, 15))
+                    ship.experience += min(50, self.rng.randint(5, 15))
             else:
                 naval_system.naval_defeats += 1
         else:
@@ -1206,13 +1211,13 @@ class WarfareSystem:
         loot_food = 0
         if victory:
             if battle.battle_type in (BattleType.RAID, BattleType.NAVAL_RAID):
-                loot_gold = random.randint(500, 2000)
-                loot_food = random.randint(100, 500)
+                loot_gold = self.rng.randint(500, 2000)
+                loot_food = self.rng.randint(100, 500)
                 if battle.battle_type == BattleType.NAVAL_RAID:
                     loot_gold = int(loot_gold * 1.5)  # Deniz akınları daha karlı
             elif battle.battle_type == BattleType.SIEGE:
-                loot_gold = random.randint(2000, 10000)
-                loot_food = random.randint(500, 1500)
+                loot_gold = self.rng.randint(2000, 10000)
+                loot_food = self.rng.randint(500, 1500)
         
         # Savaş raporu oluştur
         report = BattleReport(
@@ -1273,7 +1278,7 @@ class WarfareSystem:
         attack_chance = 0.05 + effective_turns * 0.005
         attack_chance = min(0.15, attack_chance)
         
-        if random.random() > attack_chance:
+        if self.rng.random() > attack_chance:
             return None
         
         # Saldırı oluştur — düşman gücü tur sayısına göre ölçeklenir
@@ -1339,24 +1344,24 @@ class WarfareSystem:
         
         if battle_type == 'raid':
             return Army(
-                infantry=int(random.randint(50, 150) * scale),
-                cavalry=int(random.randint(20, 60) * scale),
-                artillery=int(random.randint(0, 8) * scale),
-                morale=min(100, random.randint(55, 80) + turn_count // 20)
+                infantry=int(self.rng.randint(50, 150) * scale),
+                cavalry=int(self.rng.randint(20, 60) * scale),
+                artillery=int(self.rng.randint(0, 8) * scale),
+                morale=min(100, self.rng.randint(55, 80) + turn_count // 20)
             )
         elif battle_type == 'siege':
             return Army(
-                infantry=int(random.randint(200, 400) * scale),
-                cavalry=int(random.randint(30, 80) * scale),
-                artillery=int(random.randint(10, 25) * scale),
-                morale=min(100, random.randint(65, 85) + turn_count // 15)
+                infantry=int(self.rng.randint(200, 400) * scale),
+                cavalry=int(self.rng.randint(30, 80) * scale),
+                artillery=int(self.rng.randint(10, 25) * scale),
+                morale=min(100, self.rng.randint(65, 85) + turn_count // 15)
             )
         else:  # defense
             return Army(
-                infantry=int(random.randint(80, 300) * scale),
-                cavalry=int(random.randint(40, 120) * scale),
-                artillery=int(random.randint(5, 15) * scale),
-                morale=min(100, random.randint(65, 90) + turn_count // 20)
+                infantry=int(self.rng.randint(80, 300) * scale),
+                cavalry=int(self.rng.randint(40, 120) * scale),
+                artillery=int(self.rng.randint(5, 15) * scale),
+                morale=min(100, self.rng.randint(65, 90) + turn_count // 20)
             )
     
     def to_dict(self) -> Dict:
@@ -1370,9 +1375,9 @@ class WarfareSystem:
         }
     
     @classmethod
-    def from_dict(cls, data: Dict) -> 'WarfareSystem':
+    def from_dict(cls, data: Dict, rng: Optional[random.Random] = None) -> 'WarfareSystem':
         """Dictionary'den yükle"""
-        system = cls()
+        system = cls(rng=rng)
         system.war_weariness = data.get('war_weariness', 0)
         system.battle_counter = data.get('battle_counter', 0)
         system.war_history = data.get('war_history', [])
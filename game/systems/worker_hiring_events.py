@@ -521,12 +521,12 @@ ALL_CANDIDATES = {
 }
 
 
-def get_random_candidate(worker_type: WorkerType) -> CandidateProfile:
-    """Belirli türde rastgele aday al"""
+def get_random_candidate(worker_type: WorkerType, rng: random.Random) -> CandidateProfile:
+    """Belirli türde rastgele aday al (rng: sefer akışı, GameManager.rng)"""
     candidates = ALL_CANDIDATES.get(worker_type, [])
     if not candidates:
         return None
-    return random.choice(candidates)
+    return rng.choice(candidates)
 
 
 def get_all_candidates_for_type(worker_type: WorkerType) -> List[CandidateProfile]:
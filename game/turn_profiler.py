@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+"""
+Osmanlı Eyalet Yönetim Simülasyonu - Tur Profil Ölçer
+process_turn aşamalarının duvar saati sürelerini ölçer.
+
+Son N turun ölçümleri sabit boyutlu bir halka tamponda tutulur; böylece
+uzun oturumlarda bellek büyümez. "Sonraki tur" takılmalarında hangi
+aşamanın sorumlu olduğunu görmek için kullanılır.
+"""
+
+import json
+import os
+import time
+from collections import deque
+from typing import Dict, List, Optional
+
+
+class TurnProfiler:
+    """Tur aşaması zamanlayıcısı (halka tamponlu)"""
+
+    DEFAULT_CAPACITY = 200  # Saklanan tur sayısı
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY):
+        self.enabled = True
+        self.records: deque = deque(maxlen=capacity)
+
+        # Ölçülmekte olan tur
+        self._turn = 0
+        self._stages: Dict[str, float] = {}
+        self._turn_start = 0.0
+        self._last_mark = 0.0
+
+    def start_turn(self, turn: int):
+        """Yeni tur ölçümü başlat"""
+        if not self.enabled:
+            return
+        self._turn = turn
+        self._stages = {}
+        self._turn_start = self._last_mark = time.perf_counter()
+
+    def lap(self, stage: str):
+        """Son işaretten bu yana geçen süreyi aşamaya yaz (ms)"""
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        self._stages[stage] = self._stages.get(stage, 0.0) + (now - self._last_mark) * 1000.0
+        self._last_mark = now
+
+    def end_turn(self):
+        """Tur ölçümünü bitir ve halka tampona ekle"""
+        if not self.enabled:
+            return
+        total = (time.perf_counter() - self._turn_start) * 1000.0
+        self.records.append({
+            'turn': self._turn,
+            'total_ms': total,
+            'stages': self._stages,
+        })
+        self._stages = {}
+
+    def clear(self):
+        """Tüm ölçümleri sil"""
+        self.records.clear()
+
+    def get_last(self) -> Optional[Dict]:
+        """Son turun ölçümü"""
+        return self.records[-1] if self.records else None
+
+    def get_stage_stats(self) -> List[Dict]:
+        """
+        Tampondaki turlar üzerinden aşama başına ortalama/en yüksek süre.
+        En yavaş (ortalama) aşama başta olacak şekilde sıralı döner.
+        """
+        totals: Dict[str, float] = {}
+        peaks: Dict[str, float] = {}
+        for record in self.records:
+            for stage, ms in record['stages'].items():
+                totals[stage] = totals.get(stage, 0.0) + ms
+                peaks[stage] = max(peaks.get(stage, 0.0), ms)
+
+        count = len(self.records) or 1
+        stats = [
+            {'stage': stage, 'avg_ms': total / count, 'max_ms': peaks[stage]}
+            for stage, total in totals.items()
+        ]
+        stats.sort(key=lambda s: s['avg_ms'], reverse=True)
+        return stats
+
+    def to_dict(self) -> Dict:
+        """JSON dökümü için dict"""
+        return {
+            'capacity': self.records.maxlen,
+            'turns': list(self.records),
+            'stage_stats': self.get_stage_stats(),
+        }
+
+    def dump_json(self, filepath: str) -> str:
+        """Ölçümleri JSON dosyasına yaz, dosya yolunu döndür"""
+        os.makedirs(os.path.dirname(filepath) or '.', exist_ok=True)
+        with open(filepath, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False, indent=2)
+        return filepath
@@ -42,6 +42,7 @@ from config import SCREEN_WIDTH, SCREEN_HEIGHT, FPS, GAME_TITLE, COLORS
 from audio.audio_manager import get_audio_manager
 from updater import get_updater
 from game.game_manager import GameManager
+from game.save_writer import get_save_writer
 from ui.screen_manager import ScreenManager, ScreenType
 from ui.screens.main_menu import MainMenuScreen
 from ui.screens.province_view import ProvinceViewScreen
@@ -464,6 +465,8 @@ class Game:
     
     def _cleanup(self):
         """Temizlik işlemleri"""
+        # Arka planda yazılan otomatik kaydın bitmesini bekle
+        get_save_writer().flush()
         self.audio.cleanup()
         pygame.quit()
 
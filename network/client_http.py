@@ -4,6 +4,7 @@ Osmanlı Eyalet Yönetim Simülasyonu - HTTP Polling İstemcisi
 Basit REST API tabanlı çok oyunculu istemci
 """
 
+import json
 import requests
 import threading
 import time
@@ -15,6 +16,10 @@ from queue import Queue
 class HTTPNetworkClient:
     """HTTP Polling tabanlı ağ istemcisi"""
     
+    CHAT_HISTORY_LIMIT = 50  # İstemcide tutulan sohbet mesajı sayısı
+    # Kendi isteğimizin yanıtıyla zaten uygulanan olaylar (günlükten tekrar bildirilmez)
+    SELF_APPLIED_EVENTS = ('province_selected', 'game_started', 'turn_ended')
+    
     def __init__(self):
         self.server_url = ""
         self.player_id = str(uuid.uuid4())
@@ -28,6 +33,17 @@ class HTTPNetworkClient:
         self._polling = False
         self._poll_thread = None
         self._poll_interval = 2.0  # 2 saniye (Rate limit dostu)
+        self._room_etag = None  # Son alınan oda sürümünün ETag'i (304 için)
+        self._long_poll_wait = 20  # Sunucu değişiklik olana kadar en fazla bu kadar bekletir (sn)
+        self._room_sections = False  # Sunucu odayı bölümler halinde sunuyor mu (/core, /chat...)
+        self._room_journal = False  # Sunucu oda olay günlüğü sunuyor mu (/events)
+        self._event_cursor = 0  # İşlenen son oda olayının sıra numarası
+        self._event_base_room = None  # İmlecin işlendiği andaki oda (günlük kapsamazsa fark için)
+        self._room_version = None  # Son görülen oda sürümü (bölümlü long-poll için ?version=)
+        self._loaded_sections = {}  # room_data'daki soğuk bölümlerin sürümleri
+        self._section_wakeup = threading.Event()  # Bölüm ve olay çekicisini uyandırır
+        self._section_thread = None
+        self._room_lock = threading.RLock()  # room_data'yı polling ve bölüm iş parçacıkları paylaşır
         
         # Callback'ler
         self.callbacks: Dict[str, Callable] = {}
@@ -50,6 +66,9 @@ class HTTPNetworkClient:
         try:
             r = requests.get(f"{self.server_url}/health", timeout=5)
             if r.status_code == 200:
+                features = r.json().get('features', [])
+                self._room_sections = 'room_sections' in features
+                self._room_journal = 'room_journal' in features
                 self.connected = True
                 self.last_error = None
                 print(f"[HTTP] Sunucu bağlantısı OK: {self.server_url}")
@@ -95,53 +114,231 @@ class HTTPNetworkClient:
     # ===== POLLING =====
     
     def _start_polling(self):
-        """Arka planda oda durumunu çekmeye başla"""
+        """
+        Arka planda oda durumunu çekmeye başla.
+        Sunucu long-poll destekliyorsa (X-Long-Poll yanıt başlığı) istek oda
+        değişene kadar açık kalır ve yanıt gelir gelmez yeni istek atılır;
+        desteklemiyorsa _poll_interval aralıklı polling'e düşülür.
+        Bölümlü sunucuda yalnızca oda çekirdeği izlenir; sohbet, diplomasi ve
+        oyuncu durumları sürümleri değiştiğinde ayrı bir iş parçacığında
+        çekilir, polling döngüsü onları beklemez.
+        """
         if self._polling:
             return
         
         self._polling = True
+        self._room_etag = None  # İlk istekte tam oda durumu alınsın
+        self._room_version = None
+        self._loaded_sections = self._section_versions_of(self.room_data or {})
         
         def poll_loop():
             while self._polling and self.room_code:
+                long_polled = False
                 try:
+                    headers = {}
+                    params = {'player_id': self.player_id}
+                    if self._room_etag:
+                        headers['If-None-Match'] = self._room_etag
+                        params['wait'] = self._long_poll_wait
+                        if self._room_sections and self._room_version is not None:
+                            params['version'] = self._room_version
+                    path = "/core" if self._room_sections else ""
                     r = requests.get(
-                        f"{self.server_url}/room/{self.room_code}",
-                        params={'player_id': self.player_id},
-                        timeout=5
+                        f"{self.server_url}/room/{self.room_code}{path}",
+                        params=params,
+                        headers=headers,
+                        timeout=self._long_poll_wait + 5
                     )
+                    long_polled = 'X-Long-Poll' in r.headers
                     
-                    if r.status_code == 200:
-                        data = r.json()
-                        old_room = self.room_data
-                        self.room_data = data.get('room')
-                        
-                        # Host kontrolü
-                        if self.room_data:
-                            self.is_host = self.room_data.get('host_id') == self.player_id
-                        
-                        # Değişiklik varsa callback çağır
-                        if old_room != self.room_data:
-                            self._on_room_updated(old_room, self.room_data)
+                    if self._room_sections:
+                        self._apply_room_core(r)
+                    elif r.status_code == 200:
+                        # 304: oda değişmedi, gövde yok
+                        self._room_etag = r.headers.get('ETag')
+                        self._set_room_data(r.json().get('room'))
                     
                 except Exception as e:
                     print(f"[HTTP] Polling hatası: {e}")
                 
-                time.sleep(self._poll_interval)
+                # Long-poll yanıtı bekleme süresini zaten içerir
+                if not long_polled:
+                    time.sleep(self._poll_interval)
         
         self._poll_thread = threading.Thread(target=poll_loop, daemon=True)
         self._poll_thread.start()
+        if self._room_sections or self._room_journal:
+            self._section_thread = threading.Thread(target=self._section_loop, daemon=True)
+            self._section_thread.start()
         print("[HTTP] Polling başladı")
     
+    def _set_room_data(self, new_room: dict):
+        """room_data'yı değiştir; değişiklik varsa callback'leri çağır"""
+        with self._room_lock:
+            old_room = self.room_data
+            self.room_data = new_room
+            
+            # Host kontrolü
+            if new_room:
+                self.is_host = new_room.get('host_id') == self.player_id
+            
+            if old_room != new_room:
+                self._on_room_updated(old_room, new_room)
+    
+    @staticmethod
+    def _section_versions_of(room: dict) -> dict:
+        """Oda anlık görüntüsündeki soğuk bölüm sürümleri"""
+        versions = room.get('section_versions', {})
+        return {
+            'chat': versions.get('chat'),
+            'diplomacy': versions.get('diplomacy'),
+            'state': dict(room.get('state_versions', {})),
+        }
+    
+    def _get_json(self, url: str, params: dict = None) -> dict:
+        """GET isteği; başarısızsa istisna fırlatır"""
+        r = requests.get(url, params=params, timeout=5)
+        r.raise_for_status()
+        return r.json()
+    
+    def _apply_room_core(self, r):
+        """
+        Bölümlü sunucunun /core yanıtını uygula. Sürüm alanları her yanıtta
+        (304 dahil) X-Room-Versions başlığında gelir; gövde yalnızca çekirdek
+        değiştiyse gelir. Soğuk bölümler elimizdekiyle kalır, sürümü
+        değişenler bölüm iş parçacığına bırakılır.
+        """
+        if r.status_code not in (200, 304):
+            return
+        versions = json.loads(r.headers.get('X-Room-Versions') or '{}')
+        
+        with self._room_lock:
+            old = self.room_data or {}
+            if r.status_code == 200:
+                self._room_etag = r.headers.get('ETag')
+                room = r.json().get('room') or {}
+                for key in ('chat', 'diplomacy', 'player_states'):
+                    if key in old:
+                        room[key] = old[key]
+                # Tur durumu oyuncu durumu bölümüyle gelir
+                old_players = old.get('players', {})
+                for pid, player in room.get('players', {}).items():
+                    turn_state = old_players.get(pid, {}).get('state')
+                    if turn_state is not None:
+                        player['state'] = turn_state
+            else:
+                room = dict(old)
+            room.update(versions)
+            self._room_version = versions.get('version', self._room_version)
+            self._set_room_data(room)
+            
+            if self._stale_sections(room):
+                self._section_wakeup.set()
+    
+    def _stale_sections(self, room: dict) -> dict:
+        """Sunucudaki sürümü elimizdekinden farklı olan soğuk bölümler"""
+        loaded = self._loaded_sections
+        versions = room.get('section_versions', {})
+        state_versions = room.get('state_versions', {})
+        stale = {}
+        if versions.get('chat') != loaded.get('chat'):
+            stale['chat'] = max((msg.get('seq', 0) for msg in room.get('chat', [])), default=0)
+        if versions.get('diplomacy') != loaded.get('diplomacy'):
+            stale['diplomacy'] = loaded.get('diplomacy') or -1
+        states = [pid for pid in room.get('players', {})
+                  if state_versions.get(pid) != loaded.get('state', {}).get(pid)]
+        if states:
+            stale['state'] = states
+        return stale
+    
+    def _section_loop(self):
+        """Sürümü değişen soğuk bölümleri ve yeni oda olaylarını arka planda çek"""
+        while self._polling and self.room_code:
+            if not self._section_wakeup.wait(timeout=1.0):
+                continue
+            self._section_wakeup.clear()
+            if self._room_sections:
+                try:
+                    self._refresh_sections()
+                except Exception as e:
+                    print(f"[HTTP] Bölüm güncelleme hatası: {e}")
+            if self._room_journal:
+                self._replay_room_events()
+    
+    def _refresh_sections(self):
+        """
+        Yalnızca sürümü değişen bölümleri çek ve room_data'ya ekle.
+        İstekler kilit dışında yapılır; sonuç o anki room_data'ya uygulanır.
+        """
+        with self._room_lock:
+            stale = self._stale_sections(self.room_data or {})
+        if not stale:
+            return
+        
+        base = f"{self.server_url}/room/{self.room_code}"
+        chat = diplomacy = None
+        if 'chat' in stale:
+            chat = self._get_json(f"{base}/chat", {'since': stale['chat']})
+        if 'diplomacy' in stale:
+            diplomacy = self._get_json(f"{base}/diplomacy", {'since': stale['diplomacy']})
+        states = {pid: self._get_json(f"{base}/player/{pid}/state")
+                  for pid in stale.get('state', [])}
+        
+        with self._room_lock:
+            room = dict(self.room_data or {})
+            loaded = self._loaded_sections
+            
+            # Sohbet: imleçten sonraki mesajlar (kırpıldıysa baştan)
+            if chat is not None:
+                messages = [] if chat.get('truncated') else list(room.get('chat', []))
+                last_seq = max((msg.get('seq', 0) for msg in messages), default=0)
+                messages.extend(msg for msg in chat.get('messages', [])
+                                if msg.get('seq', 0) > last_seq)
+                room['chat'] = messages[-self.CHAT_HISTORY_LIMIT:]
+                loaded['chat'] = chat.get('version')
+            
+            # Diplomasi: değiştiyse tamamı
+            if diplomacy is not None:
+                if diplomacy.get('changed'):
+                    room['diplomacy'] = diplomacy.get('diplomacy', {})
+                loaded['diplomacy'] = diplomacy.get('version')
+            
+            # Oyuncu durumları: yalnızca sürümü değişen oyuncular
+            if states:
+                player_states = dict(room.get('player_states', {}))
+                players = {pid: dict(player) for pid, player in room.get('players', {}).items()}
+                for pid, data in states.items():
+                    if data.get('state') is not None:
+                        player_states[pid] = data['state']
+                    if data.get('turn_state') is not None and pid in players:
+                        players[pid]['state'] = data['turn_state']
+                    loaded.setdefault('state', {})[pid] = data.get('version')
+                room['player_states'] = player_states
+                room['players'] = players
+            
+            self._set_room_data(room)
+    
     def _stop_polling(self):
         """Polling'i durdur"""
         self._polling = False
         print("[HTTP] Polling durduruldu")
     
     def _on_room_updated(self, old_room: dict, new_room: dict):
-        """Oda güncellendiğinde callback'leri çağır"""
+        """
+        Oda güncellendiğinde callback'leri çağır.
+        Sunucu olay günlüğü sunuyorsa yalnızca bölüm iş parçacığı uyandırılır;
+        olaylar orada, oda kilidi dışında çekilir (bkz. _replay_room_events).
+        """
         if not old_room:
             return
-        
+        if self._room_journal:
+            if new_room.get('event_seq', 0) > self._event_cursor:
+                self._section_wakeup.set()
+            return
+        self._diff_room_snapshots(old_room, new_room)
+    
+    def _diff_room_snapshots(self, old_room: dict, new_room: dict):
+        """İki oda anlık görüntüsünün farkından callback'leri çağır"""
         # Yeni oyuncu katıldı mı?
         old_players = set(old_room.get('players', {}).keys())
         new_players = set(new_room.get('players', {}).keys())
@@ -187,10 +384,15 @@ class HTTPNetworkClient:
         # Sohbet mesajı var mı?
         old_chat = old_room.get('chat', [])
         new_chat = new_room.get('chat', [])
-        if len(new_chat) > len(old_chat):
-            for msg in new_chat[len(old_chat):]:
-                if 'chat_message' in self.callbacks:
-                    self.callbacks['chat_message'](msg)
+        if new_chat and 'seq' in new_chat[-1]:
+            # Sıra numaralı mesajlar: geçmiş kırpılsa da yeniler kaçırılmaz
+            last_seq = max((msg.get('seq', 0) for msg in old_chat), default=0)
+            new_messages = [msg for msg in new_chat if msg.get('seq', 0) > last_seq]
+        else:
+            new_messages = new_chat[len(old_chat):]
+        for msg in new_messages:
+            if 'chat_message' in self.callbacks:
+                self.callbacks['chat_message'](msg)
                     
         # Diplomasi teklifleri
         old_props = old_room.get('diplomacy', {}).get('pending_proposals', [])
@@ -227,6 +429,84 @@ class HTTPNetworkClient:
                 if 'trade_agreement_formed' in self.callbacks:
                     self.callbacks['trade_agreement_formed'](trade)
     
+    def _replay_room_events(self):
+        """
+        İmleçten sonraki oda olaylarını çek ve callback'lere dağıt.
+        İstek kilit dışında yapılır; imleç bu arada değiştiyse (odaya yeniden
+        katılma) sonuç atılır. Günlük imleci kapsamıyorsa (sıkıştırma, sunucu
+        yeniden başlatma) imlecin işlendiği andaki oda ile şimdiki oda
+        karşılaştırılır.
+        """
+        with self._room_lock:
+            cursor = self._event_cursor
+            target = (self.room_data or {}).get('event_seq', 0)
+        if target <= cursor:
+            return
+        
+        try:
+            data = self._get_json(f"{self.server_url}/room/{self.room_code}/events",
+                                  {'since': cursor})
+        except Exception as e:
+            print(f"[HTTP] Olay günlüğü alınamadı: {e}")
+            data = {'reset': True, 'cursor': target}
+        
+        with self._room_lock:
+            if self._event_cursor != cursor:
+                return
+            room = self.room_data or {}
+            self._event_cursor = data.get('cursor', target)
+            if data.get('reset'):
+                if self._event_base_room:
+                    self._diff_room_snapshots(self._event_base_room, room)
+            else:
+                for event in data.get('events', []):
+                    self._dispatch_room_event(event, room)
+            self._event_base_room = room
+            
+            # Beklerken yeni olaylar geldiyse tekrar
+            if room.get('event_seq', 0) > self._event_cursor:
+                self._section_wakeup.set()
+    
+    def _dispatch_room_event(self, event: dict, room: dict):
+        """Tek oda olayını ilgili callback'e çevir"""
+        kind = event.get('type')
+        if kind in self.SELF_APPLIED_EVENTS and event.get('player_id') == self.player_id:
+            return
+        
+        if kind == 'game_started':
+            if 'game_started' in self.callbacks:
+                self.callbacks['game_started']({'room': room})
+        
+        elif kind == 'turn_ended':
+            if 'turn_changed' in self.callbacks:
+                self.callbacks['turn_changed']({
+                    'current_player_id': event.get('current_player'),
+                    'turn': event.get('turn')
+                })
+            if 'turn_ended' in self.callbacks:
+                self.callbacks['turn_ended'](event)
+        
+        elif kind == 'chat_message':
+            if 'chat_message' in self.callbacks:
+                self.callbacks['chat_message'](event.get('message', {}))
+        
+        elif kind == 'proposal':
+            prop = event.get('proposal', {})
+            if prop.get('to_player_id') == self.player_id:
+                callback = {'alliance': 'alliance_proposal', 'trade': 'trade_proposal'}.get(prop.get('type'))
+                if callback in self.callbacks:
+                    self.callbacks[callback](prop)
+        
+        elif kind == 'battle_result':
+            # Mesaj saldıranın ağzından yazılır ve saldıran sonucu /attack
+            # yanıtında zaten alır; olay yalnızca savunana iletilir
+            if event.get('defender_id') == self.player_id and 'battle_result' in self.callbacks:
+                self.callbacks['battle_result'](event)
+        
+        elif kind in self.callbacks:
+            # Olay alanları callback'lerin beklediği biçimde (player, player_id, players...)
+            self.callbacks[kind](event)
+    
     def get_pending_messages(self) -> list:
         """Uyumluluk için - HTTP'de mesaj kuyruğu yok"""
         return []
@@ -256,6 +536,8 @@ class HTTPNetworkClient:
                 data = r.json()
                 self.room_code = data.get('room_code')
                 self.room_data = data.get('room')
+                self._event_cursor = (self.room_data or {}).get('event_seq', 0)
+                self._event_base_room = self.room_data
                 self.is_host = True
                 
                 print(f"[HTTP] Oda oluşturuldu: {self.room_code}")
@@ -286,6 +568,8 @@ class HTTPNetworkClient:
                 data = r.json()
                 self.room_code = room_code
                 self.room_data = data.get('room')
+                self._event_cursor = (self.room_data or {}).get('event_seq', 0)
+                self._event_base_room = self.room_data
                 self.is_host = False
                 
                 print(f"[HTTP] Odaya katıldı: {room_code}")
@@ -12,11 +12,17 @@ Gerekli kütüphaneler:
 
 import asyncio
 import json
+import os
 import random
 import string
 import argparse
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, Set, Optional
+from typing import Awaitable, Callable, Dict, Set, Optional
+
+from server_journal import FrameJournal
 from dataclasses import dataclass, asdict
 
 try:
@@ -26,6 +32,18 @@ except ImportError:
     print("websockets kütüphanesi gerekli: pip install websockets")
     exit(1)
 
+# Bağlantı başına bekleyebilecek en fazla giden mesaj; aşılırsa istemci
+# geride kalmış sayılır ve bağlantısı kapatılır (istemci reconnect ile döner)
+OUTBOX_MAX_MESSAGES = 256
+SLOW_CLIENT_CLOSE_CODE = 1013  # "Try Again Later"
+
+# Oyuncu durum güncellemeleri oda başına bu sıklıkla (Hz) toplu yayınlanır
+STATE_TICK_HZ = 10
+
+# Oda kayıtları; aynı odaya bu süre içinde gelen kayıtlar tek yazımda birleşir
+SAVED_ROOMS_DIR = os.path.join(os.path.dirname(__file__), "saved_rooms")
+SAVE_DEBOUNCE_SECONDS = 0.5
+
 
 @dataclass
 class Player:
@@ -84,6 +102,15 @@ class GameRoom:
     current_turn: int = 0
     current_player_id: Optional[str] = None
     game_state: dict = None
+    # Sonraki tick'te yayınlanacak durum farkları (player_id -> değişen alanlar).
+    # Çalışma zamanı verisidir, to_dict/kayda girmez.
+    pending_states: dict = None
+    state_tick: int = 0
+    last_state_flush: float = 0.0
+    state_flush_task: any = None
+    # Olay günlüğü (sayı ve bayt ile sınırlı); bkz. GameServer.publish, server_journal
+    journal: any = None
+    event_seq: int = 0
     
     # Eyalet listesi - 1520 Osmanlı Dönemi (50+ bölge)
     PROVINCES = [
@@ -120,6 +147,10 @@ class GameRoom:
                 "trade_agreements": [],
                 "messages": []    # Oyun içi mesajlar
             }
+        if self.pending_states is None:
+            self.pending_states = {}
+        if self.journal is None:
+            self.journal = FrameJournal()
     
     def get_available_provinces(self) -> list:
         """Müsait eyaletleri döndür"""
@@ -136,19 +167,294 @@ class GameRoom:
             "current_turn": self.current_turn,
             "current_player_id": self.current_player_id,
             "available_provinces": self.get_available_provinces(),
-            "game_state": self.game_state  # İttifak/savaş durumları için
+            "game_state": self.game_state,  # İttifak/savaş durumları için
+            "event_seq": self.event_seq
         }
 
 
+class ConnectionOutbox:
+    """
+    Bağlantı başına sınırlı giden mesaj kuyruğu.
+    Mesajlar önceden kodlanmış metin olarak kuyruğa alınır ve bağlantıya ait
+    yazıcı görev tarafından sırayla gönderilir; yayın yapan kod hiçbir
+    istemcinin ağını beklemez. Kuyruk dolarsa bağlantı kapatılır.
+    """
+    
+    def __init__(self, websocket, max_messages: int = OUTBOX_MAX_MESSAGES):
+        self.websocket = websocket
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=max_messages)
+        self.closed = False
+        self._closer: Optional[asyncio.Task] = None
+        self._writer = asyncio.create_task(self._run())
+    
+    def send(self, payload: str) -> bool:
+        """Kodlanmış mesajı kuyruğa al (beklemez). Returns: Kabul edildi mi"""
+        if self.closed:
+            return False
+        try:
+            self.queue.put_nowait(payload)
+            return True
+        except asyncio.QueueFull:
+            self._drop()
+            return False
+    
+    async def _run(self):
+        try:
+            while True:
+                payload = await self.queue.get()
+                await self.websocket.send(payload)
+        except websockets.exceptions.ConnectionClosed:
+            self.closed = True
+    
+    def _drop(self):
+        """Geride kalan istemcinin bağlantısını kapat"""
+        print(f"[{datetime.now()}] Yavaş istemci: {self.queue.qsize()} mesaj birikti, bağlantı kapatılıyor")
+        self.close()
+        self._closer = asyncio.create_task(
+            self.websocket.close(code=SLOW_CLIENT_CLOSE_CODE, reason="Istemci geride kaldi")
+        )
+    
+    def close(self):
+        """Yazıcı görevi durdur; kuyruktaki mesajlar atılır"""
+        self.closed = True
+        self._writer.cancel()
+
+
+class RoomFileStore:
+    """
+    saved_rooms/*.json kayıtları.
+    Disk işlemleri ayrı iş parçacığı havuzunda yürür; olay döngüsü yalnızca
+    JSON kodlar. Boştaki odanın kaydı hemen yazılır, sonraki
+    SAVE_DEBOUNCE_SECONDS içinde gelenler birleşip son haliyle bir kez yazılır.
+    Dosya geçici dosyaya yazılıp os.replace ile atomik olarak değiştirilir.
+    """
+    
+    def __init__(self, directory: str = SAVED_ROOMS_DIR, debounce: float = SAVE_DEBOUNCE_SECONDS):
+        self.directory = directory
+        self.debounce = debounce
+        self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="RoomFileStore")
+        self._pending: Dict[str, list] = {}  # oda kodu -> [kodlanmış veri, bekleyen future'lar]
+        self._writers: Dict[str, asyncio.Task] = {}
+    
+    def path(self, room_code: str) -> str:
+        return os.path.join(self.directory, f"{room_code}.json")
+    
+    def save(self, room_code: str, save_data: dict) -> asyncio.Future:
+        """
+        Kaydı sıraya al.
+        Returns: Bu veriyi içeren yazım bitince True/False ile tamamlanan future
+        """
+        payload = json.dumps(save_data, ensure_ascii=False, indent=2)
+        done = asyncio.get_running_loop().create_future()
+        pending = self._pending.setdefault(room_code, [None, []])
+        pending[0] = payload
+        pending[1].append(done)
+        if room_code not in self._writers:
+            self._writers[room_code] = asyncio.create_task(self._write_loop(room_code))
+        return done
+    
+    async def _write_loop(self, room_code: str):
+        loop = asyncio.get_running_loop()
+        try:
+            while room_code in self._pending:
+                payload, waiters = self._pending.pop(room_code)
+                try:
+                    await loop.run_in_executor(self._executor, self._write_file, room_code, payload)
+                    result = True
+                except OSError as e:
+                    print(f"[{datetime.now()}] Oda kaydetme hatası: {e}")
+                    result = False
+                for waiter in waiters:
+                    if not waiter.done():
+                        waiter.set_result(result)
+                # Pencere içinde gelen kayıtlar sonraki turda tek yazılır
+                await asyncio.sleep(self.debounce)
+        finally:
+            self._writers.pop(room_code, None)
+    
+    def _write_file(self, room_code: str, payload: str):
+        """Geçici dosyaya yaz, diske indir ve atomik olarak yerine koy"""
+        os.makedirs(self.directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(prefix=f".{room_code}.", suffix=".tmp", dir=self.directory)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.path(room_code))
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+    
+    async def load(self, room_code: str) -> Optional[dict]:
+        """Kaydı oku (dosya yoksa None)"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self._read_file, room_code)
+    
+    def _read_file(self, room_code: str) -> Optional[dict]:
+        try:
+            with open(self.path(room_code), "r", encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+
+
+class PayloadError(ValueError):
+    """Aksiyon yükü şemaya uymuyor"""
+
+
+REQUIRED = object()  # Şemada varsayılanı olmayan (zorunlu) alan
+
+
+class ActionSchema:
+    """
+    Aksiyon yükü şeması: alan -> (tip(ler), varsayılan).
+    Alanlar kayıt sırasında bir kez derlenir; doğrulama alan sayısıyla
+    doğrusal tek geçiştir. Eksik alanlar varsayılanla doldurulur, böylece
+    handler'lar alanlara doğrudan data[...] ile erişebilir.
+    """
+    
+    def __init__(self, **fields):
+        self._fields = tuple((name, types, default) for name, (types, default) in fields.items())
+    
+    def validate(self, data: dict) -> dict:
+        """Doğrulanmış ve varsayılanları doldurulmuş yük kopyası döndür"""
+        cleaned = dict(data)
+        for name, types, default in self._fields:
+            value = data.get(name)
+            if value is None:
+                if default is REQUIRED:
+                    raise PayloadError(f"Eksik alan: {name}")
+                cleaned[name] = default.copy() if isinstance(default, (dict, list)) else default
+            elif not isinstance(value, types):
+                raise PayloadError(f"Geçersiz alan: {name}")
+        return cleaned
+
+
+@dataclass
+class ActionStats:
+    """Aksiyon başına çağrı sayısı ve süre"""
+    calls: int = 0
+    errors: int = 0
+    invalid: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+    
+    def record(self, seconds: float, error: bool):
+        self.calls += 1
+        self.errors += 1 if error else 0
+        self.total_seconds += seconds
+        if seconds > self.max_seconds:
+            self.max_seconds = seconds
+    
+    def to_dict(self):
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "invalid": self.invalid,
+            "total_ms": round(self.total_seconds * 1000, 3),
+            "avg_ms": round(self.total_seconds * 1000 / self.calls, 3) if self.calls else 0.0,
+            "max_ms": round(self.max_seconds * 1000, 3)
+        }
+
+
+@dataclass
+class ActionRoute:
+    """Dağıtım tablosu girdisi"""
+    handler: Callable[..., Awaitable[dict]]
+    schema: ActionSchema
+    requires_player: bool = True  # player_id bilinen bir oyuncu olmalı
+    binds_player: bool = False     # Başarılı yanıttaki player_id bağlantıya bağlanır
+    stats: ActionStats = None
+    
+    def __post_init__(self):
+        if self.stats is None:
+            self.stats = ActionStats()
+
+
 class GameServer:
     """Ana sunucu sınıfı"""
     
-    def __init__(self, host: str = "0.0.0.0", port: int = 8765):
+    def __init__(self, host: str = "0.0.0.0", port: int = 8765,
+                 state_tick_hz: float = STATE_TICK_HZ):
         self.host = host
         self.port = port
+        self.state_tick_interval = 1.0 / state_tick_hz
         self.rooms: Dict[str, GameRoom] = {}
         self.player_room_map: Dict[str, str] = {}  # player_id -> room_code
         self.connections: Dict[str, any] = {}  # player_id -> websocket
+        self.outboxes: Dict[any, ConnectionOutbox] = {}  # websocket -> giden kuyruk
+        self.room_store = RoomFileStore()
+        self.background_tasks: Set[asyncio.Task] = set()
+        self.actions: Dict[str, ActionRoute] = {}
+        self.unknown_actions = 0
+        self._register_actions()
+    
+    def register_action(self, name: str, handler: Callable[..., Awaitable[dict]],
+                        requires_player: bool = True, binds_player: bool = False, **fields):
+        """Aksiyonu dağıtım tablosuna ekle (fields: alan -> (tip, varsayılan))"""
+        if requires_player:
+            fields = {"player_id": (str, REQUIRED), **fields}
+        self.actions[name] = ActionRoute(handler, ActionSchema(**fields),
+                                         requires_player, binds_player)
+    
+    def _register_actions(self):
+        """Aksiyon -> handler tablosu ve yük şemaları"""
+        name = (str, "Anonim")
+        self.register_action("create_room", self.handle_create_room,
+                             requires_player=False, binds_player=True, player_name=name)
+        self.register_action("join_room", self.handle_join_room,
+                             requires_player=False, binds_player=True,
+                             room_code=(str, REQUIRED), player_name=name)
+        self.register_action("select_province", self.handle_select_province,
+                             province=(str, REQUIRED))
+        self.register_action("ready", self.handle_ready, ready=(bool, True))
+        self.register_action("start_game", self.handle_start_game)
+        self.register_action("end_turn", self.handle_end_turn, state=(dict, {}))
+        self.register_action("diplomacy", self.handle_diplomacy_action,
+                             diplomacy_action=(str, REQUIRED), target_id=(str, REQUIRED))
+        self.register_action("chat", self.handle_chat, message=(str, ""))
+        self.register_action("update_state", self.handle_update_state, state=(dict, {}))
+        self.register_action("reconnect", self.handle_reconnect,
+                             requires_player=False, binds_player=True,
+                             room_code=(str, REQUIRED), player_id=(str, REQUIRED),
+                             reconnect_token=(str, REQUIRED), last_seq=(int, None))
+        self.register_action("save_room", self.handle_save_room)
+        self.register_action("load_room", self.handle_load_room,
+                             requires_player=False, room_code=(str, REQUIRED), player_name=name)
+        self.register_action("ping", self.handle_ping, requires_player=False)
+        self.register_action("stats", self.handle_stats, requires_player=False)
+    
+    async def dispatch(self, websocket, data) -> tuple:
+        """
+        Mesajı tablodan handler'a yönlendir; şemayı uygula, süreyi ölç.
+        Returns: (route veya None, yanıt)
+        """
+        if not isinstance(data, dict):
+            return None, {"type": "error", "message": "Geçersiz mesaj"}
+        
+        action = data.get("action", "")
+        route = self.actions.get(action) if isinstance(action, str) else None
+        if route is None:
+            self.unknown_actions += 1
+            return None, {"type": "error", "message": f"Bilinmeyen aksiyon: {action}"}
+        
+        try:
+            data = route.schema.validate(data)
+        except PayloadError as e:
+            route.stats.invalid += 1
+            return route, {"type": "error", "message": str(e)}
+        if route.requires_player and data["player_id"] not in self.player_room_map:
+            route.stats.invalid += 1
+            return route, {"type": "error", "message": "Oyuncu bulunamadı"}
+        
+        started = time.perf_counter()
+        response = await route.handler(websocket, data)
+        route.stats.record(time.perf_counter() - started, response.get("type") == "error")
+        return route, response
         
     def generate_room_code(self) -> str:
         """6 karakterlik oda kodu oluştur"""
@@ -161,30 +467,64 @@ class GameServer:
         """Benzersiz oyuncu ID'si oluştur"""
         return ''.join(random.choices(string.ascii_lowercase + string.digits, k=12))
     
-    async def broadcast_to_room(self, room_code: str, message: dict, exclude_id: str = None):
-        """Odadaki tüm oyunculara mesaj gönder"""
-        if room_code not in self.rooms:
+    async def broadcast_to_room(self, room_code: str, message: dict, exclude_id: str = None,
+                                journal: bool = True):
+        """
+        Odadaki tüm oyunculara mesaj gönder.
+        Mesaj bir kez kodlanır ve her alıcının kuyruğuna eklenir; gönderimler
+        bağlantı başına eşzamanlı yürür, yavaş istemci diğerlerini bekletmez.
+        journal=True ise mesaj sıra numarası alır ve oda günlüğüne yazılır.
+        """
+        room = self.rooms.get(room_code)
+        if room is None:
             return
         
-        room = self.rooms[room_code]
+        if journal:
+            self.publish(room, message, exclude_id=exclude_id)
+        else:
+            self._fan_out(room, json.dumps(message), exclude_id=exclude_id)
+    
+    def publish(self, room: GameRoom, message: dict, to: str = None, exclude_id: str = None):
+        """
+        Oda olayını günlüğe ekle ve gönder.
+        Mesaja "seq" eklenir; to verilirse yalnızca o oyuncuya gider ve
+        yeniden bağlanınca da yalnızca ona tekrar oynatılır.
+        """
+        room.event_seq += 1
+        payload = json.dumps({**message, "seq": room.event_seq})
+        room.journal.append(room.event_seq, to, exclude_id, payload)
+        self._fan_out(room, payload, to=to, exclude_id=exclude_id)
+    
+    def _fan_out(self, room: GameRoom, payload: str, to: str = None, exclude_id: str = None):
+        """Kodlanmış mesajı alıcıların kuyruklarına ekle"""
         for player_id, player in room.players.items():
-            if player_id != exclude_id and player.websocket:
-                try:
-                    await player.websocket.send(json.dumps(message))
-                except:
-                    pass
+            if player_id == exclude_id or (to and player_id != to) or not player.websocket:
+                continue
+            outbox = self.outboxes.get(player.websocket)
+            if outbox is not None:
+                outbox.send(payload)
+    
+    def events_since(self, room: GameRoom, player_id: str, last_seq: Optional[int]) -> Optional[list]:
+        """
+        Oyuncunun last_seq'ten sonra kaçırdığı olaylar; yalnızca ona giden
+        (herkese açık ya da to=player_id) ve onu hariç tutmayan olaylar döner.
+        Returns: Olay listesi; imleç günlükte yoksa ya da oyuncuya giden bir olay
+        günlüğe sığmadıysa None (oda anlık görüntüsü kullanılmalı)
+        """
+        frames = room.journal.since(player_id, last_seq, room.event_seq)
+        if frames is None:
+            return None
+        return [json.loads(payload) for payload in frames]
     
     async def send_to_player(self, player_id: str, message: dict):
         """Belirli bir oyuncuya mesaj gönder"""
-        if player_id in self.connections:
-            try:
-                await self.connections[player_id].send(json.dumps(message))
-            except:
-                pass
+        outbox = self.outboxes.get(self.connections.get(player_id))
+        if outbox is not None:
+            outbox.send(json.dumps(message))
     
     async def handle_create_room(self, websocket, data: dict) -> dict:
         """Yeni oda oluştur"""
-        player_name = data.get("player_name", "Anonim")
+        player_name = data["player_name"]
         
         room_code = self.generate_room_code()
         player_id = self.generate_player_id()
@@ -219,8 +559,8 @@ class GameServer:
     
     async def handle_join_room(self, websocket, data: dict) -> dict:
         """Odaya katıl"""
-        room_code = data.get("room_code", "").upper()
-        player_name = data.get("player_name", "Anonim")
+        room_code = data["room_code"].upper()
+        player_name = data["player_name"]
         
         if room_code not in self.rooms:
             return {"type": "error", "message": "Oda bulunamadı"}
@@ -264,11 +604,8 @@ class GameServer:
     
     async def handle_select_province(self, websocket, data: dict) -> dict:
         """Eyalet seç"""
-        player_id = data.get("player_id")
-        province = data.get("province")
-        
-        if player_id not in self.player_room_map:
-            return {"type": "error", "message": "Oyuncu bulunamadı"}
+        player_id = data["player_id"]
+        province = data["province"]
         
         room_code = self.player_room_map[player_id]
         room = self.rooms[room_code]
@@ -292,11 +629,8 @@ class GameServer:
     
     async def handle_ready(self, websocket, data: dict) -> dict:
         """Hazır durumunu değiştir"""
-        player_id = data.get("player_id")
-        ready = data.get("ready", True)
-        
-        if player_id not in self.player_room_map:
-            return {"type": "error", "message": "Oyuncu bulunamadı"}
+        player_id = data["player_id"]
+        ready = data["ready"]
         
         room_code = self.player_room_map[player_id]
         room = self.rooms[room_code]
@@ -327,10 +661,7 @@ class GameServer:
     
     async def handle_start_game(self, websocket, data: dict) -> dict:
         """Oyunu başlat (sadece host)"""
-        player_id = data.get("player_id")
-        
-        if player_id not in self.player_room_map:
-            return {"type": "error", "message": "Oyuncu bulunamadı"}
+        player_id = data["player_id"]
         
         room_code = self.player_room_map[player_id]
         room = self.rooms[room_code]
@@ -363,11 +694,8 @@ class GameServer:
     
     async def handle_end_turn(self, websocket, data: dict) -> dict:
         """Turu bitir"""
-        player_id = data.get("player_id")
-        player_state = data.get("state", {})  # Oyuncunun güncel durumu
-        
-        if player_id not in self.player_room_map:
-            return {"type": "error", "message": "Oyuncu bulunamadı"}
+        player_id = data["player_id"]
+        player_state = data["state"]  # Oyuncunun güncel durumu
         
         room_code = self.player_room_map[player_id]
         room = self.rooms[room_code]
@@ -410,12 +738,9 @@ class GameServer:
     
     async def handle_diplomacy_action(self, websocket, data: dict) -> dict:
         """Diplomasi aksiyonu (ittifak, savaş, ticaret)"""
-        player_id = data.get("player_id")
-        action = data.get("action")  # "propose_alliance", "declare_war", "propose_trade"
-        target_id = data.get("target_id")
-        
-        if player_id not in self.player_room_map:
-            return {"type": "error", "message": "Oyuncu bulunamadı"}
+        player_id = data["player_id"]
+        action = data["diplomacy_action"]  # "propose_alliance", "declare_war", "propose_trade"...
+        target_id = data["target_id"]
         
         room_code = self.player_room_map[player_id]
         room = self.rooms[room_code]
@@ -428,11 +753,11 @@ class GameServer:
         
         if action == "propose_alliance":
             # İttifak teklifi
-            await self.send_to_player(target_id, {
+            self.publish(room, {
                 "type": "alliance_proposal",
                 "from_player": player.to_dict(),
                 "message": f"{player.name} ({player.province}) size ittifak teklif ediyor!"
-            })
+            }, to=target_id)
             return {"type": "success", "message": "İttifak teklifi gönderildi"}
         
         elif action == "declare_war":
@@ -498,12 +823,12 @@ class GameServer:
         
         elif action == "propose_trade":
             # Ticaret anlaşması teklifi
-            await self.send_to_player(target_id, {
+            self.publish(room, {
                 "type": "trade_proposal",
                 "from_player": player.to_dict(),
                 "from_player_id": player_id,
                 "message": f"{player.name} ({player.province}) ticaret anlaşması teklif ediyor!"
-            })
+            }, to=target_id)
             return {"type": "success", "message": "Ticaret teklifi gönderildi"}
         
         elif action == "accept_alliance":
@@ -524,11 +849,11 @@ class GameServer:
         
         elif action == "reject_alliance":
             # İttifak red
-            await self.send_to_player(target_id, {
+            self.publish(room, {
                 "type": "alliance_rejected",
                 "from_player": player.to_dict(),
                 "message": f"{player.name} ittifak teklifinizi reddetti."
-            })
+            }, to=target_id)
             return {"type": "success", "message": "İttifak reddedildi"}
         
         elif action == "accept_trade":
@@ -549,22 +874,19 @@ class GameServer:
         
         elif action == "reject_trade":
             # Ticaret red
-            await self.send_to_player(target_id, {
+            self.publish(room, {
                 "type": "trade_rejected",
                 "from_player": player.to_dict(),
                 "message": f"{player.name} ticaret teklifinizi reddetti."
-            })
+            }, to=target_id)
             return {"type": "success", "message": "Ticaret reddedildi"}
         
         return {"type": "error", "message": "Geçersiz aksiyon"}
     
     async def handle_chat(self, websocket, data: dict) -> dict:
         """Sohbet mesajı"""
-        player_id = data.get("player_id")
-        message = data.get("message", "")
-        
-        if player_id not in self.player_room_map:
-            return {"type": "error", "message": "Oyuncu bulunamadı"}
+        player_id = data["player_id"]
+        message = data["message"]
         
         room_code = self.player_room_map[player_id]
         room = self.rooms[room_code]
@@ -582,33 +904,60 @@ class GameServer:
     
     async def handle_update_state(self, websocket, data: dict) -> dict:
         """Oyuncu durumunu güncelle ve senkronize et"""
-        player_id = data.get("player_id")
-        new_state = data.get("state", {})
-        
-        if player_id not in self.player_room_map:
-            return {"type": "error", "message": "Oyuncu bulunamadı"}
+        player_id = data["player_id"]
+        new_state = data["state"]
         
         room_code = self.player_room_map[player_id]
         room = self.rooms[room_code]
         player = room.players[player_id]
         
-        # Durumu güncelle
+        # Durumu güncelle; fark sonraki tick'te diğer oyunculara gider
         player.game_state.update(new_state)
-        
-        # Diğer oyunculara bildir
-        await self.broadcast_to_room(room_code, {
-            "type": "player_state_updated",
-            "player_id": player_id,
-            "player": player.to_dict()
-        }, exclude_id=player_id)
+        room.pending_states.setdefault(player_id, {}).update(new_state)
+        self._schedule_state_tick(room)
         
         return {"type": "success"}
     
+    def _schedule_state_tick(self, room: GameRoom):
+        """
+        Odanın bekleyen durum farkları için tick planla.
+        Oda boştaysa hemen, değilse son yayından state_tick_interval sonra;
+        arada gelen tüm güncellemeler tek mesajda birleşir.
+        """
+        if room.state_flush_task is not None:
+            return
+        loop = asyncio.get_running_loop()
+        delay = max(0.0, room.last_state_flush + self.state_tick_interval - loop.time())
+        room.state_flush_task = asyncio.create_task(self._flush_state_tick(room, delay))
+    
+    async def _flush_state_tick(self, room: GameRoom, delay: float):
+        """Birikmiş durum farklarını tek yayınla gönder"""
+        if delay > 0:
+            await asyncio.sleep(delay)
+        room.state_flush_task = None
+        states, room.pending_states = room.pending_states, {}
+        if not states or self.rooms.get(room.code) is not room:
+            return
+        
+        room.last_state_flush = asyncio.get_running_loop().time()
+        room.state_tick += 1
+        # Gönderen de kendi farkını alır; mesaj herkese aynı kodlanır
+        await self.broadcast_to_room(room.code, {
+            "type": "players_state_updated",
+            "tick": room.state_tick,
+            "states": states
+        }, journal=False)  # Durumlar anlık görüntüde zaten var; günlüğe girmez
+    
     async def handle_reconnect(self, websocket, data: dict) -> dict:
-        """Oyuncu yeniden bağlanıyor"""
-        room_code = data.get("room_code", "").upper()
-        player_id = data.get("player_id")
-        reconnect_token = data.get("reconnect_token")
+        """
+        Oyuncu yeniden bağlanıyor.
+        Yanıttaki "events" bu oyuncuya göre süzülmüştür: başka oyunculara özel
+        olaylar ve onun kendi gönderdiği (hariç tutulduğu) olaylar yer almaz.
+        "reset" True ise kaçırılanlar günlükte yoktur; istemci "room" ile yenilenir.
+        """
+        room_code = data["room_code"].upper()
+        player_id = data["player_id"]
+        reconnect_token = data["reconnect_token"]
         
         if room_code not in self.rooms:
             return {"type": "error", "message": "Oda bulunamadı veya süresi dolmuş"}
@@ -635,6 +984,9 @@ class GameServer:
         
         print(f"[{datetime.now()}] {player.name} yeniden bağlandı: {room_code}")
         
+        # Kaçırılan olaylar (son bilinen sıra numarasından itibaren)
+        missed = self.events_since(room, player_id, data["last_seq"])
+        
         # Diğer oyunculara bildir
         await self.broadcast_to_room(room_code, {
             "type": "player_reconnected",
@@ -646,13 +998,13 @@ class GameServer:
             "type": "reconnected",
             "success": True,
             "player_id": player_id,
-            "room": room.to_dict()
+            "room": room.to_dict(),
+            "events": missed or [],  # Alıcıya göre süzülmüş (özel olaylar yalnızca sahibine)
+            "reset": missed is None
         }
     
-    def save_room_to_file(self, room_code: str) -> bool:
-        """Odayı dosyaya kaydet"""
-        import os
-        
+    async def save_room_to_file(self, room_code: str) -> bool:
+        """Odayı dosyaya kaydet (yazım olay döngüsünü bekletmez)"""
         if room_code not in self.rooms:
             return False
         
@@ -682,33 +1034,24 @@ class GameServer:
                 "game_state": player.game_state
             }
         
-        # Kayıt dizini oluştur
-        save_dir = os.path.join(os.path.dirname(__file__), "saved_rooms")
-        os.makedirs(save_dir, exist_ok=True)
-        
-        save_path = os.path.join(save_dir, f"{room_code}.json")
-        
         try:
-            with open(save_path, "w", encoding="utf-8") as f:
-                json.dump(save_data, f, ensure_ascii=False, indent=2)
-            print(f"[{datetime.now()}] Oda kaydedildi: {room_code}")
-            return True
-        except Exception as e:
+            saved = await self.room_store.save(room_code, save_data)
+        except (TypeError, ValueError) as e:
             print(f"[{datetime.now()}] Oda kaydetme hatası: {e}")
             return False
-    
-    def load_room_from_file(self, room_code: str) -> bool:
-        """Odayı dosyadan yükle"""
-        import os
-        
-        save_path = os.path.join(os.path.dirname(__file__), "saved_rooms", f"{room_code}.json")
-        
-        if not os.path.exists(save_path):
-            return False
         
+        if saved:
+            print(f"[{datetime.now()}] Oda kaydedildi: {room_code}")
+        return saved
+    
+    async def load_room_from_file(self, room_code: str) -> bool:
+        """Odayı dosyadan yükle (okuma olay döngüsünü bekletmez)"""
         try:
-            with open(save_path, "r", encoding="utf-8") as f:
-                save_data = json.load(f)
+            save_data = await self.room_store.load(room_code)
+            if save_data is None:
+                return False
+            if room_code in self.rooms:
+                return True  # Beklerken başka bir istek yükledi
             
             # Oyuncuları oluştur
             players = {}
@@ -747,10 +1090,7 @@ class GameServer:
     
     async def handle_save_room(self, websocket, data: dict) -> dict:
         """Odayı kaydet (sadece host)"""
-        player_id = data.get("player_id")
-        
-        if player_id not in self.player_room_map:
-            return {"type": "error", "message": "Oyuncu bulunamadı"}
+        player_id = data["player_id"]
         
         room_code = self.player_room_map[player_id]
         room = self.rooms[room_code]
@@ -759,26 +1099,33 @@ class GameServer:
         if room.host_id != player_id:
             return {"type": "error", "message": "Sadece host odayı kaydedebilir"}
         
-        if self.save_room_to_file(room_code):
+        # Yazımı bekleme; sonuç yazım bitince yayınlanır
+        task = asyncio.create_task(self._save_and_announce(room_code, player_id))
+        self.background_tasks.add(task)
+        task.add_done_callback(self.background_tasks.discard)
+        return {"type": "success", "message": f"Oda kaydediliyor: {room_code}"}
+    
+    async def _save_and_announce(self, room_code: str, player_id: str):
+        """Odayı kaydet ve sonucu bildir"""
+        if await self.save_room_to_file(room_code):
             # Herkese bildir
             await self.broadcast_to_room(room_code, {
                 "type": "room_saved",
                 "room_code": room_code,
                 "message": f"Oda kaydedildi: {room_code}"
             })
-            return {"type": "success", "message": f"Oda kaydedildi: {room_code}"}
         else:
-            return {"type": "error", "message": "Oda kaydedilemedi"}
+            await self.send_to_player(player_id, {"type": "error", "message": "Oda kaydedilemedi"})
     
     async def handle_load_room(self, websocket, data: dict) -> dict:
         """Kaydedilmiş odayı yükle"""
-        room_code = data.get("room_code", "").upper()
-        player_name = data.get("player_name", "Anonim")
+        room_code = data["room_code"].upper()
+        player_name = data["player_name"]
         
         if room_code in self.rooms:
             return {"type": "error", "message": "Bu oda zaten aktif"}
         
-        if not self.load_room_from_file(room_code):
+        if not await self.load_room_from_file(room_code):
             return {"type": "error", "message": "Kaydedilmiş oda bulunamadı"}
         
         return {
@@ -789,6 +1136,21 @@ class GameServer:
             "message": f"Oda yüklendi: {room_code}. Oyuncular yeniden bağlanabilir."
         }
     
+    async def handle_ping(self, websocket, data: dict) -> dict:
+        """Bağlantı kontrolü"""
+        return {"type": "pong"}
+    
+    async def handle_stats(self, websocket, data: dict) -> dict:
+        """Aksiyon başına çağrı ve süre sayaçları (en pahalı önce)"""
+        ordered = sorted(self.actions.items(), key=lambda item: item[1].stats.total_seconds, reverse=True)
+        return {
+            "type": "stats",
+            "actions": {name: route.stats.to_dict() for name, route in ordered},
+            "unknown_actions": self.unknown_actions,
+            "rooms": len(self.rooms),
+            "connections": len(self.outboxes)
+        }
+    
     async def handle_disconnect(self, player_id: str):
         """Oyuncu bağlantısı koptuğunda"""
         if player_id not in self.player_room_map:
@@ -817,69 +1179,29 @@ class GameServer:
         
         # Eğer herkes çıktıysa odayı sil
         if all(not p.connected for p in room.players.values()):
+            if room.state_flush_task is not None:
+                room.state_flush_task.cancel()
             del self.rooms[room_code]
             print(f"[{datetime.now()}] Oda silindi: {room_code}")
     
     async def handler(self, websocket):
         """Ana WebSocket handler"""
         player_id = None
+        outbox = self.outboxes[websocket] = ConnectionOutbox(websocket)
         
         try:
             async for message in websocket:
                 try:
                     data = json.loads(message)
-                    action = data.get("action", "")
-                    
-                    if action == "create_room":
-                        response = await self.handle_create_room(websocket, data)
-                        player_id = response.get("player_id")
-                    
-                    elif action == "join_room":
-                        response = await self.handle_join_room(websocket, data)
+                    route, response = await self.dispatch(websocket, data)
+                    if route is not None and route.binds_player and response.get("success"):
                         player_id = response.get("player_id")
                     
-                    elif action == "select_province":
-                        response = await self.handle_select_province(websocket, data)
-                    
-                    elif action == "ready":
-                        response = await self.handle_ready(websocket, data)
-                    
-                    elif action == "start_game":
-                        response = await self.handle_start_game(websocket, data)
-                    
-                    elif action == "end_turn":
-                        response = await self.handle_end_turn(websocket, data)
-                    
-                    elif action == "diplomacy":
-                        response = await self.handle_diplomacy_action(websocket, data)
-                    
-                    elif action == "chat":
-                        response = await self.handle_chat(websocket, data)
-                    
-                    elif action == "update_state":
-                        response = await self.handle_update_state(websocket, data)
-                    
-                    elif action == "reconnect":
-                        response = await self.handle_reconnect(websocket, data)
-                        if response.get("success"):
-                            player_id = response.get("player_id")
-                    
-                    elif action == "save_room":
-                        response = await self.handle_save_room(websocket, data)
-                    
-                    elif action == "load_room":
-                        response = await self.handle_load_room(websocket, data)
-                    
-                    elif action == "ping":
-                        response = {"type": "pong"}
-                    
-                    else:
-                        response = {"type": "error", "message": f"Bilinmeyen aksiyon: {action}"}
-                    
-                    await websocket.send(json.dumps(response))
+                    # Yanıt da aynı kuyruktan gider; yayınlarla sırası korunur
+                    outbox.send(json.dumps(response))
                     
                 except json.JSONDecodeError:
-                    await websocket.send(json.dumps({"type": "error", "message": "Geçersiz JSON"}))
+                    outbox.send(json.dumps({"type": "error", "message": "Geçersiz JSON"}))
                     
         except websockets.exceptions.ConnectionClosed:
             pass
@@ -890,6 +1212,8 @@ class GameServer:
                     del self.connections[player_id]
                 if player_id in self.player_room_map:
                     del self.player_room_map[player_id]
+            outbox.close()
+            self.outboxes.pop(websocket, None)
     
     async def start(self):
         """Sunucuyu başlat"""
@@ -913,9 +1237,11 @@ def main():
     parser = argparse.ArgumentParser(description='Osmanlı Oyunu Sunucusu')
     parser.add_argument('--host', default='0.0.0.0', help='Sunucu adresi')
     parser.add_argument('--port', type=int, default=8765, help='Port numarası')
+    parser.add_argument('--tick-hz', type=float, default=STATE_TICK_HZ,
+                        help='Durum güncellemesi yayın sıklığı (oda başına, Hz)')
     args = parser.parse_args()
     
-    server = GameServer(host=args.host, port=args.port)
+    server = GameServer(host=args.host, port=args.port, state_tick_hz=args.tick_hz)
     asyncio.run(server.start())
 
 
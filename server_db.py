@@ -2,118 +2,234 @@
 """
 Osmanlı Eyalet Yönetim Simülasyonu - SQLite Oda Persistence
 Sunucu kapanırsa veri kaybını önler
+
+Yazımlar istek yolunda yapılmaz: sunucu değişen odaları RoomPersister ile
+"kirli" olarak işaretler, arka plan iş parçacığı bunları sabit aralıklarla
+tek bir transaction içinde toplu yazar (write-behind). Veritabanı bağlantısı
+uzun ömürlüdür ve WAL kipinde açılır.
+
+Veritabanı yolu OES_ROOM_DB ortam değişkeniyle değiştirilebilir (ör. yük
+testlerinde gerçek oda veritabanına dokunmamak için).
 """
 
 import sqlite3
 import json
 import os
+import threading
+import time
+from contextlib import nullcontext
 from datetime import datetime
+from typing import Callable, ContextManager, Dict, Iterable, Optional
+
+FLUSH_INTERVAL_SECONDS = 2.0  # Kirli odaların yazılma aralığı
+ROOM_DB_ENV = 'OES_ROOM_DB'   # Varsayılan veritabanı yolunu değiştiren ortam değişkeni
+
+_UPSERT_SQL = '''
+    INSERT INTO rooms (code, data, created_at, updated_at, game_started)
+    VALUES (?, ?, ?, ?, ?)
+    ON CONFLICT(code) DO UPDATE SET
+        data = excluded.data,
+        updated_at = excluded.updated_at,
+        game_started = excluded.game_started
+'''
+
+
+def _room_row(code: str, room_data: dict, now: str) -> tuple:
+    """Oda verisinden upsert satırı oluştur"""
+    data_json = json.dumps(room_data, ensure_ascii=False, default=str)
+    game_started = 1 if room_data.get('game_started') else 0
+    return (code, data_json, now, now, game_started)
 
 
 class RoomDatabase:
-    """SQLite tabanlı oda veritabanı"""
-    
+    """SQLite tabanlı oda veritabanı (tek, paylaşılan WAL bağlantısı)"""
+
     def __init__(self, db_path: str = None):
         if db_path is None:
+            db_path = os.environ.get(ROOM_DB_ENV)
+        if not db_path:
             base = os.path.dirname(os.path.abspath(__file__))
             db_path = os.path.join(base, 'server_rooms.db')
-        
+
         self.db_path = db_path
+        self._lock = threading.Lock()  # Bağlantı iş parçacıkları arasında paylaşılır
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
         self._init_db()
-    
+
     def _init_db(self):
         """Veritabanı ve tabloları oluştur"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS rooms (
-                code TEXT PRIMARY KEY,
-                data TEXT NOT NULL,
-                created_at TEXT NOT NULL,
-                updated_at TEXT NOT NULL,
-                game_started INTEGER DEFAULT 0
-            )
-        ''')
-        
-        conn.commit()
-        conn.close()
-    
+        with self._lock:
+            self._conn.execute('''
+                CREATE TABLE IF NOT EXISTS rooms (
+                    code TEXT PRIMARY KEY,
+                    data TEXT NOT NULL,
+                    created_at TEXT NOT NULL,
+                    updated_at TEXT NOT NULL,
+                    game_started INTEGER DEFAULT 0
+                )
+            ''')
+            self._conn.commit()
+
+    def write_batch(self, rows: Iterable[tuple], deleted: Iterable[str] = ()):
+        """
+        Hazır satırları (bkz. _room_row) ve silinen odaları tek transaction'da yaz.
+        """
+        with self._lock:
+            with self._conn:
+                self._conn.executemany(_UPSERT_SQL, rows)
+                self._conn.executemany('DELETE FROM rooms WHERE code = ?',
+                                       [(code,) for code in deleted])
+
     def save_room(self, code: str, room_data: dict):
         """Odayı kaydet veya güncelle"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        now = datetime.now().isoformat()
-        data_json = json.dumps(room_data, ensure_ascii=False, default=str)
-        game_started = 1 if room_data.get('game_started') else 0
-        
-        cursor.execute('''
-            INSERT OR REPLACE INTO rooms (code, data, created_at, updated_at, game_started)
-            VALUES (?, ?, COALESCE((SELECT created_at FROM rooms WHERE code = ?), ?), ?, ?)
-        ''', (code, data_json, code, now, now, game_started))
-        
-        conn.commit()
-        conn.close()
-    
+        self.write_batch([_room_row(code, room_data, datetime.now().isoformat())])
+
     def load_rooms(self) -> dict:
         """Tüm odaları yükle"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute('SELECT code, data FROM rooms')
-        rows = cursor.fetchall()
-        conn.close()
-        
+        with self._lock:
+            rows = self._conn.execute('SELECT code, data FROM rooms').fetchall()
+
         rooms = {}
         for code, data_json in rows:
             try:
                 rooms[code] = json.loads(data_json)
             except (json.JSONDecodeError, TypeError):
                 pass
-        
+
         return rooms
-    
+
     def delete_room(self, code: str):
         """Odayı sil"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute('DELETE FROM rooms WHERE code = ?', (code,))
-        conn.commit()
-        conn.close()
-    
+        self.write_batch([], [code])
+
     def save_all(self, rooms: dict):
         """Tüm odaları toplu kaydet"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
         now = datetime.now().isoformat()
-        
-        for code, room_data in rooms.items():
-            data_json = json.dumps(room_data, ensure_ascii=False, default=str)
-            game_started = 1 if room_data.get('game_started') else 0
-            
-            cursor.execute('''
-                INSERT OR REPLACE INTO rooms (code, data, created_at, updated_at, game_started)
-                VALUES (?, ?, COALESCE((SELECT created_at FROM rooms WHERE code = ?), ?), ?, ?)
-            ''', (code, data_json, code, now, now, game_started))
-        
-        conn.commit()
-        conn.close()
-    
+        self.write_batch([_room_row(code, room_data, now)
+                          for code, room_data in rooms.items()])
+
     def cleanup_old_rooms(self, hours: int = 24):
         """Eski odaları temizle"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
         cutoff = datetime.now().isoformat()
-        cursor.execute('''
-            DELETE FROM rooms 
-            WHERE updated_at < datetime(?, '-' || ? || ' hours')
-        ''', (cutoff, hours))
-        
-        deleted = cursor.rowcount
-        conn.commit()
-        conn.close()
-        
-        return deleted
+        with self._lock:
+            with self._conn:
+                cursor = self._conn.execute('''
+                    DELETE FROM rooms
+                    WHERE updated_at < datetime(?, '-' || ? || ' hours')
+                ''', (cutoff, hours))
+
+        return cursor.rowcount
+
+    def close(self):
+        """Bağlantıyı kapat"""
+        with self._lock:
+            self._conn.close()
+
+
+class RoomPersister:
+    """
+    Write-behind oda kaydedici.
+    mark_dirty/mark_deleted yalnızca küme günceller; serileştirme ve SQLite
+    yazımı arka plan iş parçacığında, FLUSH_INTERVAL_SECONDS aralıkla yapılır.
+    room_lock verilirse her oda kendi kilidi altında serileştirilir.
+    on_flush(oda_sayısı, saniye) her başarılı toplu yazımdan sonra çağrılır.
+    """
+
+    def __init__(self, db: RoomDatabase, get_room: Callable[[str], Optional[dict]],
+                 interval: float = FLUSH_INTERVAL_SECONDS,
+                 room_lock: Optional[Callable[[str], ContextManager]] = None,
+                 on_flush: Optional[Callable[[int, float], None]] = None):
+        self.db = db
+        self.get_room = get_room
+        self.room_lock = room_lock
+        self.on_flush = on_flush
+        self.interval = interval
+        self._dirty = set()
+        self._deleted = set()
+        self._lock = threading.Lock()        # Kirli kümeler
+        self._flush_lock = threading.Lock()  # Aynı anda tek flush
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        """Arka plan flush iş parçacığını başlat"""
+        if self._thread is None or not self._thread.is_alive():
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self._run, name="RoomPersister", daemon=True
+            )
+            self._thread.start()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.flush()
+
+    def mark_dirty(self, code: str):
+        """Odayı sonraki flush'ta yazılmak üzere işaretle"""
+        with self._lock:
+            self._deleted.discard(code)
+            self._dirty.add(code)
+
+    def mark_deleted(self, code: str):
+        """Odayı sonraki flush'ta silinmek üzere işaretle"""
+        with self._lock:
+            self._dirty.discard(code)
+            self._deleted.add(code)
+
+    def pending(self) -> int:
+        """Yazılmayı bekleyen oda sayısı"""
+        with self._lock:
+            return len(self._dirty) + len(self._deleted)
+
+    def flush(self) -> int:
+        """
+        Bekleyen değişiklikleri tek transaction'da yaz.
+        Returns: Yazılan/silinen oda sayısı
+        """
+        with self._flush_lock:
+            with self._lock:
+                dirty, self._dirty = self._dirty, set()
+                deleted, self._deleted = self._deleted, set()
+            if not dirty and not deleted:
+                return 0
+
+            now = datetime.now().isoformat()
+            rows, retry = [], []
+            for code in dirty:
+                with self.room_lock(code) if self.room_lock else nullcontext():
+                    room = self.get_room(code)
+                    if room is None:
+                        continue
+                    try:
+                        rows.append(_room_row(code, room, now))
+                    except RuntimeError:
+                        # Oda serileştirilirken değişti; sonraki turda tekrar dene
+                        retry.append(code)
+
+            try:
+                started = time.perf_counter()
+                self.db.write_batch(rows, deleted)
+                if self.on_flush:
+                    self.on_flush(len(rows) + len(deleted), time.perf_counter() - started)
+            except Exception as e:
+                print(f"[DB] Toplu kaydetme hatası: {e}")
+                retry.extend(row[0] for row in rows)
+                with self._lock:
+                    self._deleted.update(deleted - self._dirty)
+
+            for code in retry:
+                with self._lock:
+                    if code not in self._deleted:
+                        self._dirty.add(code)
+
+            return len(rows) + len(deleted)
+
+    def stop(self):
+        """İş parçacığını durdur ve kalan değişiklikleri yaz"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self.flush()
@@ -11,18 +11,28 @@ Kullanım:
     python server_http.py --port 5000 --production   (waitress ile)
 """
 
-from flask import Flask, jsonify, request
+from flask import Flask, g, jsonify, request
 from flask_cors import CORS
 import random
 import string
 import uuid
 from datetime import datetime, timedelta
 import argparse
+import gzip
+import hashlib
+import heapq
+import itertools
 import json
 import time
 import threading
 import atexit
-from collections import defaultdict
+from contextlib import contextmanager
+from functools import wraps
+import signal
+import sys
+from collections import OrderedDict, deque
+from server_metrics import MetricsRegistry, PROMETHEUS_CONTENT_TYPE
+from server_journal import JOURNAL_MAX_EVENTS
 
 app = Flask(__name__)
 CORS(app)  # Cross-origin isteklere izin ver
@@ -35,48 +45,116 @@ MAX_PLAYERS_PER_ROOM = 10
 MAX_NAME_LENGTH = 30
 MAX_CHAT_LENGTH = 200
 MAX_CHAT_HISTORY = 50
-RATE_LIMIT_PER_MINUTE = 120       # IP başına dakikada max istek
+RATE_LIMIT_PER_MINUTE = 120       # IP başına dakikada max yazma (POST) isteği
+POLL_RATE_LIMIT_PER_MINUTE = 300  # IP başına dakikada max okuma (GET) isteği
+ACTION_RATE_LIMIT_PER_MINUTE = 120  # IP başına dakikada max tur/savaş eylemi
+CHAT_RATE_LIMIT_PER_MINUTE = 20   # IP başına dakikada max sohbet mesajı
+LONG_POLL_MAX_WAIT_SECONDS = 25   # GET /room/<code>?wait= için üst sınır
+LONG_POLL_THREAD_SHARE = 0.5      # --threads'in en fazla bu oranı long-poll'da bekler
+DEFAULT_THREADS = 32              # --threads varsayılanı (waitress iş parçacığı)
+GZIP_MIN_BYTES = 1024             # Bundan küçük yanıtlar sıkıştırılmaz
 ROOM_CREATE_LIMIT_PER_MINUTE = 5  # Oda oluşturma sınırı
 
+# ========== METRİKLER ==========
+
+metrics = MetricsRegistry()
+HTTP_REQUESTS = metrics.counter(
+    'oes_http_requests_total', 'Rota, yöntem ve duruma göre HTTP istekleri',
+    ('route', 'method', 'status'))
+HTTP_LATENCY = metrics.histogram(
+    'oes_http_request_duration_seconds', 'Rota başına istek süresi (long-poll ayrı)',
+    ('route',))
+HTTP_RESPONSE_BYTES = metrics.counter(
+    'oes_http_response_bytes_total', 'Rota başına gönderilen yanıt gövdesi baytı',
+    ('route',))
+RATE_LIMITED = metrics.counter(
+    'oes_rate_limited_total', 'Hız sınırına takılan istekler', ('budget',))
+ROOM_POLLS = metrics.counter(
+    'oes_room_polls_total', 'Oda polling sonuçları (not_modified=304, full=gövde)',
+    ('result',))
+LONG_POLL_WAITERS = metrics.gauge(
+    'oes_long_poll_waiters', 'Şu anda değişiklik bekleyen long-poll istekleri')
+LONG_POLL_REJECTED = metrics.counter(
+    'oes_long_poll_rejected_total', 'Bekleyen sınırı dolu olduğu için hemen 304 alan long-poll\'lar')
+PAYLOAD_CACHE = metrics.counter(
+    'oes_room_payload_cache_total', 'Oda yanıt önbelleği isabetleri', ('result',))
+ACTIVE_ROOMS = metrics.gauge('oes_active_rooms', 'Bellekteki oda sayısı')
+ACTIVE_PLAYERS = metrics.gauge('oes_active_players', 'Odalardaki oyuncu sayısı')
+ACTIVE_GAMES = metrics.gauge('oes_active_games', 'Oyunu başlamış oda sayısı')
+DB_FLUSH_LATENCY = metrics.histogram(
+    'oes_db_flush_duration_seconds', 'Toplu SQLite yazım süresi')
+DB_FLUSH_BATCH = metrics.histogram(
+    'oes_db_flush_batch_rooms', 'Toplu yazım başına oda sayısı',
+    buckets=(1, 2, 5, 10, 25, 50, 100, 250, 500, 1000))
+DB_PENDING = metrics.gauge('oes_db_pending_rooms', 'Yazılmayı bekleyen kirli oda sayısı')
+
+
+def _observe_flush(count: int, seconds: float):
+    """RoomPersister geri çağırması"""
+    DB_FLUSH_LATENCY.observe(seconds)
+    DB_FLUSH_BATCH.observe(count)
+
+
+@app.before_request
+def _start_request_timer():
+    g.request_started = time.perf_counter()
+
+
+@app.after_request
+def _record_request_metrics(response):
+    """Rota başına sayaç, süre ve bayt metrikleri"""
+    route = request.url_rule.rule if request.url_rule else 'unmatched'
+    if request.args.get('wait'):
+        route += '?wait'
+    HTTP_REQUESTS.inc(route=route, method=request.method, status=response.status_code)
+    HTTP_RESPONSE_BYTES.inc(response.content_length or 0, route=route)
+    started = g.get('request_started')
+    if started is not None:
+        HTTP_LATENCY.observe(time.perf_counter() - started, route=route)
+    return response
+
+
 # ========== VERİ DEPOSU ==========
 
 try:
-    from server_db import RoomDatabase
+    from server_db import RoomDatabase, RoomPersister
     _db = RoomDatabase()
     rooms = _db.load_rooms()
     if rooms:
         print(f"[DB] {len(rooms)} oda veritabanından yüklendi")
     else:
         rooms = {}
+    # Write-behind: istekler yalnızca odayı kirli işaretler, yazım arka planda
+    _persister = RoomPersister(_db, rooms.get,
+                               room_lock=lambda code: room_locked(code),
+                               on_flush=_observe_flush)
+    _persister.start()
 except Exception as e:
     print(f"[DB] Veritabanı yüklenemedi: {e}")
     _db = None
+    _persister = None
     rooms = {}
 
 
 def _save_room(code: str):
-    """Odayı veritabanına kaydet"""
-    if _db and code in rooms:
-        try:
-            _db.save_room(code, rooms[code])
-        except Exception:
-            pass
+    """Odayı sonraki toplu yazımda kaydedilmek üzere işaretle"""
+    if _persister:
+        _persister.mark_dirty(code)
 
 
 def _delete_room_db(code: str):
-    """Odayı veritabanından sil"""
-    if _db:
-        try:
-            _db.delete_room(code)
-        except Exception:
-            pass
+    """Odayı sonraki toplu yazımda silinmek üzere işaretle"""
+    if _persister:
+        _persister.mark_deleted(code)
 
 
 def _save_all_rooms():
     """Tüm odaları kaydet (kapanırken)"""
-    if _db and rooms:
+    if _persister:
         try:
-            _db.save_all(rooms)
+            for code in list(rooms):
+                _persister.mark_dirty(code)
+            _persister.stop()
             print(f"[DB] {len(rooms)} oda kaydedildi")
         except Exception as e:
             print(f"[DB] Kaydetme hatası: {e}")
@@ -84,61 +162,100 @@ def _save_all_rooms():
 
 atexit.register(_save_all_rooms)
 
-
-@app.after_request
-def auto_save_room(response):
-    """POST isteklerinden sonra ilgili odayı otomatik kaydet"""
-    if request.method == 'POST' and response.status_code == 200:
-        # URL'den oda kodunu çıkar
-        path = request.path
-        if path.startswith('/room/') and '/' in path[6:]:
-            code = path.split('/')[2]
-            if code in rooms:
-                _save_room(code)
-        elif path == '/room/create':
-            # Yeni oda oluşturuldu — response'dan kodu al
-            try:
-                data = response.get_json()
-                if data and data.get('room_code'):
-                    _save_room(data['room_code'])
-            except Exception:
-                pass
-    return response
-
 # ========== RATE LIMITING ==========
 
-_rate_counters = defaultdict(list)   # IP -> [timestamp, ...]
-_create_counters = defaultdict(list)  # IP -> [timestamp, ...]
-
-
-def _check_rate_limit(ip: str, limit: int = RATE_LIMIT_PER_MINUTE,
-                      counter: dict = None) -> bool:
-    """IP bazlı rate limit kontrolü. True=izin ver, False=engelle."""
-    if counter is None:
-        counter = _rate_counters
-    
-    now = time.time()
-    cutoff = now - 60
-    
-    # Eski kayıtları temizle
-    counter[ip] = [t for t in counter[ip] if t > cutoff]
-    
-    if len(counter[ip]) >= limit:
-        return False
-    
-    counter[ip].append(now)
-    return True
+class TokenBucketLimiter:
+    """
+    Anahtar (IP) başına token bucket.
+    Her anahtar dakikada per_minute jeton kazanır, en fazla per_minute biriktirir.
+    İstek başına maliyet O(1); dolmaya yetecek kadar boşta kalan anahtarlar
+    (kovası zaten dolu olanlar) silinir, bellek aktif IP sayısıyla sınırlı kalır.
+    """
+    
+    def __init__(self, per_minute: int):
+        self.capacity = float(per_minute)
+        self.rate = per_minute / 60.0  # saniyede jeton
+        self.idle_seconds = self.capacity / self.rate
+        self._buckets = OrderedDict()  # anahtar -> [jeton, son_erişim]; en eski başta
+        self._lock = threading.Lock()
+    
+    def allow(self, key: str) -> bool:
+        """Bir jeton harca. True=izin ver, False=engelle."""
+        now = time.monotonic()
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = self._buckets[key] = [self.capacity, now]
+            else:
+                bucket[0] = min(self.capacity, bucket[0] + (now - bucket[1]) * self.rate)
+                bucket[1] = now
+                self._buckets.move_to_end(key)
+            
+            allowed = bucket[0] >= 1.0
+            if allowed:
+                bucket[0] -= 1.0
+            
+            self._evict_idle(now)
+            return allowed
+    
+    def _evict_idle(self, now: float):
+        """Boşta kalan anahtarları baştan sil (sıra son erişime göre)"""
+        while self._buckets:
+            key, (tokens, last) = next(iter(self._buckets.items()))
+            if now - last < self.idle_seconds:
+                break
+            del self._buckets[key]
+    
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+
+# Hız bütçeleri: her bütçenin IP başına ayrı kovası vardır. Ucuz ama
+# spama açık sohbetin bütçesi daha dardır ve tur/savaş eylemlerinden ayrıdır;
+# sohbet seli oyuncunun tur bitirmesini ya da saldırısını engellemez.
+_rate_limiters = {
+    'read': TokenBucketLimiter(POLL_RATE_LIMIT_PER_MINUTE),
+    'write': TokenBucketLimiter(RATE_LIMIT_PER_MINUTE),
+    'action': TokenBucketLimiter(ACTION_RATE_LIMIT_PER_MINUTE),
+    'chat': TokenBucketLimiter(CHAT_RATE_LIMIT_PER_MINUTE),
+    'create': TokenBucketLimiter(ROOM_CREATE_LIMIT_PER_MINUTE),
+}
+
+# Rota (endpoint) -> bütçe. Tabloda olmayan rotalar yönteme göre
+# 'read' (GET/HEAD/OPTIONS) ya da 'write' bütçesinden harcar.
+ROUTE_BUDGETS = {
+    'create_room': 'create',
+    'send_chat': 'chat',
+    'end_turn': 'action',
+    'attack_player': 'action',
+    'sync_player_state': 'action',
+}
+RATE_LIMIT_MESSAGES = {
+    'create': 'Çok fazla oda oluşturma denemesi. Lütfen bekleyin.',
+    'chat': 'Çok hızlı mesaj gönderiyorsunuz. Lütfen bekleyin.',
+}
+
+
+def rate_limit_budget() -> str:
+    """Geçerli isteğin harcadığı hız bütçesi"""
+    endpoint = request.url_rule.endpoint if request.url_rule else None
+    budget = ROUTE_BUDGETS.get(endpoint)
+    if budget:
+        return budget
+    return 'read' if request.method in ('GET', 'HEAD', 'OPTIONS') else 'write'
 
 
 @app.before_request
 def rate_limit_check():
     """Her istek öncesi rate limit kontrolü"""
     ip = request.remote_addr or "unknown"
+    budget = rate_limit_budget()
     
-    if not _check_rate_limit(ip):
+    if not _rate_limiters[budget].allow(ip):
+        RATE_LIMITED.inc(budget=budget)
         return jsonify({
             'success': False,
-            'error': 'Çok fazla istek. Lütfen bekleyin.'
+            'error': RATE_LIMIT_MESSAGES.get(budget, 'Çok fazla istek. Lütfen bekleyin.')
         }), 429
 
 
@@ -212,45 +329,491 @@ def now_iso():
     return datetime.now().isoformat()
 
 
+# ========== ODA KİLİTLERİ ==========
+
+# Her odanın kendi kilidi vardır: farklı odaların istekleri paralel çalışır,
+# aynı odanın istekleri sırayla işlenir. rooms sözlüğüne ekleme/silme ve
+# kilit kaydı _room_locks_guard altında yapılır.
+_room_locks = {}
+_room_locks_guard = threading.Lock()
+
+# Oda değişikliği bildirimi: her odanın kendi koşulu vardır, bir odadaki
+# değişiklik yalnızca o odayı bekleyen long-poll'ları uyandırır. Koşul ilk
+# bekleyen geldiğinde oluşturulur ve oda kaldırılınca kilidiyle birlikte silinir.
+_room_conditions = {}
+
+
+def acquire_room_lock(code: str):
+    """
+    Odanın kilidini al. Oda yoksa (veya beklerken silindiyse) None döner.
+    Dönen kilit çağıran tarafından release edilmelidir.
+    """
+    while True:
+        with _room_locks_guard:
+            lock = _room_locks.get(code)
+            if lock is None:
+                if code not in rooms:
+                    return None
+                lock = _room_locks[code] = threading.RLock()
+        lock.acquire()
+        # Beklerken oda silinmiş/yeniden oluşturulmuş olabilir
+        if _room_locks.get(code) is lock:
+            return lock
+        lock.release()
+
+
+@contextmanager
+def room_locked(code: str):
+    """Oda kilidi altında çalış; oda yoksa None verir"""
+    lock = acquire_room_lock(code)
+    if lock is None:
+        yield None
+        return
+    try:
+        yield rooms.get(code)
+    finally:
+        lock.release()
+
+
+def with_room_lock(view):
+    """/room/<code>/... işleyicisini oda kilidi altında çalıştır"""
+    @wraps(view)
+    def wrapper(code, *args, **kwargs):
+        with room_locked(code) as room:
+            if room is None:
+                return jsonify({'success': False, 'error': 'Oda bulunamadı'}), 404
+            return view(code, *args, **kwargs)
+    return wrapper
+
+
+def add_room(room: dict) -> str:
+    """Odaya benzersiz kod ver ve kayıt defterine ekle"""
+    with _room_locks_guard:
+        room['code'] = generate_room_code()
+        rooms[room['code']] = room
+    ACTIVE_ROOMS.inc()
+    ACTIVE_PLAYERS.inc(len(room['players']))
+    return room['code']
+
+
+def remove_room(code: str):
+    """Odayı ve kilidini kaldır (oda kilidi tutulurken çağrılır)"""
+    with _room_locks_guard:
+        room = rooms.pop(code, None)
+        _room_locks.pop(code, None)
+        condition = _room_conditions.pop(code, None)
+    if condition is not None:
+        # Bekleyenler odanın silindiğini görüp 404 dönsün
+        with condition:
+            condition.notify_all()
+    if room is not None:
+        ACTIVE_ROOMS.dec()
+        ACTIVE_PLAYERS.dec(len(room['players']))
+        if room.get('game_started'):
+            ACTIVE_GAMES.dec()
+    for part in ('full', 'core'):
+        _room_payloads.pop((code, part), None)
+    _journals.pop(code, None)
+    _delete_room_db(code)
+
+
+# ========== ODA SÜRÜMLERİ ==========
+
+# Sunucu açılış kimliği: yeniden başlatmadan sonra eski ETag'ler geçersiz olur
+# (kaydedilmemiş sürüm artışları geri alınmış olabilir)
+SERVER_BOOT_ID = uuid.uuid4().hex[:8]
+
+# Odanın ayrı sürümlenen bölümleri (GET /room/<code>/core, /chat, /diplomacy,
+# /player/<id>/state). 'state' oyuncu başına sürümlenir.
+ROOM_SECTIONS = ('core', 'chat', 'diplomacy', 'state')
+COLD_ROOM_KEYS = ('chat', 'diplomacy', 'player_states')
+# Başka bölümler değişince de artan sürüm alanları: çekirdek gövdesinde yer
+# almazlar, X-Room-Versions başlığıyla gönderilirler (bkz. room_versions)
+ROOM_VERSION_KEYS = ('version', 'section_versions', 'state_versions', 'event_seq', 'chat_seq')
+
+
+def touch_room(room: dict, *sections: str, player_id: str = None):
+    """
+    Oda içeriği değiştiğinde sürümü artır, odayı kaydedilecek olarak işaretle
+    ve bekleyen long-poll'ları uyandır.
+    sections değişen bölümleri belirtir (varsayılan 'core'); her bölümün
+    sürümü, son değiştiği andaki oda sürümüdür. 'state' için player_id gerekir.
+    last_seen gibi her polling'de değişen alanlar sürümü artırmaz.
+    """
+    room['version'] = room.get('version', 0) + 1
+    section_versions = room.setdefault('section_versions', {})
+    for section in sections or ('core',):
+        if section == 'state':
+            room.setdefault('state_versions', {})[player_id] = room['version']
+        else:
+            section_versions[section] = room['version']
+    _save_room(room['code'])
+    condition = _room_conditions.get(room['code'])
+    if condition is not None:
+        with condition:
+            condition.notify_all()
+
+
+def _room_condition(code: str):
+    """Odanın değişiklik koşulu (yoksa oluşturulur); oda yoksa None"""
+    with _room_locks_guard:
+        condition = _room_conditions.get(code)
+        if condition is None and code in rooms:
+            condition = _room_conditions[code] = threading.Condition()
+        return condition
+
+
+def wait_for_room_change(code: str, version: int, timeout: float) -> bool:
+    """
+    Oda sürümü değişene (veya oda silinene) kadar en fazla timeout saniye bekle.
+    Yalnızca bu odanın koşulunda bekler; diğer odaların değişiklikleri uyandırmaz.
+    Returns: Değişiklik olduysa True
+    """
+    def changed():
+        room = rooms.get(code)
+        return room is None or room.get('version', 0) != version
+    
+    condition = _room_condition(code)
+    if condition is None:
+        return True
+    with condition:
+        return condition.wait_for(changed, timeout)
+
+
+# ========== LONG-POLL KAPASİTESİ ==========
+
+# Her long-poll bekleyişi bir waitress iş parçacığını LONG_POLL_MAX_WAIT_SECONDS'e
+# kadar tutar. Havuzun tamamı bekleyişlere gitmesin diye eşzamanlı bekleyen
+# sayısı --threads * LONG_POLL_THREAD_SHARE ile sınırlıdır (varsayılan 32
+# iş parçacığında 16); kalan iş parçacıkları yazma ve normal okuma isteklerine
+# kalır. Sınır doluyken gelen long-poll beklemeden 304 alır; yanıtta
+# X-Long-Poll başlığı olmadığından istemci o tur aralıklı polling'e düşer.
+# --threads artırılırsa bekleyen sınırı da orantılı büyür.
+
+
+def long_poll_capacity(threads: int) -> int:
+    """threads iş parçacıklı havuzda aynı anda bekleyebilecek long-poll sayısı"""
+    return max(1, int(threads * LONG_POLL_THREAD_SHARE))
+
+
+_long_poll_max_waiters = long_poll_capacity(DEFAULT_THREADS)
+_long_poll_slots = threading.BoundedSemaphore(_long_poll_max_waiters)
+
+
+def configure_long_poll(threads: int):
+    """Bekleyen sınırını iş parçacığı sayısına göre ayarla (main çağırır)"""
+    global _long_poll_max_waiters, _long_poll_slots
+    _long_poll_max_waiters = long_poll_capacity(threads)
+    _long_poll_slots = threading.BoundedSemaphore(_long_poll_max_waiters)
+
+
+def section_version(room: dict, section: str = 'full', player_id: str = None) -> int:
+    """
+    Bölümün kendi sürümü: 'full' için oda sürümü, 'state' için oyuncunun
+    durum sürümü, diğerleri için section_versions kaydı.
+    """
+    if section == 'full':
+        return room.get('version', 0)
+    if section == 'state':
+        return room.get('state_versions', {}).get(player_id, 0)
+    return room.get('section_versions', {}).get(section, 0)
+
+
+def room_etag(room: dict, section: str = 'full', player_id: str = None) -> str:
+    """
+    Bölümün ETag değeri, yalnızca o bölümün sürümünden üretilir; sohbet ya da
+    durum senkronu çekirdeğin ETag'ini değiştirmez.
+    """
+    return f"{SERVER_BOOT_ID}-{section_version(room, section, player_id)}"
+
+
+def room_versions(room: dict) -> dict:
+    """Odanın sürüm alanları (X-Room-Versions başlığı)"""
+    return {
+        'version': room.get('version', 0),
+        'section_versions': room.get('section_versions', {}),
+        'state_versions': room.get('state_versions', {}),
+        'event_seq': room.get('event_seq', 0),
+    }
+
+
+# ========== ODA GÜNLÜĞÜ ==========
+
+
+class RoomJournal:
+    """
+    Odanın sıra numaralı, yalnızca eklenen olay günlüğü (bellekte, sınırlı).
+    Son sıra numarası odada 'event_seq' olarak saklanır (ve kaydedilir);
+    günlüğün kendisi kaydedilmez. Günlükte olmayan (sıkıştırılmış ya da
+    sunucu yeniden başladığı için kaybolan) bir imleçten devam edilemez;
+    istemci oda anlık görüntüsüne döner.
+    """
+    
+    def __init__(self, last_seq: int = 0, limit: int = JOURNAL_MAX_EVENTS):
+        self.events = deque(maxlen=limit)
+        self.last_seq = last_seq
+    
+    def append(self, event_type: str, fields: dict) -> dict:
+        self.last_seq += 1
+        event = dict(fields)
+        event.update({'seq': self.last_seq, 'type': event_type, 'at': now_iso()})
+        self.events.append(event)
+        return event
+    
+    def since(self, seq: int):
+        """
+        seq'ten sonraki olaylar.
+        Returns: Olay listesi; imleç günlükte yoksa None
+        """
+        first = self.events[0]['seq'] if self.events else self.last_seq + 1
+        if seq < first - 1 or seq > self.last_seq:
+            return None
+        return [event for event in self.events if event['seq'] > seq]
+
+
+# Oda kodu -> RoomJournal (oda kilidi altında kullanılır)
+_journals = {}
+
+
+def room_journal(room: dict) -> RoomJournal:
+    """Odanın günlüğü (yoksa son sıra numarasından başlatılır)"""
+    journal = _journals.get(room['code'])
+    if journal is None:
+        journal = _journals[room['code']] = RoomJournal(room.get('event_seq', 0))
+    return journal
+
+
+def record_event(room: dict, event_type: str, **fields) -> dict:
+    """
+    Oda günlüğüne olay ekle. Sürüm artışı ve bildirim için ardından
+    touch_room çağrılmalıdır.
+    """
+    event = room_journal(room).append(event_type, fields)
+    room['event_seq'] = event['seq']
+    return event
+
+
+# ========== YANIT ÖNBELLEĞİ ==========
+
+
+class EncodedPayload:
+    """
+    Bir kez serileştirilmiş JSON yanıt gövdesi.
+    gzip kopyası ilk ihtiyaçta üretilir ve saklanır.
+    """
+    
+    def __init__(self, payload: dict):
+        self.body = (app.json.dumps(payload) + "\n").encode('utf-8')
+        self._gzipped = None
+    
+    def gzipped(self) -> bytes:
+        if self._gzipped is None:
+            self._gzipped = gzip.compress(self.body, compresslevel=6, mtime=0)
+        return self._gzipped
+    
+    def response(self):
+        """İstemci destekliyorsa sıkıştırılmış yanıt üret"""
+        use_gzip = (len(self.body) >= GZIP_MIN_BYTES
+                    and 'gzip' in request.accept_encodings)
+        response = app.response_class(
+            self.gzipped() if use_gzip else self.body,
+            mimetype='application/json'
+        )
+        if use_gzip:
+            response.headers['Content-Encoding'] = 'gzip'
+        response.vary.add('Accept-Encoding')
+        return response
+
+
+# Oda kodu -> (sürüm, EncodedPayload); sürüm değişince yeniden üretilir
+_room_payloads = {}
+
+
+def room_core(room: dict) -> dict:
+    """
+    Odanın sıcak kısmı: tur durumu ve oyuncular.
+    Sohbet, diplomasi ve oyuncu durumları (soğuk kısım) ayrı çekilir; sürüm
+    alanları gövdede değil X-Room-Versions başlığında gelir. Böylece gövde
+    yalnızca 'core' bölüm sürümü değişince değişir.
+    """
+    core = {key: value for key, value in room.items()
+            if key not in COLD_ROOM_KEYS and key not in ROOM_VERSION_KEYS}
+    core['players'] = {
+        pid: {key: value for key, value in player.items() if key != 'state'}
+        for pid, player in room['players'].items()
+    }
+    return core
+
+
+def room_payload(room: dict, part: str = 'full') -> EncodedPayload:
+    """
+    Bölümün mevcut sürümü için serileştirilmiş yanıt (oda kilidi altında).
+    part: 'full' (tüm oda) veya 'core' (bkz. room_core)
+    """
+    version = section_version(room, part)
+    key = (room['code'], part)
+    cached = _room_payloads.get(key)
+    PAYLOAD_CACHE.inc(result='hit' if cached and cached[0] == version else 'miss')
+    if cached is None or cached[0] != version:
+        body = room if part == 'full' else room_core(room)
+        cached = (version, EncodedPayload({'success': True, 'room': body}))
+        _room_payloads[key] = cached
+    return cached[1]
+
+
+# ========== ZAMANLAYICI ==========
+
+
+class DeadlineScheduler:
+    """
+    Monotonik saate göre sıralı (heap) zamanlayıcı.
+    Her iş bir anahtarla planlanır; aynı anahtarla yeniden planlamak veya
+    cancel() öncekini geçersiz kılar (eski heap kaydı sırası gelince atlanır).
+    Geri çağırmalar tek bir arka plan iş parçacığında, zamanı gelince çalışır.
+    """
+    
+    def __init__(self):
+        self._heap = []       # (zaman, sıra, anahtar, callback, args)
+        self._current = {}    # anahtar -> geçerli sıra numarası
+        self._seq = itertools.count()
+        self._cond = threading.Condition()
+        self._thread = None
+    
+    def start(self):
+        """Arka plan iş parçacığını başlat"""
+        with self._cond:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name="DeadlineScheduler", daemon=True
+                )
+                self._thread.start()
+    
+    def schedule(self, key, due: float, callback, *args):
+        """callback(*args)'ı monotonik due zamanında çalıştır"""
+        with self._cond:
+            seq = next(self._seq)
+            self._current[key] = seq
+            heapq.heappush(self._heap, (due, seq, key, callback, args))
+            if self._heap[0][1] == seq:
+                self._cond.notify()
+    
+    def schedule_once(self, key, due: float, callback, *args):
+        """Anahtar için bekleyen iş yoksa planla"""
+        with self._cond:
+            if key not in self._current:
+                self.schedule(key, due, callback, *args)
+    
+    def cancel(self, key):
+        """Anahtarın bekleyen işini iptal et"""
+        with self._cond:
+            self._current.pop(key, None)
+    
+    def __len__(self) -> int:
+        return len(self._current)
+    
+    def _run(self):
+        while True:
+            with self._cond:
+                while True:
+                    if not self._heap:
+                        self._cond.wait()
+                        continue
+                    due, seq, key, callback, args = self._heap[0]
+                    if self._current.get(key) != seq:
+                        heapq.heappop(self._heap)  # İptal edilmiş/eskimiş
+                        continue
+                    delay = due - time.monotonic()
+                    if delay > 0:
+                        self._cond.wait(delay)
+                        continue
+                    heapq.heappop(self._heap)
+                    del self._current[key]
+                    break
+            try:
+                callback(*args)
+            except Exception as e:
+                log(f"Zamanlayıcı hatası ({key}): {e}")
+
+
+_scheduler = DeadlineScheduler()
+
+# (oda kodu, oyuncu id) -> son görülme (monotonik); polling yalnızca bunu günceller
+_player_seen = {}
+
+
 # ========== OYUNCU TEMİZLEME & TUR TIMEOUT ==========
 
 
-def cleanup_stale_players(room: dict):
-    """Disconnected oyuncuları tespit et ve tur kilitlermesini önle"""
-    now = datetime.now()
+def mark_player_seen(room: dict, player_id: str):
+    """
+    Oyuncuyu görüldü olarak işaretle ve zaman aşımı kontrolünü planla.
+    Oyuncu başına tek bekleyen kontrol olur; kontrol zamanı geldiğinde son
+    görülme zamanına göre yeniden planlanır.
+    """
+    now = time.monotonic()
+    _player_seen[(room['code'], player_id)] = now
+    room['players'][player_id]['last_seen'] = now_iso()
+    _scheduler.schedule_once(('stale', room['code'], player_id),
+                             now + PLAYER_TIMEOUT_SECONDS,
+                             _check_stale_player, room['code'], player_id)
+
+
+def _check_stale_player(code: str, player_id: str):
+    """Zamanlayıcı: oyuncu zaman aşımına uğradıysa disconnected yap"""
+    with room_locked(code) as room:
+        player = room['players'].get(player_id) if room else None
+        if player is None:
+            _player_seen.pop((code, player_id), None)
+            return
+        
+        last_seen = _player_seen.get((code, player_id), 0.0)
+        due = last_seen + PLAYER_TIMEOUT_SECONDS
+        if time.monotonic() < due:
+            # Bu arada görüldü — yeni son görülmeye göre tekrar kontrol et
+            _scheduler.schedule_once(('stale', code, player_id), due,
+                                     _check_stale_player, code, player_id)
+            return
+        
+        if player.get('connected', True):
+            player['connected'] = False
+            record_event(room, 'player_disconnected', player=dict(player))
+            touch_room(room)
+            log(f"[{code}] {player['name']} zaman aşımı (disconnected)")
+            resolve_disconnects(room)
+
+
+def resolve_disconnects(room: dict):
+    """Bağlantı durumu değişince host ve tur kilitlenmesini düzelt"""
+    migrate_host(room)
     
-    for pid, player in room['players'].items():
-        try:
-            last_seen = datetime.fromisoformat(player.get('last_seen', now_iso()))
-            delta = (now - last_seen).total_seconds()
-            
-            if delta > PLAYER_TIMEOUT_SECONDS:
-                if player.get('connected', True):
-                    player['connected'] = False
-                    log(f"[{room['code']}] {player['name']} zaman aşımı (disconnected)")
-        except (ValueError, TypeError):
-            pass
-    
-    # Tur kilitlermesi kontrolü — sırası gelen oyuncu disconnected ise tur geçir
+    # Tur kilitlenmesi — sırası gelen oyuncu disconnected ise tur geçir
     if room.get('game_started') and room.get('current_player_id'):
         current = room['players'].get(room['current_player_id'])
         if current and not current.get('connected', True):
             _auto_advance_turn(room, reason="disconnected")
 
 
-def check_turn_timeout(room: dict):
-    """Tur zaman aşımı kontrolü (30 saniye)"""
-    if not room.get('game_started') or not room.get('turn_started_at'):
-        return
-    
-    try:
-        turn_start = datetime.fromisoformat(room['turn_started_at'])
-        elapsed = (datetime.now() - turn_start).total_seconds()
-        
-        if elapsed > TURN_TIMEOUT_SECONDS:
+def schedule_turn_timeout(room: dict):
+    """Mevcut tur için zaman aşımını planla (öncekini geçersiz kılar)"""
+    _scheduler.schedule(('turn', room['code']),
+                        time.monotonic() + TURN_TIMEOUT_SECONDS,
+                        _check_turn_timeout, room['code'], room.get('turn_started_at'))
+
+
+def _check_turn_timeout(code: str, turn_started_at: str):
+    """Zamanlayıcı: tur hâlâ aynıysa sıradakine geç"""
+    with room_locked(code) as room:
+        if (room and room.get('game_started')
+                and room.get('turn_started_at') == turn_started_at):
             _auto_advance_turn(room, reason="timeout")
-    except (ValueError, TypeError):
-        pass
+
+
+def schedule_room(room: dict):
+    """Veritabanından yüklenen oda için zamanlayıcıları kur"""
+    for player_id in room['players']:
+        mark_player_seen(room, player_id)
+    if room.get('game_started') and room.get('turn_started_at'):
+        schedule_turn_timeout(room)
 
 
 def _auto_advance_turn(room: dict, reason: str = "auto"):
@@ -291,6 +854,10 @@ def _auto_advance_turn(room: dict, reason: str = "auto"):
         
         room['current_player_id'] = next_player_id
         room['turn_started_at'] = now_iso()
+        schedule_turn_timeout(room)
+        record_event(room, 'turn_ended', player_id=None, previous_player=old_player_id,
+                     current_player=next_player_id, turn=room.get('current_turn'), reason=reason)
+        touch_room(room)
         
         old_name = room['players'].get(old_player_id, {}).get('name', '?')
         new_name = room['players'].get(next_player_id, {}).get('name', '?')
@@ -311,6 +878,8 @@ def migrate_host(room: dict):
     for pid, player in room['players'].items():
         if player.get('connected', True):
             room['host_id'] = pid
+            record_event(room, 'host_changed', host_id=pid)
+            touch_room(room)
             log(f"[{room['code']}] Yeni host: {player['name']}")
             return
     
@@ -318,19 +887,21 @@ def migrate_host(room: dict):
     log(f"[{room['code']}] Tüm oyuncular disconnected")
 
 
+# Veritabanından yüklenen odaların zamanlayıcılarını ve göstergelerini kur
+for _loaded_room in list(rooms.values()):
+    schedule_room(_loaded_room)
+    ACTIVE_ROOMS.inc()
+    ACTIVE_PLAYERS.inc(len(_loaded_room['players']))
+    if _loaded_room.get('game_started'):
+        ACTIVE_GAMES.inc()
+_scheduler.start()
+
+
 # ========== ODA YÖNETİMİ ==========
 
 @app.route('/room/create', methods=['POST'])
 def create_room():
-    """Yeni oda oluştur"""
-    # Rate limit — oda oluşturma
-    ip = request.remote_addr or "unknown"
-    if not _check_rate_limit(ip, ROOM_CREATE_LIMIT_PER_MINUTE, _create_counters):
-        return jsonify({
-            'success': False,
-            'error': 'Çok fazla oda oluşturma denemesi. Lütfen bekleyin.'
-        }), 429
-    
+    """Yeni oda oluştur (hız sınırı: 'create' bütçesi)"""
     data = request.json
     err = validate_required_fields(data, ['player_id'])
     if err:
@@ -339,10 +910,7 @@ def create_room():
     player_id = data['player_id']
     player_name = sanitize_name(data.get('name', 'Anonim'))
     
-    room_code = generate_room_code()
-    
-    rooms[room_code] = {
-        'code': room_code,
+    room = {
         'host_id': player_id,
         'players': {
             player_id: {
@@ -368,25 +936,34 @@ def create_room():
         },
         
         # Oyuncu detaylı durumları
-        'player_states': {}
+        'player_states': {},
+        
+        # Son oda olayının sıra numarası (bkz. RoomJournal)
+        'event_seq': 0,
+        
+        # İçerik sürümü (her değişiklikte artar, ETag için) ve bölüm sürümleri
+        'version': 1,
+        'section_versions': {'core': 1, 'chat': 1, 'diplomacy': 1},
+        'state_versions': {}
     }
+    room_code = add_room(room)
+    mark_player_seen(room, player_id)
     
+    _save_room(room_code)
     log(f"Oda oluşturuldu: {room_code} - Host: {player_name} ({player_id})")
     
     return jsonify({
         'success': True,
         'room_code': room_code,
         'player_id': player_id,
-        'room': rooms[room_code]
+        'room': room
     })
 
 
 @app.route('/room/<code>/join', methods=['POST'])
+@with_room_lock
 def join_room(code):
     """Odaya katıl"""
-    if code not in rooms:
-        return jsonify({'success': False, 'error': 'Oda bulunamadı'}), 404
-    
     data = request.json
     err = validate_required_fields(data, ['player_id'])
     if err:
@@ -401,7 +978,10 @@ def join_room(code):
         # Yeniden bağlanma kontrolü
         if player_id in room['players']:
             room['players'][player_id]['connected'] = True
-            room['players'][player_id]['last_seen'] = now_iso()
+            mark_player_seen(room, player_id)
+            record_event(room, 'player_reconnected', player=dict(room['players'][player_id]))
+            touch_room(room)
+            resolve_disconnects(room)
             log(f"[{code}] Yeniden bağlandı: {player_name}")
             return jsonify({
                 'success': True,
@@ -421,6 +1001,10 @@ def join_room(code):
         'connected': True,
         'last_seen': now_iso()
     }
+    ACTIVE_PLAYERS.inc()
+    mark_player_seen(room, player_id)
+    record_event(room, 'player_joined', player=dict(room['players'][player_id]))
+    touch_room(room)
     
     log(f"[{code}] Oyuncu katıldı: {player_name} ({player_id})")
     
@@ -433,35 +1017,196 @@ def join_room(code):
 
 @app.route('/room/<code>', methods=['GET'])
 def get_room(code):
-    """Oda durumunu al (POLLING) — temizlik ve timeout kontrolleri dahil"""
-    if code not in rooms:
-        return jsonify({'success': False, 'error': 'Oda bulunamadı'}), 404
+    """
+    Oda durumunu al (POLLING). Yalnızca oyuncunun görülme zamanını günceller;
+    zaman aşımı, tur timeout'u ve host geçişi DeadlineScheduler'da çalışır.
+    ETag / If-None-Match destekler: oda sürümü değişmediyse 304 döner.
+    ?wait=<saniye> (long-poll): istemcinin sürümü günceliyse yanıt, oda
+    değişene veya süre dolana kadar bekletilir.
+    Bekleme sırasında oda kilidi tutulmaz.
+    """
+    return _poll_room(code, 'full')
+
+
+@app.route('/room/<code>/core', methods=['GET'])
+def get_room_core(code):
+    """
+    Odanın sıcak kısmını al (polling, ETag ve ?wait= destekler).
+    ETag yalnızca çekirdeğin sürümünden üretilir. Sürüm alanları
+    (section_versions, state_versions, event_seq) her yanıtta, 304 dahil,
+    X-Room-Versions başlığında gelir; istemci hangi soğuk bölümün değiştiğini
+    buradan görür ve yalnızca onları çeker.
+    ?version=<oda sürümü> istemcinin son gördüğü oda sürümüdür: long-poll
+    herhangi bir bölüm değişene kadar bekler, yalnızca soğuk bölüm
+    değiştiyse gövdesiz 304 ve yeni sürümlerle döner.
+    """
+    return _poll_room(code, 'core')
+
+
+def _poll_room(code: str, part: str):
+    """Oda polling'i (tam oda veya çekirdek), long-poll dahil"""
+    wait = min(max(request.args.get('wait', 0, type=float), 0), LONG_POLL_MAX_WAIT_SECONDS)
+    known_version = request.args.get('version', type=int)
+    
+    with room_locked(code) as room:
+        if room is None:
+            return jsonify({'success': False, 'error': 'Oda bulunamadı'}), 404
+        _record_poll(room, request.args.get('player_id'))
+        etag = room_etag(room, part)
+        version = room.get('version', 0)
+        if known_version is None:
+            known_version = version
+        if not (wait and request.if_none_match.contains(etag) and known_version == version):
+            return _room_response(room, etag, wait, part)
+        slots = _long_poll_slots
+        if not slots.acquire(blocking=False):
+            # Bekleyen sınırı dolu: iş parçacığını tutma, hemen 304
+            LONG_POLL_REJECTED.inc()
+            return _room_response(room, etag, 0, part)
+    
+    # Long-poll: değişiklik yoksa kilitsiz bekle
+    LONG_POLL_WAITERS.inc()
+    try:
+        wait_for_room_change(code, version, wait)
+    finally:
+        LONG_POLL_WAITERS.dec()
+        slots.release()
+    
+    with room_locked(code) as room:
+        if room is None:
+            return jsonify({'success': False, 'error': 'Oda bulunamadı'}), 404
+        return _room_response(room, room_etag(room, part), wait, part)
+
+
+def _record_poll(room: dict, player_id: str):
+    """Polling yapan oyuncuyu görüldü olarak işaretle"""
+    if player_id and player_id in room['players']:
+        player = room['players'][player_id]
+        mark_player_seen(room, player_id)
+        if not player.get('connected', True):
+            player['connected'] = True
+            record_event(room, 'player_reconnected', player=dict(player))
+            touch_room(room)
+            resolve_disconnects(room)
+
+
+def _room_response(room: dict, etag: str, wait: float, part: str = 'full'):
+    """Oda durumu yanıtı (ETag eşleşirse 304)"""
+    if request.if_none_match.contains(etag):
+        ROOM_POLLS.inc(result='not_modified')
+        response = app.response_class(status=304)
+    else:
+        ROOM_POLLS.inc(result='full')
+        response = room_payload(room, part).response()
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = 'no-cache'
+    if part == 'core':
+        response.headers['X-Room-Versions'] = json.dumps(room_versions(room), separators=(',', ':'))
+    if wait:
+        response.headers['X-Long-Poll'] = str(int(wait))
+    return response
+
+
+def _section_response(room: dict, section: str, body: dict, player_id: str = None):
+    """Soğuk bölüm yanıtı: ETag bölümün kendi sürümünden, eşleşirse 304"""
+    etag = room_etag(room, section, player_id)
+    if request.if_none_match.contains(etag):
+        response = app.response_class(status=304)
+    else:
+        response = jsonify(body)
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = 'no-cache'
+    return response
+
+
+@app.route('/room/<code>/chat', methods=['GET'])
+@with_room_lock
+def get_chat(code):
+    """
+    ?since=<seq> imlecinden sonraki sohbet mesajları.
+    İmleç saklanan en eski mesajdan da eskiyse truncated=True döner ve
+    saklanan mesajların tamamı gönderilir.
+    """
+    room = rooms[code]
+    since = request.args.get('since', 0, type=int)
+    chat = room.get('chat', [])
+    
+    messages = [msg for msg in chat if msg.get('seq', 0) > since]
+    truncated = bool(chat) and since < chat[0].get('seq', 0) - 1
     
+    return _section_response(room, 'chat', {
+        'success': True,
+        'messages': messages,
+        'cursor': room.get('chat_seq', since),
+        'truncated': truncated,
+        'version': section_version(room, 'chat')
+    })
+
+
+@app.route('/room/<code>/diplomacy', methods=['GET'])
+@with_room_lock
+def get_diplomacy(code):
+    """
+    Diplomasi durumu. ?since=<sürüm> istemcinin bildiği bölüm sürümüdür;
+    o sürümden beri değişiklik yoksa yalnızca changed=False döner.
+    """
     room = rooms[code]
+    since = request.args.get('since', -1, type=int)
+    version = section_version(room, 'diplomacy')
     
-    # İsteği yapan oyuncuyu güncelle
-    player_id = request.args.get('player_id')
-    if player_id and player_id in room['players']:
-        room['players'][player_id]['last_seen'] = now_iso()
-        room['players'][player_id]['connected'] = True
+    if version <= since:
+        return jsonify({'success': True, 'changed': False, 'version': version})
     
-    # Bakım görevleri (her polling'de çalışır)
-    cleanup_stale_players(room)
-    check_turn_timeout(room)
-    migrate_host(room)
+    return _section_response(room, 'diplomacy', {
+        'success': True,
+        'changed': True,
+        'version': version,
+        'diplomacy': room['diplomacy']
+    })
+
+
+@app.route('/room/<code>/player/<player_id>/state', methods=['GET'])
+@with_room_lock
+def get_player_state(code, player_id):
+    """Tek oyuncunun senkronize durumu ve son tur durumu"""
+    room = rooms[code]
+    
+    if player_id not in room['players']:
+        return jsonify({'success': False, 'error': 'Oyuncu bulunamadı'}), 404
+    
+    return _section_response(room, 'state', {
+        'success': True,
+        'player_id': player_id,
+        'version': section_version(room, 'state', player_id),
+        'state': room.get('player_states', {}).get(player_id),
+        'turn_state': room['players'][player_id].get('state')
+    }, player_id)
+
+
+@app.route('/room/<code>/events', methods=['GET'])
+@with_room_lock
+def get_events(code):
+    """
+    ?since=<seq> imlecinden sonraki oda olayları (katılma/ayrılma, eyalet,
+    tur, sohbet, teklif, savaş...). İmleç günlükte yoksa reset=True döner;
+    istemci kaçırdığını oda anlık görüntüsünden çıkarmalıdır.
+    """
+    room = rooms[code]
+    since = request.args.get('since', 0, type=int)
+    events = room_journal(room).since(since)
     
     return jsonify({
         'success': True,
-        'room': room
+        'events': events or [],
+        'cursor': room.get('event_seq', 0),
+        'reset': events is None
     })
 
 
 @app.route('/room/<code>/select', methods=['POST'])
+@with_room_lock
 def select_province(code):
     """Eyalet seç"""
-    if code not in rooms:
-        return jsonify({'success': False, 'error': 'Oda bulunamadı'}), 404
-    
     data = request.json
     err = validate_required_fields(data, ['player_id', 'province'])
     if err:
@@ -485,6 +1230,8 @@ def select_province(code):
             return jsonify({'success': False, 'error': 'Bu eyalet zaten seçilmiş'}), 400
     
     room['players'][player_id]['province'] = province
+    record_event(room, 'province_selected', player_id=player_id, province=province)
+    touch_room(room)
     
     log(f"[{code}] {room['players'][player_id]['name']} eyalet seçti: {province}")
     
@@ -495,11 +1242,9 @@ def select_province(code):
 
 
 @app.route('/room/<code>/start', methods=['POST'])
+@with_room_lock
 def start_game(code):
     """Oyunu başlat"""
-    if code not in rooms:
-        return jsonify({'success': False, 'error': 'Oda bulunamadı'}), 404
-    
     data = request.json
     err = validate_required_fields(data, ['player_id'])
     if err:
@@ -523,9 +1268,14 @@ def start_game(code):
             }), 400
     
     room['game_started'] = True
+    ACTIVE_GAMES.inc()
     room['current_turn'] = 1
     room['current_player_id'] = list(room['players'].keys())[0]
     room['turn_started_at'] = now_iso()
+    schedule_turn_timeout(room)
+    record_event(room, 'game_started', player_id=player_id,
+                 current_player=room['current_player_id'], turn=1)
+    touch_room(room)
     
     log(f"[{code}] Oyun başladı!")
     
@@ -536,11 +1286,9 @@ def start_game(code):
 
 
 @app.route('/room/<code>/end_turn', methods=['POST'])
+@with_room_lock
 def end_turn(code):
     """Turu bitir"""
-    if code not in rooms:
-        return jsonify({'success': False, 'error': 'Oda bulunamadı'}), 404
-    
     data = request.json
     err = validate_required_fields(data, ['player_id'])
     if err:
@@ -564,10 +1312,14 @@ def end_turn(code):
     
     room['current_player_id'] = player_ids[next_index]
     room['turn_started_at'] = now_iso()
+    schedule_turn_timeout(room)
     
     # İlk oyuncuya geri döndüyse tur sayısını artır
     if next_index == 0:
         room['current_turn'] += 1
+    record_event(room, 'turn_ended', player_id=player_id, previous_player=player_id,
+                 current_player=room['current_player_id'], turn=room['current_turn'])
+    touch_room(room, 'core', 'state', player_id=player_id)
     
     log(f"[{code}] Tur geçildi: {room['players'][player_id]['name']} -> "
         f"{room['players'][room['current_player_id']]['name']}")
@@ -579,11 +1331,9 @@ def end_turn(code):
 
 
 @app.route('/room/<code>/chat', methods=['POST'])
+@with_room_lock
 def send_chat(code):
     """Sohbet mesajı gönder"""
-    if code not in rooms:
-        return jsonify({'success': False, 'error': 'Oda bulunamadı'}), 404
-    
     data = request.json
     err = validate_required_fields(data, ['player_id'])
     if err:
@@ -600,25 +1350,28 @@ def send_chat(code):
     if 'chat' not in room:
         room['chat'] = []
     
-    room['chat'].append({
+    room['chat_seq'] = room.get('chat_seq', 0) + 1
+    chat_message = {
+        'seq': room['chat_seq'],
         'player_id': player_id,
         'player_name': room['players'].get(player_id, {}).get('name', 'Anonim'),
         'message': message,
         'time': now_iso()
-    })
+    }
+    room['chat'].append(chat_message)
     
     # Son mesajları tut
     room['chat'] = room['chat'][-MAX_CHAT_HISTORY:]
+    record_event(room, 'chat_message', player_id=player_id, message=chat_message)
+    touch_room(room, 'chat')
     
     return jsonify({'success': True})
 
 
 @app.route('/room/<code>/leave', methods=['POST'])
+@with_room_lock
 def leave_room(code):
     """Odadan ayrıl"""
-    if code not in rooms:
-        return jsonify({'success': False, 'error': 'Oda bulunamadı'}), 404
-    
     data = request.json
     err = validate_required_fields(data, ['player_id'])
     if err:
@@ -633,12 +1386,14 @@ def leave_room(code):
         was_current = room.get('current_player_id') == player_id
         
         del room['players'][player_id]
+        ACTIVE_PLAYERS.dec()
+        record_event(room, 'player_left', player_id=player_id, player_name=player_name)
+        touch_room(room)
         log(f"[{code}] {player_name} ayrıldı")
         
         # Oda boşaldıysa sil
         if not room['players']:
-            del rooms[code]
-            _delete_room_db(code)
+            remove_room(code)
             log(f"[{code}] Oda silindi (boş)")
             return jsonify({'success': True})
         
@@ -656,11 +1411,9 @@ def leave_room(code):
 # ========== DİPLOMASİ SİSTEMİ ==========
 
 @app.route('/room/<code>/diplomacy/propose', methods=['POST'])
+@with_room_lock
 def propose_diplomacy(code):
     """İttifak, ticaret veya barış teklifi"""
-    if code not in rooms:
-        return jsonify({'success': False, 'error': 'Oda bulunamadı'}), 404
-    
     data = request.json
     err = validate_required_fields(data, ['from_player_id', 'to_player_id', 'type'])
     if err:
@@ -695,6 +1448,8 @@ def propose_diplomacy(code):
     }
     
     room['diplomacy']['pending_proposals'].append(proposal)
+    record_event(room, 'proposal', player_id=from_player, proposal=proposal)
+    touch_room(room, 'diplomacy')
     
     from_name = room['players'][from_player]['name']
     to_name = room['players'][to_player]['name']
@@ -708,11 +1463,9 @@ def propose_diplomacy(code):
 
 
 @app.route('/room/<code>/diplomacy/respond', methods=['POST'])
+@with_room_lock
 def respond_diplomacy(code):
     """Teklifi kabul veya reddet"""
-    if code not in rooms:
-        return jsonify({'success': False, 'error': 'Oda bulunamadı'}), 404
-    
     data = request.json
     err = validate_required_fields(data, ['player_id', 'proposal_id'])
     if err:
@@ -741,23 +1494,29 @@ def respond_diplomacy(code):
     
     if accept:
         if proposal['type'] == 'alliance':
-            room['diplomacy']['alliances'].append({
+            alliance = {
                 'players': [proposal['from_player_id'], proposal['to_player_id']],
                 'formed_at': now_iso()
-            })
+            }
+            room['diplomacy']['alliances'].append(alliance)
             result_message = "İttifak kuruldu!"
+            record_event(room, 'alliance_formed', player_id=player_id,
+                         message=result_message, **alliance)
             
         elif proposal['type'] == 'trade':
             gold = 100
             if isinstance(proposal.get('terms'), dict):
                 gold = min(max(int(proposal['terms'].get('gold', 100)), 0), 10000)
-            room['diplomacy']['trade_deals'].append({
+            trade = {
                 'from': proposal['from_player_id'],
                 'to': proposal['to_player_id'],
                 'gold_per_turn': gold,
                 'formed_at': now_iso()
-            })
+            }
+            room['diplomacy']['trade_deals'].append(trade)
             result_message = "Ticaret anlaşması yapıldı!"
+            record_event(room, 'trade_agreement_formed', player_id=player_id,
+                         message=result_message, **trade)
             
         elif proposal['type'] == 'peace':
             wars = room['diplomacy']['wars']
@@ -766,8 +1525,14 @@ def respond_diplomacy(code):
                    set([proposal['from_player_id'], proposal['to_player_id']]):
                     wars.remove(war)
             result_message = "Barış yapıldı!"
+            record_event(room, 'peace_made', player_id=player_id, message=result_message,
+                         players=[proposal['from_player_id'], proposal['to_player_id']])
     else:
         result_message = "Teklif reddedildi."
+        record_event(room, 'proposal_rejected', player_id=player_id,
+                     proposal_id=proposal_id, proposal_type=proposal['type'],
+                     from_player_id=proposal['from_player_id'])
+    touch_room(room, 'diplomacy')
     
     from_name = room['players'].get(proposal['from_player_id'], {}).get('name', '?')
     to_name = room['players'].get(proposal['to_player_id'], {}).get('name', '?')
@@ -783,11 +1548,9 @@ def respond_diplomacy(code):
 
 
 @app.route('/room/<code>/diplomacy/war', methods=['POST'])
+@with_room_lock
 def declare_war(code):
     """Savaş ilan et"""
-    if code not in rooms:
-        return jsonify({'success': False, 'error': 'Oda bulunamadı'}), 404
-    
     data = request.json
     err = validate_required_fields(data, ['attacker_id', 'defender_id'])
     if err:
@@ -815,29 +1578,31 @@ def declare_war(code):
         if set(alliance['players']) == set([attacker_id, defender_id]):
             alliances.remove(alliance)
     
-    room['diplomacy']['wars'].append({
+    war = {
         'attacker': attacker_id,
         'defender': defender_id,
         'started_turn': room['current_turn']
-    })
+    }
+    room['diplomacy']['wars'].append(war)
     
     attacker_name = room['players'][attacker_id]['name']
     defender_name = room['players'][defender_id]['name']
+    message = f"{attacker_name} {defender_name}'e savaş ilan etti!"
+    record_event(room, 'war_declared', player_id=attacker_id, message=message, **war)
+    touch_room(room, 'diplomacy')
     log(f"[{code}] SAVAŞ! {attacker_name} -> {defender_name}")
     
     return jsonify({
         'success': True,
-        'message': f"{attacker_name} {defender_name}'e savaş ilan etti!",
+        'message': message,
         'room': room
     })
 
 
 @app.route('/room/<code>/attack', methods=['POST'])
+@with_room_lock
 def attack_player(code):
     """Saldırı yap ve sonucu hesapla"""
-    if code not in rooms:
-        return jsonify({'success': False, 'error': 'Oda bulunamadı'}), 404
-    
     data = request.json
     err = validate_required_fields(data, ['attacker_id', 'defender_id'])
     if err:
@@ -901,7 +1666,7 @@ def attack_player(code):
     if 'battle_results' not in room['diplomacy']:
         room['diplomacy']['battle_results'] = []
         
-    room['diplomacy']['battle_results'].append({
+    battle = {
         'id': str(uuid.uuid4())[:8],
         'attacker_id': attacker_id,
         'defender_id': defender_id,
@@ -911,7 +1676,10 @@ def attack_player(code):
         'defender_losses': defender_losses,
         'gold_plundered': gold_plunder,
         'timestamp': now_iso()
-    })
+    }
+    room['diplomacy']['battle_results'].append(battle)
+    record_event(room, 'battle_result', player_id=attacker_id, message=message, **battle)
+    touch_room(room, 'diplomacy')
     
     return jsonify({
         'success': True,
@@ -925,11 +1693,9 @@ def attack_player(code):
 
 
 @app.route('/room/<code>/sync_state', methods=['POST'])
+@with_room_lock
 def sync_player_state(code):
     """Oyuncu durumunu senkronize et (genişletilmiş)"""
-    if code not in rooms:
-        return jsonify({'success': False, 'error': 'Oda bulunamadı'}), 404
-    
     data = request.json
     err = validate_required_fields(data, ['player_id', 'state'])
     if err:
@@ -965,16 +1731,15 @@ def sync_player_state(code):
         # Meta
         'updated_at': now_iso()
     }
+    touch_room(room, 'state', player_id=player_id)
     
     return jsonify({'success': True})
 
 
 @app.route('/room/<code>/player/<player_id>/info', methods=['GET'])
+@with_room_lock
 def get_player_info(code, player_id):
     """Oyuncu bilgisini al"""
-    if code not in rooms:
-        return jsonify({'success': False, 'error': 'Oda bulunamadı'}), 404
-    
     room = rooms[code]
     
     if player_id not in room['players']:
@@ -992,31 +1757,48 @@ def get_player_info(code, player_id):
 
 @app.route('/provinces', methods=['GET'])
 def get_provinces():
-    """Eyalet listesini al"""
-    return jsonify({'provinces': PROVINCES})
+    """Eyalet listesini al (sabit içerik, istemci önbelleğe alabilir)"""
+    response = _provinces_payload.response()
+    response.set_etag(_provinces_etag)
+    response.headers['Cache-Control'] = 'public, max-age=86400'
+    return response.make_conditional(request)
+
+
+_provinces_payload = EncodedPayload({'provinces': PROVINCES})
+_provinces_etag = hashlib.md5(_provinces_payload.body).hexdigest()
 
 
 @app.route('/health', methods=['GET'])
 def health_check():
-    """Sunucu durumu (genişletilmiş)"""
-    total_players = sum(len(r['players']) for r in rooms.values())
-    active_games = sum(1 for r in rooms.values() if r.get('game_started'))
-    
+    """Sunucu durumu (genişletilmiş; sayılar artımlı göstergelerden)"""
     return jsonify({
         'status': 'ok',
-        'rooms': len(rooms),
-        'total_players': total_players,
-        'active_games': active_games,
+        'rooms': int(ACTIVE_ROOMS.value()),
+        'total_players': int(ACTIVE_PLAYERS.value()),
+        'active_games': int(ACTIVE_GAMES.value()),
         'time': now_iso(),
+        'features': ['etag', 'long_poll', 'room_sections', 'room_journal'],
         'config': {
             'player_timeout': PLAYER_TIMEOUT_SECONDS,
             'turn_timeout': TURN_TIMEOUT_SECONDS,
             'max_players': MAX_PLAYERS_PER_ROOM,
-            'rate_limit': RATE_LIMIT_PER_MINUTE
+            'rate_limit': RATE_LIMIT_PER_MINUTE,
+            'poll_rate_limit': POLL_RATE_LIMIT_PER_MINUTE,
+            'action_rate_limit': ACTION_RATE_LIMIT_PER_MINUTE,
+            'chat_rate_limit': CHAT_RATE_LIMIT_PER_MINUTE,
+            'long_poll_max_waiters': _long_poll_max_waiters
         }
     })
 
 
+@app.route('/metrics', methods=['GET'])
+def metrics_endpoint():
+    """Prometheus metin biçiminde metrikler"""
+    if _persister:
+        DB_PENDING.set(_persister.pending())
+    return app.response_class(metrics.render(), content_type=PROMETHEUS_CONTENT_TYPE)
+
+
 # ========== ANA FONKSİYON ==========
 
 def main():
@@ -1025,7 +1807,14 @@ def main():
     parser.add_argument('--port', type=int, default=5000, help='Port numarası')
     parser.add_argument('--production', action='store_true',
                         help='Production modu (waitress WSGI)')
+    parser.add_argument('--threads', type=int, default=DEFAULT_THREADS,
+                        help='waitress iş parçacığı sayısı; en fazla yarısı long-poll '
+                             'beklemesinde tutulur, gerisi diğer isteklere kalır')
     args = parser.parse_args()
+    configure_long_poll(args.threads)
+    
+    # SIGTERM'de de atexit çalışsın (bekleyen oda yazımları diske insin)
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
     
     print(f"""
 ╔════════════════════════════════════════════════════════════════╗
@@ -1039,13 +1828,19 @@ def main():
 ║  Güvenlik:                                                     
 ║    Oyuncu timeout:  {PLAYER_TIMEOUT_SECONDS}sn                                      
 ║    Tur timeout:     {TURN_TIMEOUT_SECONDS}sn                                      
-║    Rate limit:      {RATE_LIMIT_PER_MINUTE}/dk                                    
+║    Rate limit:      {RATE_LIMIT_PER_MINUTE}/dk yazma, {POLL_RATE_LIMIT_PER_MINUTE}/dk okuma           
+║                     {ACTION_RATE_LIMIT_PER_MINUTE}/dk tur/savaş, {CHAT_RATE_LIMIT_PER_MINUTE}/dk sohbet              
 ║    Max oyuncu/oda:  {MAX_PLAYERS_PER_ROOM}                                       
 ╠════════════════════════════════════════════════════════════════╣
 ║  Endpoints:                                                    
 ║    POST /room/create        - Oda oluştur                      
 ║    POST /room/<code>/join   - Odaya katıl                      
-║    GET  /room/<code>        - Oda durumu (polling)             
+║    GET  /room/<code>        - Oda durumu (polling, ETag/304)   
+║    GET  /room/<code>?wait=N - Long-poll (değişene kadar bekle) 
+║    GET  /room/<code>/core   - Oda çekirdeği (tur, oyuncular, sürümler)
+║    GET  /room/<code>/chat?since=N      - Yeni sohbet mesajları 
+║    GET  /room/<code>/diplomacy?since=N - Diplomasi (değiştiyse)
+║    GET  /room/<code>/player/<id>/state - Oyuncu durumu         
 ║    POST /room/<code>/select - Eyalet seç                       
 ║    POST /room/<code>/start  - Oyunu başlat                     
 ║    POST /room/<code>/end_turn - Tur bitir                      
@@ -1059,6 +1854,7 @@ def main():
 ║    GET  /room/<code>/player/<id>/info   - Oyuncu bilgisi       
 ║    GET  /provinces          - Eyalet listesi                   
 ║    GET  /health             - Sunucu durumu                    
+║    GET  /metrics            - Prometheus metrikleri            
 ╚════════════════════════════════════════════════════════════════╝
     """)
     
@@ -1066,7 +1862,7 @@ def main():
         try:
             from waitress import serve
             log("Production modu: waitress başlatılıyor...")
-            serve(app, host=args.host, port=args.port, threads=4)
+            serve(app, host=args.host, port=args.port, threads=args.threads)
         except ImportError:
             log("UYARI: waitress bulunamadı! pip install waitress")
             log("Development modu ile başlatılıyor...")
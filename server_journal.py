@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+"""
+Osmanlı Eyalet Yönetim Simülasyonu - Sunucu Olay Günlüğü
+WebSocket (server.py) ve HTTP (server_http.py) sunucularının ortak günlük
+sınırları ve kodlanmış çerçeveleri tutan sınırlı günlük.
+
+Günlük hem olay sayısıyla hem toplam bayt ile sınırlıdır; tek başına çok
+büyük bir çerçeve günlüğe yazılmaz, yerine boş bir yer tutucu girer. O
+olayı alması gereken oyuncu yeniden bağlanırken aralığı kapsıyorsa oda
+anlık görüntüsüne döner; olaydan etkilenmeyen oyuncular normal devam eder.
+"""
+
+from collections import deque
+from typing import Optional
+
+JOURNAL_MAX_EVENTS = 200             # Oda başına saklanan son olay sayısı
+JOURNAL_MAX_BYTES = 256 * 1024       # Oda başına günlükteki kodlanmış çerçevelerin toplam boyutu
+JOURNAL_MAX_EVENT_BYTES = 16 * 1024  # Bundan büyük çerçeve günlüğe yazılmaz (yer tutucu girer)
+
+
+class FrameJournal:
+    """
+    Sıra numaralı kodlanmış çerçeveler: (seq, alıcı, hariç tutulan, çerçeve).
+    Çerçeveler json.dumps (ensure_ascii) çıktısıdır; uzunluk bayt sayısına eşittir.
+    Yer tutucularda çerçeve None'dır ve boyuta sayılmaz.
+    """
+    
+    def __init__(self, max_events: int = JOURNAL_MAX_EVENTS, max_bytes: int = JOURNAL_MAX_BYTES,
+                 max_event_bytes: int = JOURNAL_MAX_EVENT_BYTES):
+        self.entries = deque()
+        self.size = 0
+        self.max_events = max_events
+        self.max_bytes = max_bytes
+        self.max_event_bytes = max_event_bytes
+    
+    def __len__(self) -> int:
+        return len(self.entries)
+    
+    def append(self, seq: int, to: Optional[str], exclude_id: Optional[str], payload: str):
+        """Çerçeveyi ekle; sınırlar aşılırsa en eskiler atılır"""
+        if len(payload) > self.max_event_bytes:
+            payload = None
+        else:
+            self.size += len(payload)
+        self.entries.append((seq, to, exclude_id, payload))
+        while self.entries and (len(self.entries) > self.max_events or self.size > self.max_bytes):
+            payload = self.entries.popleft()[3]
+            if payload is not None:
+                self.size -= len(payload)
+    
+    def since(self, player_id: str, last_seq: Optional[int], current_seq: int) -> Optional[list]:
+        """
+        Oyuncunun last_seq'ten sonra kaçırdığı çerçeveler (alıcıya göre süzülmüş).
+        Returns: Çerçeve listesi; imleç günlükte yoksa ya da oyuncuya giden bir
+        çerçeve günlüğe sığmadıysa None (oda anlık görüntüsü kullanılmalı)
+        """
+        first = self.entries[0][0] if self.entries else current_seq + 1
+        if last_seq is None or last_seq < first - 1 or last_seq > current_seq:
+            return None
+        frames = []
+        for seq, to, exclude_id, payload in self.entries:
+            if seq <= last_seq or to not in (None, player_id) or exclude_id == player_id:
+                continue
+            if payload is None:
+                return None
+            frames.append(payload)
+        return frames
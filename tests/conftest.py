@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+"""
+Osmanlı Eyalet Yönetim Simülasyonu - Test Ortamı
+Depo kökünü içe aktarma yoluna ekler (python -m pytest ya da pytest ile).
+HTTP sunucusu testleri geçici bir oda veritabanıyla çalışır.
+"""
+
+import importlib
+import itertools
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+
+@pytest.fixture
+def headless_audio():
+    """Test süresince sessiz ses yöneticisi (pygame gerekmez)"""
+    from audio.audio_manager import pop_headless, push_headless
+    push_headless()
+    yield
+    pop_headless()
+
+
+@pytest.fixture(scope='session')
+def server_http(tmp_path_factory):
+    """server_http modülü (oda veritabanı geçici klasörde)"""
+    from server_db import ROOM_DB_ENV
+    previous = os.environ.get(ROOM_DB_ENV)
+    os.environ[ROOM_DB_ENV] = str(tmp_path_factory.mktemp('rooms') / 'rooms.db')
+    try:
+        yield importlib.import_module('server_http')
+    finally:
+        if previous is None:
+            os.environ.pop(ROOM_DB_ENV, None)
+        else:
+            os.environ[ROOM_DB_ENV] = previous
+
+
+_client_addresses = itertools.count(1)
+
+
+@pytest.fixture
+def http_client(server_http):
+    """Flask test istemcisi; her test ayrı IP'den gelir (hız bütçeleri ayrı)"""
+    client = server_http.app.test_client()
+    client.environ_base['REMOTE_ADDR'] = f'10.0.0.{next(_client_addresses)}'
+    return client
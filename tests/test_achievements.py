@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+"""
+Başarı bağımlılık tablosu: yalnızca girdisi değişen kilitli başarılar
+yeniden değerlendirilir.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from game.systems.achievements import (
+    ACHIEVEMENT_INPUTS, ACHIEVEMENT_RULES, ACHIEVEMENTS, AchievementSystem,
+)
+
+
+@pytest.fixture
+def system(headless_audio, monkeypatch, tmp_path):
+    # Oyuncunun gerçek başarı dosyasına dokunulmaz
+    monkeypatch.setattr(AchievementSystem, '_get_save_path',
+                        lambda self: str(tmp_path / AchievementSystem.SAVE_FILE))
+    return AchievementSystem()
+
+
+@pytest.fixture
+def gm():
+    # Eksik alanlar girdi okuyucularında varsayılan değere düşer
+    return SimpleNamespace(economy=SimpleNamespace(resources=SimpleNamespace(gold=0)))
+
+
+def _record_checks(system, monkeypatch):
+    checked = []
+    original = system._check_condition
+
+    def check(ach, values):
+        checked.append(ach.id)
+        return original(ach, values)
+
+    monkeypatch.setattr(system, '_check_condition', check)
+    return checked
+
+
+def test_rules_cover_every_achievement():
+    for ach in ACHIEVEMENTS.values():
+        assert ach.condition_key in ACHIEVEMENT_RULES, ach.id
+    for key, rule in ACHIEVEMENT_RULES.items():
+        assert rule.inputs, key
+        for input_name in rule.inputs:
+            assert input_name in ACHIEVEMENT_INPUTS, (key, input_name)
+
+
+def test_only_changed_inputs_are_reevaluated(system, gm, monkeypatch):
+    checked = _record_checks(system, monkeypatch)
+    system.check_achievements(gm)
+    assert set(checked) == {a.id for a in system.achievements.values() if not a.unlocked}
+
+    checked.clear()
+    system.check_achievements(gm)
+    assert checked == []
+
+    checked.clear()
+    gm.economy.resources.gold = 50000
+    system.check_achievements(gm)
+    assert checked == ['treasury_master']
+    treasury = system.achievements['treasury_master']
+    assert treasury.current_value == 50000
+    assert treasury.progress == 50.0
+
+    checked.clear()
+    system.stats['turns_played'] = 3
+    system.check_achievements(gm)
+    assert checked == ['survivor']
+
+
+def test_unlocked_achievement_leaves_table(system, gm, monkeypatch):
+    system.check_achievements(gm)
+    gm.economy.resources.gold = 100000
+    unlocked = system.check_achievements(gm)
+    assert [a.id for a in unlocked] == ['treasury_master']
+    assert system.unlocked_count == 1
+    assert 'treasury_master' not in system._dependents.get('gold', [])
+
+    checked = _record_checks(system, monkeypatch)
+    gm.economy.resources.gold = 200000
+    system.check_achievements(gm)
+    assert 'treasury_master' not in checked
+
+
+def test_from_dict_recompiles_table(system, gm):
+    gm.economy.resources.gold = 100000
+    system.check_achievements(gm)
+    loaded = AchievementSystem.from_dict(system.to_dict())
+    assert loaded.achievements['treasury_master'].unlocked
+    assert 'treasury_master' not in loaded._dependents.get('gold', [])
+    assert 'survivor' in loaded._dependents['turns_played']
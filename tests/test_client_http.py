@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+"""
+HTTP istemcisi: oda olaylarının callback'lere dağıtımı.
+"""
+
+import pytest
+
+pytest.importorskip('requests')
+
+from network.client_http import HTTPNetworkClient  # noqa: E402
+
+
+def _battle_event():
+    return {
+        'seq': 7, 'type': 'battle_result', 'player_id': 'saldiran',
+        'attacker_id': 'saldiran', 'defender_id': 'savunan',
+        'message': 'Yenilgi! Ordunuzun %30\'u kaybedildi.', 'defender_losses': 120,
+    }
+
+
+def _client(player_id):
+    client = HTTPNetworkClient()
+    client.player_id = player_id
+    received = []
+    client.register_callback('battle_result', received.append)
+    return client, received
+
+
+@pytest.mark.parametrize('player_id', ['saldiran', 'seyirci'])
+def test_battle_result_is_not_sent_to_non_defenders(player_id):
+    client, received = _client(player_id)
+    client._dispatch_room_event(_battle_event(), {})
+    assert received == []
+
+
+def test_battle_result_reaches_defender():
+    client, received = _client('savunan')
+    client._dispatch_room_event(_battle_event(), {})
+    assert received == [_battle_event()]
@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+"""
+ConstructionSystem toplu değer önbelleği: artımlı güncellemeler baştan
+hesaplamayla aynı sonucu vermeli.
+"""
+
+import copy
+
+import pytest
+
+from game.systems.construction import (
+    BUILDING_DEFINITIONS, Building, BuildingType, ConstructionQueue, ConstructionSystem,
+)
+
+GETTERS = (
+    'get_total_maintenance', 'get_total_happiness_bonus', 'get_total_trade_bonus',
+    'get_total_military_bonus', 'get_food_production', 'get_gold_per_turn',
+    'get_population_capacity',
+)
+
+pytestmark = pytest.mark.usefixtures('headless_audio')
+
+
+def _snapshot(system):
+    values = {name: getattr(system, name)() for name in GETTERS}
+    values['synergy'] = {t: system.get_synergy_multiplier(t) for t in BuildingType}
+    return values
+
+
+def _recomputed(system):
+    fresh = ConstructionSystem()
+    fresh.buildings = copy.deepcopy(system.buildings)
+    fresh.rebuild_aggregate_cache()
+    return _snapshot(fresh)
+
+
+def _complete(system, building_type, is_upgrade=False):
+    system.construction_queue.append(ConstructionQueue(building_type, 1, is_upgrade=is_upgrade))
+    system.process_turn()
+
+
+def test_incremental_updates_match_rebuild():
+    system = ConstructionSystem()
+    assert _snapshot(system) == _recomputed(system)
+
+    for building_type in BuildingType:
+        if building_type not in system.buildings:
+            _complete(system, building_type)
+            assert _snapshot(system) == _recomputed(system)
+
+    for building_type in list(system.buildings)[:10]:
+        _complete(system, building_type, is_upgrade=True)
+        assert _snapshot(system) == _recomputed(system)
+
+    for building_type, building in system.buildings.items():
+        for module_id in BUILDING_DEFINITIONS[building_type].available_modules or {}:
+            assert system.install_module(building_type, module_id)
+        assert _snapshot(system) == _recomputed(system)
+
+    for building_type in list(system.buildings)[::2]:
+        assert system.demolish_building(building_type)
+        assert _snapshot(system) == _recomputed(system)
+
+
+def test_synergy_cache_follows_building_set():
+    system = ConstructionSystem()
+    target = next(t for t, s in BUILDING_DEFINITIONS.items() if s.synergy_with)
+    partner = BuildingType(BUILDING_DEFINITIONS[target].synergy_with[0])
+    system.demolish_building(partner)
+    before = system.get_synergy_multiplier(target)
+
+    _complete(system, partner)
+    assert system.get_synergy_multiplier(target) == before + 0.15
+
+    system.demolish_building(partner)
+    assert system.get_synergy_multiplier(target) == before
+
+
+def test_from_dict_rebuilds_cache():
+    system = ConstructionSystem()
+    system.buildings[BuildingType.INN] = Building(BuildingType.INN, level=3)
+    system.refresh_building(BuildingType.INN)
+    loaded = ConstructionSystem.from_dict(system.to_dict())
+    assert _snapshot(loaded) == _snapshot(system)
+    assert loaded.get_population_capacity() == 50000 + 30000
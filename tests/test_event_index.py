@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+"""
+Olay havuzu dizini: kovalar doğrusal taramayla aynı sonucu vermeli.
+"""
+
+from game.systems.events import (
+    EVENT_POOL, Event, EventIndex, EventSeverity, EventType,
+)
+
+
+def _scan(pool, event_type, year):
+    return [e for e in pool if e.event_type == event_type and e.min_year <= year <= e.max_year]
+
+
+def _event(event_id, event_type=EventType.ECONOMIC, min_year=0, max_year=9999):
+    return Event(event_id, event_id, '', event_type, EventSeverity.MINOR, [],
+                 min_year=min_year, max_year=max_year)
+
+
+def test_candidates_match_linear_scan():
+    index = EventIndex(EVENT_POOL)
+    for event_type in EventType:
+        for year in range(1480, 1720):
+            assert index.candidates(event_type, year) == _scan(EVENT_POOL, event_type, year)
+
+
+def test_get_returns_first_definition():
+    first = _event('kopya')
+    pool = [first, _event('kopya', EventType.MILITARY)]
+    index = EventIndex(pool)
+    assert index.get('kopya') is first
+    assert index.get('yok') is None
+
+
+def test_pool_growth_rebuilds_index():
+    pool = [_event('eski', max_year=1550)]
+    index = EventIndex(pool)
+    assert index.candidates(EventType.ECONOMIC, 1600) == []
+
+    late = _event('yeni', min_year=1580, max_year=1620)
+    pool.append(late)
+    assert index.candidates(EventType.ECONOMIC, 1600) == [late]
+    assert index.get('yeni') is late
+
+
+def test_epoch_boundaries_are_inclusive():
+    pool = [_event('dar', min_year=1530, max_year=1540)]
+    index = EventIndex(pool)
+    assert index.candidates(EventType.ECONOMIC, 1529) == []
+    assert index.candidates(EventType.ECONOMIC, 1530) == pool
+    assert index.candidates(EventType.ECONOMIC, 1540) == pool
+    assert index.candidates(EventType.ECONOMIC, 1541) == []
@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+"""
+HTTP sunucusu hız sınırı: token bucket ve rota bütçeleri.
+"""
+
+import pytest
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(server_http, monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(server_http.time, 'monotonic', fake)
+    return fake
+
+
+def test_bucket_allows_burst_then_refills(server_http, clock):
+    limiter = server_http.TokenBucketLimiter(60)
+    assert all(limiter.allow('1.1.1.1') for _ in range(60))
+    assert not limiter.allow('1.1.1.1')
+
+    clock.now += 1.0  # 60/dk -> saniyede bir jeton
+    assert limiter.allow('1.1.1.1')
+    assert not limiter.allow('1.1.1.1')
+
+
+def test_keys_have_separate_buckets(server_http, clock):
+    limiter = server_http.TokenBucketLimiter(2)
+    assert limiter.allow('a') and limiter.allow('a')
+    assert not limiter.allow('a')
+    assert limiter.allow('b')
+
+
+def test_idle_keys_are_evicted(server_http, clock):
+    limiter = server_http.TokenBucketLimiter(60)
+    for i in range(100):
+        limiter.allow(f'10.1.0.{i}')
+    assert len(limiter) == 100
+
+    clock.now += limiter.idle_seconds
+    limiter.allow('yeni')
+    assert len(limiter) == 1
+
+
+def test_routes_map_to_existing_endpoints(server_http):
+    for endpoint, budget in server_http.ROUTE_BUDGETS.items():
+        assert endpoint in server_http.app.view_functions, endpoint
+        assert budget in server_http._rate_limiters, budget
+
+
+def test_chat_flood_does_not_block_turn_actions(server_http, http_client):
+    code = http_client.post('/room/create', json={'player_id': 'p', 'name': 'P'}).get_json()['room_code']
+    statuses = [
+        http_client.post(f'/room/{code}/chat', json={'player_id': 'p', 'message': str(i)}).status_code
+        for i in range(server_http.CHAT_RATE_LIMIT_PER_MINUTE + 5)
+    ]
+    assert statuses.count(200) == server_http.CHAT_RATE_LIMIT_PER_MINUTE
+    assert statuses[-1] == 429
+
+    # Oyun başlamadığı için 400; önemli olan 429 olmaması
+    assert http_client.post(f'/room/{code}/end_turn', json={'player_id': 'p'}).status_code != 429
+    assert http_client.get(f'/room/{code}').status_code == 200
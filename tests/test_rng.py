@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+"""
+Sefer rastgele akışı: durum kaydı/geri yükleme ve seferler arası bağımsızlık.
+"""
+
+import json
+import random
+
+from game.game_manager import GameManager
+from game.rng import get_rng_state, seed_rng, set_rng_state
+
+
+def test_state_round_trip_through_json():
+    rng = random.Random()
+    seed = seed_rng(rng, 1520)
+    rng.random()
+    rng.gauss(0, 1)  # gauss_next da kayda girmeli
+
+    data = json.loads(json.dumps(get_rng_state(rng, seed)))
+    expected = [rng.random() for _ in range(5)] + [rng.gauss(0, 1)]
+
+    restored = random.Random()
+    assert set_rng_state(restored, data) == 1520
+    assert [restored.random() for _ in range(5)] + [restored.gauss(0, 1)] == expected
+
+
+def test_seed_rng_generates_seed_when_missing():
+    rng = random.Random()
+    seed = seed_rng(rng)
+    assert isinstance(seed, int)
+    assert rng.random() == random.Random(seed).random()
+
+
+def _play(gm, turns):
+    for _ in range(turns):
+        gm.process_turn()
+
+
+def test_campaigns_do_not_share_stream():
+    a = GameManager(headless=True)
+    b = GameManager(headless=True)
+    other = GameManager(headless=True)
+    try:
+        a.new_game(seed=7)
+        b.new_game(seed=7)
+        other.new_game(seed=99)
+        assert a.rng is not b.rng
+        assert a.economy.rng is a.rng and a.warfare.rng is a.rng
+
+        # Araya giren başka bir sefer aynı tohumlu seferleri kaydırmamalı
+        for _ in range(12):
+            _play(a, 1)
+            _play(other, 2)
+            _play(b, 1)
+        assert a.rng.getstate() == b.rng.getstate()
+        assert a.economy.resources.gold == b.economy.resources.gold
+    finally:
+        for gm in (a, b, other):
+            gm.close()
+
+
+def test_save_state_restores_stream():
+    gm = GameManager(headless=True)
+    try:
+        gm.new_game(seed=11)
+        _play(gm, 3)
+        data = json.loads(json.dumps(gm._build_save_data(1)['rng'], default=str))
+        assert data['seed'] == 11
+        expected = [gm.rng.random() for _ in range(3)]
+
+        set_rng_state(gm.rng, data)
+        assert [gm.rng.random() for _ in range(3)] == expected
+    finally:
+        gm.close()
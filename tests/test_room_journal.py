@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+"""
+Oda olay günlükleri: HTTP RoomJournal ve WebSocket FrameJournal.
+"""
+
+import json
+
+import pytest
+
+from server_journal import JOURNAL_MAX_EVENTS, FrameJournal
+
+
+# ===== HTTP (server_http.RoomJournal) =====
+
+def test_room_journal_resumes_from_cursor(server_http):
+    journal = server_http.RoomJournal(last_seq=10, limit=3)
+    assert journal.since(10) == []
+    for name in ('a', 'b', 'c', 'd'):
+        journal.append('chat_message', {'message': name})
+
+    assert [e['seq'] for e in journal.since(12)] == [13, 14]
+    assert journal.since(11) == list(journal.events)
+    assert journal.since(10) is None  # 11 sıkıştırıldı
+    assert journal.since(99) is None  # gelecekteki imleç
+
+
+def test_room_journal_defaults_to_shared_limit(server_http):
+    assert server_http.RoomJournal().events.maxlen == JOURNAL_MAX_EVENTS
+
+
+def test_events_endpoint(server_http, http_client):
+    code = http_client.post('/room/create', json={'player_id': 'h', 'name': 'H'}).get_json()['room_code']
+    http_client.post(f'/room/{code}/join', json={'player_id': 'g', 'name': 'G'})
+    http_client.post(f'/room/{code}/chat', json={'player_id': 'h', 'message': 'selam'})
+
+    body = http_client.get(f'/room/{code}/events', query_string={'since': 0}).get_json()
+    assert [e['type'] for e in body['events']] == ['player_joined', 'chat_message']
+    assert body['cursor'] == 2 and not body['reset']
+
+    body = http_client.get(f'/room/{code}/events', query_string={'since': 50}).get_json()
+    assert body['reset'] and body['events'] == []
+
+
+# ===== WebSocket (server_journal.FrameJournal) =====
+
+def _frame(seq, size=10):
+    return json.dumps({'seq': seq, 'pad': 'x' * size})
+
+
+def _seqs(frames):
+    return [json.loads(frame)['seq'] for frame in frames]
+
+
+def test_frames_are_filtered_per_recipient():
+    journal = FrameJournal()
+    journal.append(1, None, None, _frame(1))
+    journal.append(2, 'p1', None, _frame(2))
+    journal.append(3, None, 'p1', _frame(3))
+    journal.append(4, 'p2', None, _frame(4))
+
+    assert _seqs(journal.since('p1', 0, 4)) == [1, 2]
+    assert _seqs(journal.since('p2', 0, 4)) == [1, 3, 4]
+    assert _seqs(journal.since('p2', 3, 4)) == [4]
+    assert journal.since('p1', None, 4) is None
+    assert journal.since('p1', 5, 4) is None
+
+
+def test_journal_is_bounded_by_bytes():
+    journal = FrameJournal(max_events=100, max_bytes=500, max_event_bytes=500)
+    for seq in range(1, 21):
+        journal.append(seq, None, None, _frame(seq, 80))
+    assert journal.size <= 500
+    assert journal.size == sum(len(entry[3]) for entry in journal.entries)
+    first = journal.entries[0][0]
+    assert journal.since('p', first - 2, 20) is None
+    assert len(journal.since('p', first - 1, 20)) == len(journal)
+
+
+def test_oversized_frame_forces_reset_only_for_its_recipient():
+    journal = FrameJournal(max_event_bytes=100)
+    journal.append(1, None, None, _frame(1))
+    journal.append(2, 'p1', None, _frame(2, 500))
+    journal.append(3, None, None, _frame(3))
+
+    assert journal.size == len(_frame(1)) + len(_frame(3))
+    assert journal.since('p1', 0, 3) is None
+    assert journal.since('p1', 2, 3) == [_frame(3)]
+    assert journal.since('p2', 0, 3) == [_frame(1), _frame(3)]
+
+
+def test_websocket_reconnect_replays_filtered_events():
+    pytest.importorskip('websockets')
+    from server import GameRoom, GameServer, Player
+
+    game_server = GameServer('127.0.0.1', 0)
+    room = GameRoom(code='ABCDEF', host_id='p1', players={
+        'p1': Player('p1', 'A', 'Rum Eyaleti'), 'p2': Player('p2', 'B', 'Anadolu Eyaleti'),
+    })
+    game_server.publish(room, {'type': 'chat_message', 'message': 'herkese'})
+    game_server.publish(room, {'type': 'alliance_proposal'}, to='p2')
+    game_server.publish(room, {'type': 'turn_ended'}, exclude_id='p2')
+
+    assert [e['type'] for e in game_server.events_since(room, 'p2', 0)] == ['chat_message', 'alliance_proposal']
+    assert [e['seq'] for e in game_server.events_since(room, 'p1', 1)] == [3]
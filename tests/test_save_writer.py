@@ -0,0 +1,151 @@
+# -*- coding: utf-8 -*-
+"""
+Kayıt yazıcı: atomik yazım, arka plan yazıcısı, kompakt kodlama, başlık
+özetleri ve kayıt kopyası.
+"""
+
+import json
+import os
+
+import pytest
+
+from config import SAVE_SLOT_COUNT
+from game import game_manager, save_writer
+from game.save_migration import SaveMigrator
+from game.save_writer import (
+    SAVE_MAGIC, BackgroundSaveWriter, decode_save_data, encode_save_data, is_compact_save,
+    read_save_file, read_save_header, read_save_summary, snapshot_save_data, write_file_atomic,
+    write_save_atomic,
+)
+
+
+def _save_data(gold=1000):
+    return {
+        'version': 1,
+        'game_id': 'test',
+        'province': {'name': 'Rum Eyaleti'},
+        'time': {'year': 1520, 'month': 3, 'turn': 7},
+        'economy': {'resources': {'gold': gold}},
+        'history': {'entries': [{'turn': 1, 'note': 'Şehzade sancağa çıktı'}]},
+    }
+
+
+def test_atomic_write_replaces_file_without_leftovers(tmp_path):
+    path = tmp_path / 'save_1.json'
+    write_save_atomic(str(path), _save_data(1))
+    write_save_atomic(str(path), _save_data(2))
+    assert read_save_file(str(path))['economy']['resources']['gold'] == 2
+    assert os.listdir(tmp_path) == ['save_1.json']
+
+
+def test_failed_write_keeps_previous_save(tmp_path, monkeypatch):
+    path = tmp_path / 'save_1.json'
+    write_save_atomic(str(path), _save_data(1))
+
+    def fail(src, dst):
+        raise OSError('disk dolu')
+
+    monkeypatch.setattr(save_writer.os, 'replace', fail)
+    with pytest.raises(OSError):
+        write_file_atomic(str(path), b'bozuk')
+    assert read_save_file(str(path))['economy']['resources']['gold'] == 1
+    assert os.listdir(tmp_path) == ['save_1.json']
+
+
+def test_snapshot_is_independent_of_live_data():
+    live = _save_data()
+    snapshot = snapshot_save_data(live)
+    live['economy']['resources']['gold'] = 0
+    live['history']['entries'].append({'turn': 2})
+    assert snapshot == _save_data()
+
+
+def test_background_writer_reports_results(tmp_path):
+    writer = BackgroundSaveWriter()
+    results = []
+    good = tmp_path / 'auto.json'
+    writer.submit(str(good), _save_data(5), callback=lambda p, e: results.append((p, e)))
+    writer.submit(str(tmp_path / 'bad.json'), _save_data(),
+                  callback=lambda p, e: results.append((p, e)),
+                  encoder=lambda data: 1 / 0)
+    writer.flush()
+
+    assert writer.pending() == 0
+    assert results[0] == (str(good), None)
+    assert isinstance(results[1][1], ZeroDivisionError)
+    assert read_save_file(str(good))['economy']['resources']['gold'] == 5
+    assert not (tmp_path / 'bad.json').exists()
+
+
+@pytest.mark.parametrize('compressed', [True, False])
+def test_encode_decode_round_trip(compressed):
+    data = _save_data()
+    payload = encode_save_data(data, compressed=compressed)
+    assert is_compact_save(payload) == compressed
+    assert decode_save_data(payload) == data
+
+
+def test_compact_encoding_is_smaller_than_indented_json():
+    data = _save_data()
+    data['history']['entries'] *= 200
+    assert len(encode_save_data(data, compressed=True)) < len(encode_save_data(data, compressed=False)) / 4
+
+
+def test_legacy_json_with_bom_still_decodes():
+    payload = json.dumps(_save_data(), ensure_ascii=False, indent=2).encode('utf-8-sig')
+    assert decode_save_data(payload) == _save_data()
+
+
+def test_unknown_compact_encoding_is_rejected():
+    payload = SAVE_MAGIC + b'{"version":1,"encoding":"json+lzma"}\n' + b'...'
+    with pytest.raises(ValueError):
+        decode_save_data(payload)
+
+
+def test_migrator_accepts_raw_file_bytes():
+    data = _save_data()
+    from_bytes = SaveMigrator.migrate(encode_save_data(data, compressed=True))
+    assert from_bytes == SaveMigrator.migrate(_save_data())
+
+
+def test_header_carries_slot_summary(tmp_path):
+    path = tmp_path / 'slot_1.json'
+    path.write_bytes(encode_save_data(_save_data(), compressed=True))
+    header = read_save_header(str(path))
+    assert header['encoding'] == 'json+zlib'
+    assert header['summary'] == {
+        'province': 'Rum Eyaleti', 'year': 1520, 'month': 3, 'turn': 7,
+        'gold': 1000, 'game_id': 'test', 'auto_save': False,
+    }
+
+
+def test_summary_reads_only_the_header(tmp_path):
+    path = tmp_path / 'slot_1.json'
+    payload = encode_save_data(_save_data(), compressed=True)
+    path.write_bytes(payload[:payload.index(b'\n') + 1] + b'bozuk govde')
+    assert read_save_summary(str(path))['province'] == 'Rum Eyaleti'
+
+
+def test_legacy_save_summary_falls_back_to_full_parse(tmp_path):
+    path = tmp_path / 'slot_1.json'
+    path.write_bytes(encode_save_data(_save_data(), compressed=False))
+    assert read_save_header(str(path)) is None
+    assert read_save_summary(str(path))['gold'] == 1000
+
+
+def test_slot_listing_includes_extra_slots(tmp_path, monkeypatch):
+    saves = tmp_path / 'saves'
+    saves.mkdir()
+    (saves / 'slot_2.json').write_bytes(encode_save_data(_save_data(), compressed=False))
+    (saves / f'slot_{SAVE_SLOT_COUNT + 3}.json').write_bytes(encode_save_data(_save_data(7)))
+    (saves / 'slot_4.json').write_bytes(b'bozuk')
+    (saves / 'notlar.txt').write_text('yuva degil')
+    monkeypatch.setattr(game_manager, 'get_base_path', lambda: str(tmp_path))
+
+    with game_manager.GameManager(headless=True) as gm:
+        slots = {info['slot']: info for info in gm.get_save_slots_info()}
+
+    assert sorted(slots) == list(range(1, SAVE_SLOT_COUNT + 1)) + [SAVE_SLOT_COUNT + 3]
+    assert slots[2]['province'] == 'Rum Eyaleti' and not slots[2]['empty']
+    assert slots[SAVE_SLOT_COUNT + 3]['gold'] == 7
+    assert slots[4]['empty'] and slots[1]['empty']
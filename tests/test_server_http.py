@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+"""
+HTTP sunucusu: oda ve bölüm ETag'leri, koşullu istekler (304).
+"""
+
+import json
+
+import pytest
+
+
+@pytest.fixture
+def room_code(http_client):
+    response = http_client.post('/room/create', json={'player_id': 'host', 'name': 'Host'})
+    return response.get_json()['room_code']
+
+
+def _get(client, url, etag=None, **params):
+    headers = {'If-None-Match': f'"{etag}"'} if etag else {}
+    return client.get(url, query_string=params, headers=headers)
+
+
+def _chat(client, code, message='selam'):
+    response = client.post(f'/room/{code}/chat', json={'player_id': 'host', 'message': message})
+    assert response.status_code == 200
+
+
+def test_unchanged_room_returns_304(http_client, room_code):
+    first = _get(http_client, f'/room/{room_code}')
+    etag = first.get_etag()[0]
+    assert first.status_code == 200 and etag
+
+    again = _get(http_client, f'/room/{room_code}', etag)
+    assert again.status_code == 304
+    assert again.data == b''
+    assert again.get_etag()[0] == etag
+
+    _chat(http_client, room_code)
+    changed = _get(http_client, f'/room/{room_code}', etag)
+    assert changed.status_code == 200
+    assert changed.get_etag()[0] != etag
+
+
+def test_etag_from_previous_boot_is_not_matched(http_client, room_code):
+    etag = _get(http_client, f'/room/{room_code}').get_etag()[0]
+    stale = 'eskiboot' + etag[etag.index('-'):]
+    assert _get(http_client, f'/room/{room_code}', stale).status_code == 200
+
+
+def test_chat_does_not_change_core_etag(http_client, room_code):
+    first = _get(http_client, f'/room/{room_code}/core')
+    etag = first.get_etag()[0]
+    versions = json.loads(first.headers['X-Room-Versions'])
+
+    _chat(http_client, room_code)
+    again = _get(http_client, f'/room/{room_code}/core', etag)
+    assert again.status_code == 304
+    changed = json.loads(again.headers['X-Room-Versions'])
+    assert changed['section_versions']['chat'] > versions['section_versions']['chat']
+    assert changed['section_versions']['core'] == versions['section_versions']['core']
+    assert changed['version'] > versions['version']
+
+
+def test_chat_section_has_its_own_etag(http_client, room_code):
+    first = _get(http_client, f'/room/{room_code}/chat')
+    etag = first.get_etag()[0]
+    assert _get(http_client, f'/room/{room_code}/chat', etag).status_code == 304
+
+    _chat(http_client, room_code, 'ikinci')
+    changed = _get(http_client, f'/room/{room_code}/chat', etag)
+    assert changed.status_code == 200
+    assert [m['message'] for m in changed.get_json()['messages']][-1] == 'ikinci'
+
+
+def test_unknown_room_is_404(http_client):
+    assert _get(http_client, '/room/YOKYOK').status_code == 404
@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+"""
+WebSocket sunucusu: aksiyon şemaları ve dağıtım tablosu.
+"""
+
+import asyncio
+
+import pytest
+
+pytest.importorskip('websockets')
+
+from server import REQUIRED, ActionSchema, GameServer, PayloadError  # noqa: E402
+
+
+def test_schema_fills_defaults_without_sharing_them():
+    schema = ActionSchema(player_id=(str, REQUIRED), state=(dict, {}), ready=(bool, True))
+    first = schema.validate({'player_id': 'p'})
+    second = schema.validate({'player_id': 'p', 'state': None})
+    assert first == {'player_id': 'p', 'state': {}, 'ready': True}
+    first['state']['gold'] = 1
+    assert second['state'] == {}
+
+
+def test_schema_keeps_extra_fields_and_input():
+    schema = ActionSchema(message=(str, ''))
+    data = {'action': 'chat', 'extra': 1}
+    cleaned = schema.validate(data)
+    assert cleaned == {'action': 'chat', 'extra': 1, 'message': ''}
+    assert data == {'action': 'chat', 'extra': 1}
+
+
+def test_schema_rejects_missing_and_mistyped_fields():
+    schema = ActionSchema(room_code=(str, REQUIRED), last_seq=(int, None))
+    with pytest.raises(PayloadError, match='Eksik alan: room_code'):
+        schema.validate({})
+    with pytest.raises(PayloadError, match='Geçersiz alan: last_seq'):
+        schema.validate({'room_code': 'ABC', 'last_seq': '5'})
+    assert schema.validate({'room_code': 'ABC'})['last_seq'] is None
+
+
+@pytest.fixture
+def game_server():
+    return GameServer('127.0.0.1', 0)
+
+
+def _dispatch(server, data):
+    return asyncio.run(server.dispatch(None, data))
+
+
+def test_dispatch_routes_and_counts(game_server):
+    route, response = _dispatch(game_server, {'action': 'ping'})
+    assert response == {'type': 'pong'}
+    assert route.stats.calls == 1
+
+    route, response = _dispatch(game_server, {'action': 'yok'})
+    assert route is None and response['type'] == 'error'
+    assert game_server.unknown_actions == 1
+
+    route, response = _dispatch(game_server, {'action': 'join_room', 'room_code': 5})
+    assert response == {'type': 'error', 'message': 'Geçersiz alan: room_code'}
+    assert route.stats.invalid == 1 and route.stats.calls == 0
+
+
+def test_dispatch_requires_known_player(game_server):
+    route, response = _dispatch(game_server, {'action': 'chat', 'player_id': 'kimse'})
+    assert response == {'type': 'error', 'message': 'Oyuncu bulunamadı'}
+    assert route.stats.invalid == 1
+
+
+def test_dispatch_rejects_non_object_messages(game_server):
+    assert _dispatch(game_server, ['ping'])[1]['type'] == 'error'
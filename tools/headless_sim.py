@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+"""
+Osmanlı Eyalet Simülasyonu - Headless Tur Simülatörü
+====================================================
+Oyunu pygame ekranı, ses ve ekran okuyucu olmadan çalıştırır; bir seferi
+N tur ilerletir ve saniyedeki tur sayısını raporlar. Geç oyun durumlarını
+dayanıklılık/denge testi için hızlıca üretmekte kullanılır.
+
+Kullanım:
+    python tools/headless_sim.py --turns 1000
+    python tools/headless_sim.py --turns 5000 --province "Ege Eyaleti" --coastal
+    python tools/headless_sim.py --turns 1000 --seed 42   # tekrarlanabilir koşu
+
+Not: Headless modda otomatik kayıt ve kalıcı başarı kaydı devre dışıdır;
+oyuncunun kayıt yuvaları değişmez. Olaylarda her zaman seçilen sıradaki
+seçenek (varsayılan: ilk seçenek) uygulanır.
+
+--ignore-game-over ile oyun sonundan sonra da turlar işlenir; ancak bu
+turlar bitmiş bir seferi ilerlettiği için ayrı sayılır ve tur/saniye
+hesabına katılmaz.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+# Proje kökünü yol listesine ekle (tools/ altından çalıştırıldığında)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from game.game_manager import GameManager
+
+
+def _resolve_event(gm: GameManager, choice_index: int):
+    """Bekleyen olayı (çok aşamalı olaylar dahil) sabit seçimle kapat."""
+    # Çok aşamalı olaylarda her aşama bir seçim ister; sonsuz döngüye karşı sınır
+    for _ in range(10):
+        event = gm.events.current_event
+        if not event:
+            return
+        choices = event.choices
+        if gm.events.current_stage and event.stages:
+            stage = event.stages.get(gm.events.current_stage)
+            if stage:
+                choices = stage.choices
+        if not choices:
+            gm.events.dismiss_event()
+            return
+        effects = gm.events.make_choice(min(choice_index, len(choices) - 1))
+        gm.apply_event_effects(effects)
+    gm.events.dismiss_event()
+
+
+def run(turns: int, province: str = None, coastal: bool = False,
+        choice_index: int = 0, stop_on_game_over: bool = True,
+        seed: int = None) -> dict:
+    """
+    Headless bir sefer başlat ve `turns` tur ilerlet.
+
+    Returns:
+        dict: Oynanan tur sayısı, toplam süre, tur/saniye ve son durum özeti.
+        'turns' ve 'turns_per_second' yalnızca oyun sürerken işlenen turları
+        sayar; oyun sonundan sonraki turlar 'post_game_over_turns' alanındadır.
+    """
+    with GameManager(headless=True) as gm:
+        gm.new_game(province, seed=seed)
+        gm.province.is_coastal = coastal
+
+        played = 0
+        post_game_over = 0
+        elapsed = 0.0
+        for _ in range(turns):
+            was_over = gm.game_over
+            start = time.perf_counter()
+            gm.process_turn()
+            _resolve_event(gm, choice_index)
+
+            # UI'nin tüketeceği bekleyen raporları temizle
+            gm.consume_pending_raid_report()
+            gm.consume_pending_siege_battle()
+            gm.consume_pending_raid_battle()
+
+            if was_over:
+                post_game_over += 1
+                continue
+            elapsed += time.perf_counter() - start
+            played += 1
+            if gm.game_over and stop_on_game_over:
+                break
+
+        return {
+            'turns': played,
+            'post_game_over_turns': post_game_over,
+            'elapsed': elapsed,
+            'turns_per_second': played / elapsed if elapsed > 0 else 0.0,
+            'seed': gm.seed,
+            'game_over_reason': gm.game_over_reason if gm.game_over else None,
+            'summary': gm.get_summary(),
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Headless tur simülatörü")
+    parser.add_argument('--turns', type=int, default=1000, help="İlerletilecek tur sayısı")
+    parser.add_argument('--province', default=None, help="Eyalet adı")
+    parser.add_argument('--coastal', action='store_true', help="Kıyı eyaleti olarak başlat")
+    parser.add_argument('--choice', type=int, default=0, help="Olaylarda seçilecek seçenek sırası")
+    parser.add_argument('--seed', type=int, default=None,
+                        help="Sefer tohumu (aynı tohum aynı turları üretir)")
+    parser.add_argument('--ignore-game-over', action='store_true',
+                        help="Oyun sonu koşulunda durmadan devam et")
+    args = parser.parse_args()
+
+    result = run(
+        turns=args.turns,
+        province=args.province,
+        coastal=args.coastal,
+        choice_index=args.choice,
+        stop_on_game_over=not args.ignore_game_over,
+        seed=args.seed,
+    )
+
+    summary = result['summary']
+    print(f"Tur: {result['turns']}  Süre: {result['elapsed']:.2f} sn  "
+          f"Hız: {result['turns_per_second']:.1f} tur/sn  Tohum: {result['seed']}")
+    print(f"Yıl {summary['year']}, Ay {summary['month']} | Altın: {summary['gold']:,} | "
+          f"Nüfus: {summary['population']:,} | Sadakat: {summary['sultan_loyalty']}")
+    if result['game_over_reason']:
+        print(f"Oyun sonu: {result['game_over_reason']}")
+    if result['post_game_over_turns']:
+        print(f"Oyun sonundan sonra işlenen tur: {result['post_game_over_turns']} "
+              f"(hız hesabına katılmadı)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,697 @@
+# -*- coding: utf-8 -*-
+"""
+Osmanlı Eyalet Simülasyonu - Çok Odalı Sunucu Yük Testi
+=======================================================
+server_http.py (REST/polling) ve server.py (WebSocket) sunucularını yerel
+makinede ayrı süreç olarak başlatır ve yapılandırılabilir sayıda oda ve
+simüle oyuncuyla yükler. Oyuncular oda kurar/katılır, eyalet seçer, oyunu
+başlatır; ardından düşünme süreleriyle polling yapar, tur bitirir, sohbet
+eder, durum senkronize eder, diplomasi teklif eder, savaş ilan edip saldırır.
+
+Rapor: toplam verim (istek/sn), rota başına p50/p95/p99 gecikme, hata ve
+red oranları ile sunucu sürecinin RSS belleği (başlangıç/tepe/son).
+
+Hata: bağlantı hatası, zaman aşımı, HTTP 5xx. Red: HTTP 4xx (429 dahil) veya
+WebSocket "error" yanıtı — oyun kuralı reddi sunucu arızası sayılmaz.
+poll_long rotasının gecikmesi long-poll bekleme süresini de içerir; sunucu
+maliyeti için poll (ilk tam istek ve aralıklı mod) satırına bakın.
+
+Kullanım:
+    python tools/load_test.py --rooms 20 --players 4 --duration 60
+    python tools/load_test.py --target http --poll-mode interval --poll-interval 1
+    python tools/load_test.py --target ws --rooms 100 --json ws_100.json
+
+Notlar:
+    - HTTP sunucusu oda veritabanı olarak geçici bir dosya kullanır
+      (OES_ROOM_DB), gerçek server_rooms.db'ye dokunulmaz; ortam değişkeni
+      her iki sunucu sürecine de verilir.
+    - Sunucu IP başına hız sınırı uygular. Linux'ta her simüle oyuncu
+      127.0.0.0/8 içinden kendi kaynak adresini kullanır; bu mümkün değilse
+      tüm yük 127.0.0.1'den gelir ve 429 redleri beklenmelidir.
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import platform
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+# Proje kökünü yol listesine ekle (tools/ altından çalıştırıldığında)
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import websockets
+except ImportError:
+    websockets = None
+
+DEFAULT_HTTP_PORT = 5099
+DEFAULT_WS_PORT = 8799
+REQUEST_TIMEOUT = 30.0
+
+# Oyun içi aksiyon ağırlıkları (sırası gelmeyen oyuncu için)
+ACTION_WEIGHTS = {
+    'chat': 40,
+    'sync_state': 30,
+    'propose': 10,
+    'war': 5,
+    'attack': 15,
+}
+
+
+# ========== ÖLÇÜM ==========
+
+
+def percentile(sorted_values: list, q: float) -> float:
+    """Sıralı listede q (0-100) yüzdelik değeri (en yakın sıra)"""
+    if not sorted_values:
+        return 0.0
+    rank = math.ceil(q / 100.0 * len(sorted_values))
+    return sorted_values[min(len(sorted_values), max(1, rank)) - 1]
+
+
+class LatencyRecorder:
+    """Rota başına gecikme ve sonuç sayacı (iş parçacığı güvenli)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._samples = {}   # rota -> [saniye, ...]
+        self._errors = {}    # rota -> hata sayısı
+        self._rejected = {}  # rota -> red sayısı
+        self.broadcasts = 0  # WebSocket: alınan yayın mesajı sayısı
+
+    def record(self, route: str, seconds: float, outcome: str = 'ok'):
+        """outcome: 'ok', 'rejected' veya 'error'"""
+        with self._lock:
+            self._samples.setdefault(route, []).append(seconds)
+            if outcome == 'error':
+                self._errors[route] = self._errors.get(route, 0) + 1
+            elif outcome == 'rejected':
+                self._rejected[route] = self._rejected.get(route, 0) + 1
+
+    def count_broadcast(self):
+        with self._lock:
+            self.broadcasts += 1
+
+    def summary(self) -> dict:
+        """Rota başına özet istatistikler"""
+        with self._lock:
+            result = {}
+            for route, samples in sorted(self._samples.items()):
+                ordered = sorted(samples)
+                result[route] = {
+                    'count': len(ordered),
+                    'errors': self._errors.get(route, 0),
+                    'rejected': self._rejected.get(route, 0),
+                    'p50_ms': percentile(ordered, 50) * 1000.0,
+                    'p95_ms': percentile(ordered, 95) * 1000.0,
+                    'p99_ms': percentile(ordered, 99) * 1000.0,
+                    'max_ms': ordered[-1] * 1000.0,
+                }
+            return result
+
+
+def read_rss_bytes(pid: int):
+    """Sürecin RSS belleği (bayt); ölçülemiyorsa None"""
+    try:
+        with open(f"/proc/{pid}/status", 'r') as f:
+            for line in f:
+                if line.startswith('VmRSS:'):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    try:
+        import psutil
+        return psutil.Process(pid).memory_info().rss
+    except Exception:
+        return None
+
+
+# ========== SUNUCU SÜRECİ ==========
+
+
+class ServerProcess:
+    """Yük altındaki sunucu süreci; RSS'i arka planda örnekler"""
+
+    def __init__(self, name: str, cmd: list, port: int, env: dict = None, log_path: str = None):
+        self.name = name
+        self.cmd = cmd
+        self.port = port
+        self.env = env
+        self.log_path = log_path
+        self.proc = None
+        self.rss_start = None
+        self.rss_peak = None
+        self.rss_end = None
+        self._sampling = False
+        self._sampler = None
+
+    def start(self, ready_timeout: float = 20.0):
+        """Süreci başlat ve port dinlenene kadar bekle"""
+        log_file = open(self.log_path, 'wb') if self.log_path else subprocess.DEVNULL
+        self.proc = subprocess.Popen(
+            self.cmd, cwd=ROOT, env=self.env,
+            stdout=log_file, stderr=subprocess.STDOUT
+        )
+        deadline = time.monotonic() + ready_timeout
+        while time.monotonic() < deadline:
+            if self.proc.poll() is not None:
+                raise RuntimeError(f"{self.name} sunucusu başlatılamadı (çıkış kodu {self.proc.returncode})")
+            try:
+                with socket.create_connection(('127.0.0.1', self.port), timeout=0.5):
+                    break
+            except OSError:
+                time.sleep(0.2)
+        else:
+            self.stop()
+            raise RuntimeError(f"{self.name} sunucusu {ready_timeout:.0f} sn içinde hazır olmadı")
+
+        self.rss_start = read_rss_bytes(self.proc.pid)
+        self.rss_peak = self.rss_start
+        self._sampling = True
+        self._sampler = threading.Thread(target=self._sample_rss, daemon=True)
+        self._sampler.start()
+
+    def _sample_rss(self):
+        while self._sampling and self.proc.poll() is None:
+            rss = read_rss_bytes(self.proc.pid)
+            if rss is not None:
+                self.rss_peak = max(self.rss_peak or 0, rss)
+            time.sleep(0.5)
+
+    def stop(self):
+        """RSS'i kaydet ve süreci nazikçe kapat"""
+        self._sampling = False
+        if self.proc is None or self.proc.poll() is not None:
+            return
+        self.rss_end = read_rss_bytes(self.proc.pid)
+        self.proc.terminate()
+        try:
+            self.proc.wait(timeout=15)
+        except subprocess.TimeoutExpired:
+            self.proc.kill()
+            self.proc.wait()
+
+    def memory_report(self) -> dict:
+        return {'rss_start': self.rss_start, 'rss_peak': self.rss_peak, 'rss_end': self.rss_end}
+
+
+def _loopback_pool_available() -> bool:
+    """127.0.0.0/8 içinde 127.0.0.1 dışındaki adreslere bağlanılabiliyor mu?"""
+    try:
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+            sock.bind(('127.0.0.2', 0))
+        return True
+    except OSError:
+        return False
+
+
+def _source_ip(index: int) -> str:
+    """Simüle oyuncu için benzersiz loopback kaynak adresi"""
+    index += 2  # 127.0.0.1 sunucunun adresi
+    return f"127.{(index >> 16) & 255}.{(index >> 8) & 255}.{index & 255}"
+
+
+# ========== HTTP YÜKÜ ==========
+
+
+class _SourceAddressAdapter(HTTPAdapter):
+    """Bağlantıları belirli bir kaynak adresinden açan adaptör"""
+
+    def __init__(self, source_ip: str, **kwargs):
+        self.source_ip = source_ip
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs['source_address'] = (self.source_ip, 0)
+        super().init_poolmanager(*args, **kwargs)
+
+
+class HttpRoomSim:
+    """Tek odanın HTTP oyuncuları (oyuncu başına aksiyon + polling iş parçacığı)"""
+
+    def __init__(self, index: int, args, base_url: str, provinces: list,
+                 recorder: LatencyRecorder, deadline: float, spread_ips: bool):
+        self.index = index
+        self.args = args
+        self.base_url = base_url
+        self.provinces = provinces
+        self.recorder = recorder
+        self.deadline = deadline
+        self.code = None
+        self.current_player_id = None
+        self.player_ids = [f"load-{index}-{n}" for n in range(args.players)]
+        self.sessions = {}
+        for n, player_id in enumerate(self.player_ids):
+            session = requests.Session()
+            if spread_ips:
+                session.mount('http://', _SourceAddressAdapter(_source_ip(index * args.players + n)))
+            self.sessions[player_id] = session
+        self.joined = threading.Barrier(args.players)
+        self.selected = threading.Barrier(args.players)
+        self.started = threading.Event()
+        self.rng = random.Random(args.seed * 1000 + index)
+
+    def _request(self, route: str, player_id: str, method: str, path: str, **kwargs):
+        """İsteği gönder, gecikmeyi kaydet; yanıt veya None döndür"""
+        start = time.perf_counter()
+        try:
+            response = self.sessions[player_id].request(
+                method, self.base_url + path, timeout=kwargs.pop('timeout', REQUEST_TIMEOUT), **kwargs
+            )
+        except requests.RequestException:
+            self.recorder.record(route, time.perf_counter() - start, 'error')
+            return None
+        elapsed = time.perf_counter() - start
+        if response.status_code >= 500:
+            outcome = 'error'
+        elif response.status_code >= 400:
+            outcome = 'rejected'
+        else:
+            outcome = 'ok'
+        self.recorder.record(route, elapsed, outcome)
+        return response
+
+    def _post(self, route: str, player_id: str, path: str, payload: dict):
+        return self._request(route, player_id, 'POST', f"/room/{self.code}{path}", json=payload)
+
+    def run_player(self, seat: int):
+        """Bir oyuncunun yaşam döngüsü (iş parçacığı hedefi)"""
+        player_id = self.player_ids[seat]
+        try:
+            self._lobby(seat, player_id)
+        except threading.BrokenBarrierError:
+            return
+        poller = threading.Thread(target=self._poll_loop, args=(player_id,), daemon=True)
+        poller.start()
+        self._action_loop(player_id)
+        poller.join()
+        self._post('leave', player_id, '/leave', {'player_id': player_id})
+
+    def _lobby(self, seat: int, player_id: str):
+        """Oda kur/katıl, eyalet seç, oyunu başlat"""
+        if seat == 0:
+            r = self._request('create', player_id, 'POST', '/room/create',
+                              json={'player_id': player_id, 'name': f"Host {self.index}"})
+            if r is None or r.status_code != 200:
+                self.joined.abort()
+                raise threading.BrokenBarrierError
+            self.code = r.json()['room_code']
+        self.joined.wait()
+        if seat != 0:
+            self._post('join', player_id, '/join', {'player_id': player_id, 'name': f"Oyuncu {seat}"})
+        province = self.provinces[seat % len(self.provinces)]
+        self._post('select', player_id, '/select', {'player_id': player_id, 'province': province})
+        self.selected.wait()
+        if seat == 0:
+            r = self._post('start', player_id, '/start', {'player_id': player_id})
+            if r is not None and r.status_code == 200:
+                self.current_player_id = r.json()['room'].get('current_player_id')
+            self.started.set()
+        self.started.wait()
+
+    def _poll_loop(self, player_id: str):
+        """Oda durumunu ETag ile izle (aralıklı veya long-poll)"""
+        etag = None
+        while time.monotonic() < self.deadline:
+            headers = {'If-None-Match': etag} if etag else {}
+            params = {'player_id': player_id}
+            long_poll = self.args.poll_mode == 'long' and etag
+            if long_poll:
+                params['wait'] = max(1, min(20, int(self.deadline - time.monotonic())))
+            r = self._request('poll_long' if long_poll else 'poll', player_id, 'GET',
+                              f"/room/{self.code}", params=params, headers=headers)
+            if r is not None and r.status_code == 200:
+                etag = r.headers.get('ETag')
+                self.current_player_id = r.json()['room'].get('current_player_id')
+            if not long_poll or r is None or r.status_code >= 400:
+                time.sleep(self.args.poll_interval)
+
+    def _action_loop(self, player_id: str):
+        """Düşünme süresi aralıklarla oyun aksiyonları"""
+        others = [pid for pid in self.player_ids if pid != player_id]
+        enemies = set()
+        while True:
+            think = self.rng.expovariate(1.0 / self.args.think)
+            if time.monotonic() + think >= self.deadline:
+                time.sleep(max(0.0, self.deadline - time.monotonic()))
+                return
+            time.sleep(think)
+
+            if self.current_player_id == player_id:
+                r = self._post('end_turn', player_id, '/end_turn',
+                               {'player_id': player_id, 'state': {'gold': self.rng.randint(0, 9999)}})
+                if r is not None and r.status_code == 200:
+                    self.current_player_id = r.json()['room'].get('current_player_id')
+                continue
+
+            action = self.rng.choices(list(ACTION_WEIGHTS), weights=list(ACTION_WEIGHTS.values()))[0]
+            target = self.rng.choice(others)
+            if action == 'chat':
+                self._post('chat', player_id, '/chat',
+                           {'player_id': player_id, 'message': f"yük testi {self.rng.random():.4f}"})
+            elif action == 'sync_state':
+                self._post('sync_state', player_id, '/sync_state', {
+                    'player_id': player_id,
+                    'state': {'gold': self.rng.randint(0, 50000),
+                              'military_power': self.rng.randint(100, 5000),
+                              'population': self.rng.randint(10000, 500000)}
+                })
+            elif action == 'propose':
+                self._post('propose', player_id, '/diplomacy/propose', {
+                    'from_player_id': player_id, 'to_player_id': target,
+                    'type': self.rng.choice(['alliance', 'trade']), 'terms': {}
+                })
+            elif action == 'war' or not enemies:
+                r = self._post('war', player_id, '/diplomacy/war',
+                               {'attacker_id': player_id, 'defender_id': target})
+                if r is not None and r.status_code == 200:
+                    enemies.add(target)
+            else:
+                self._post('attack', player_id, '/attack', {
+                    'attacker_id': player_id, 'defender_id': self.rng.choice(sorted(enemies)),
+                    'power': self.rng.randint(100, 5000)
+                })
+
+
+def _server_env(tmpdir: str) -> dict:
+    """Sunucu süreci ortamı: oda veritabanı geçici dizinde (depodaki dosyaya yazılmaz)"""
+    return dict(os.environ, OES_ROOM_DB=os.path.join(tmpdir, 'rooms.db'), PYTHONUNBUFFERED='1')
+
+
+def run_http_load(args, spread_ips: bool) -> dict:
+    """server_http.py'yi başlat, yükle ve sonuçları döndür"""
+    tmpdir = tempfile.mkdtemp(prefix='oes_load_')
+    env = _server_env(tmpdir)
+    server = ServerProcess(
+        'HTTP',
+        [sys.executable, os.path.join(ROOT, 'server_http.py'), '--host', '127.0.0.1',
+         '--port', str(args.http_port), '--production', '--threads', str(args.threads)],
+        args.http_port, env=env, log_path=os.path.join(tmpdir, 'server_http.log')
+    )
+    server.start()
+    base_url = f"http://127.0.0.1:{args.http_port}"
+    recorder = LatencyRecorder()
+    try:
+        provinces = requests.get(f"{base_url}/provinces", timeout=REQUEST_TIMEOUT).json()['provinces']
+        started = time.monotonic()
+        deadline = started + args.duration
+        sims = [HttpRoomSim(i, args, base_url, provinces, recorder, deadline, spread_ips)
+                for i in range(args.rooms)]
+        threads = [threading.Thread(target=sim.run_player, args=(seat,), daemon=True)
+                   for sim in sims for seat in range(args.players)]
+        for thread in threads:
+            thread.start()
+            time.sleep(args.ramp / max(1, len(threads)))
+        for thread in threads:
+            thread.join()
+        elapsed = time.monotonic() - started
+    finally:
+        server.stop()
+    return _result('server_http.py', recorder, elapsed, server, server.log_path)
+
+
+# ========== WEBSOCKET YÜKÜ ==========
+
+# İsteğe verilen doğrudan yanıt türleri; diğer tüm mesajlar yayındır
+WS_RESPONSE_TYPES = {'success', 'error', 'room_created', 'room_joined', 'pong', 'reconnected', 'room_loaded'}
+
+
+class WsPlayerSim:
+    """Tek WebSocket oyuncusu: yanıtları yayınlardan ayıran okuyucu görevle"""
+
+    def __init__(self, room: 'WsRoomSim', seat: int):
+        self.room = room
+        self.seat = seat
+        self.ws = None
+        self.player_id = None
+        self._responses = asyncio.Queue()
+        self._reader = None
+
+    async def connect(self, url: str):
+        self.ws = await websockets.connect(url, max_size=None)
+        self._reader = asyncio.create_task(self._read_loop())
+
+    async def _read_loop(self):
+        try:
+            async for raw in self.ws:
+                message = json.loads(raw)
+                if message.get('type') in WS_RESPONSE_TYPES:
+                    await self._responses.put(message)
+                    continue
+                self.room.recorder.count_broadcast()
+                if message.get('type') == 'turn_ended':
+                    self.room.current_player_id = message.get('current_player')
+                elif message.get('type') == 'game_started':
+                    self.room.current_player_id = message['room'].get('current_player_id')
+        except Exception:
+            pass
+        await self._responses.put(None)  # Bağlantı kapandı
+
+    async def request(self, route: str, payload: dict):
+        """Mesaj gönder, doğrudan yanıtı bekle ve gecikmeyi kaydet"""
+        start = time.perf_counter()
+        try:
+            await self.ws.send(json.dumps(payload))
+            response = await asyncio.wait_for(self._responses.get(), REQUEST_TIMEOUT)
+        except Exception:
+            response = None
+        elapsed = time.perf_counter() - start
+        if response is None:
+            outcome = 'error'
+        elif response.get('type') == 'error':
+            outcome = 'rejected'
+        else:
+            outcome = 'ok'
+        self.room.recorder.record(route, elapsed, outcome)
+        return response
+
+    async def close(self):
+        if self.ws is not None:
+            await self.ws.close()
+        if self._reader is not None:
+            await self._reader
+
+
+class WsRoomSim:
+    """Tek odanın WebSocket oyuncuları"""
+
+    def __init__(self, index: int, args, url: str, recorder: LatencyRecorder, deadline: float):
+        self.index = index
+        self.args = args
+        self.url = url
+        self.recorder = recorder
+        self.deadline = deadline
+        self.code = None
+        self.current_player_id = None
+        self.rng = random.Random(args.seed * 1000 + index)
+        self.players = [WsPlayerSim(self, seat) for seat in range(args.players)]
+
+    async def run(self):
+        try:
+            for player in self.players:
+                await player.connect(self.url)
+            if not await self._lobby():
+                return
+            await asyncio.gather(*(self._action_loop(p) for p in self.players))
+        except Exception:
+            self.recorder.record('connect', 0.0, 'error')
+        finally:
+            for player in self.players:
+                try:
+                    await player.close()
+                except Exception:
+                    pass
+
+    async def _lobby(self) -> bool:
+        host = self.players[0]
+        created = await host.request('create_room', {'action': 'create_room', 'player_name': f"Host {self.index}"})
+        if not created or not created.get('success'):
+            return False
+        self.code = created['room_code']
+        host.player_id = created['player_id']
+        available = created['room'].get('available_provinces', [])
+
+        for player in self.players[1:]:
+            joined = await player.request('join_room', {'action': 'join_room', 'room_code': self.code,
+                                                        'player_name': f"Oyuncu {player.seat}"})
+            if not joined or not joined.get('success'):
+                return False
+            player.player_id = joined['player_id']
+
+        for player in self.players:
+            province = available[player.seat % len(available)]
+            await player.request('select_province', {'action': 'select_province',
+                                                     'player_id': player.player_id, 'province': province})
+        started = await host.request('start_game', {'action': 'start_game', 'player_id': host.player_id})
+        return bool(started and started.get('type') == 'success')
+
+    async def _action_loop(self, player: WsPlayerSim):
+        others = [p.player_id for p in self.players if p is not player]
+        while True:
+            think = self.rng.expovariate(1.0 / self.args.think)
+            if time.monotonic() + think >= self.deadline:
+                return
+            await asyncio.sleep(think)
+
+            if self.current_player_id == player.player_id:
+                await player.request('end_turn', {'action': 'end_turn', 'player_id': player.player_id,
+                                                  'state': {'gold': self.rng.randint(0, 9999)}})
+                continue
+
+            action = self.rng.choices(list(ACTION_WEIGHTS), weights=list(ACTION_WEIGHTS.values()))[0]
+            target = self.rng.choice(others)
+            if action == 'chat':
+                await player.request('chat', {'action': 'chat', 'player_id': player.player_id,
+                                              'message': f"yük testi {self.rng.random():.4f}"})
+            elif action == 'sync_state':
+                await player.request('update_state', {
+                    'action': 'update_state', 'player_id': player.player_id,
+                    'state': {'gold': self.rng.randint(0, 50000), 'army': self.rng.randint(100, 5000)}
+                })
+            else:
+                kind = {'propose': 'propose_alliance', 'war': 'declare_war', 'attack': 'battle'}[action]
+                await player.request('diplomacy', {'action': 'diplomacy', 'diplomacy_action': kind,
+                                                   'player_id': player.player_id, 'target_id': target})
+
+
+async def _run_ws_rooms(args, url: str, recorder: LatencyRecorder, deadline: float):
+    sims = [WsRoomSim(i, args, url, recorder, deadline) for i in range(args.rooms)]
+    tasks = []
+    for sim in sims:
+        tasks.append(asyncio.create_task(sim.run()))
+        await asyncio.sleep(args.ramp / max(1, len(sims)))
+    await asyncio.gather(*tasks)
+
+
+def run_ws_load(args) -> dict:
+    """server.py'yi başlat, yükle ve sonuçları döndür"""
+    tmpdir = tempfile.mkdtemp(prefix='oes_load_')
+    server = ServerProcess(
+        'WebSocket',
+        [sys.executable, os.path.join(ROOT, 'server.py'), '--host', '127.0.0.1', '--port', str(args.ws_port)],
+        args.ws_port, env=_server_env(tmpdir),
+        log_path=os.path.join(tmpdir, 'server_ws.log')
+    )
+    server.start()
+    recorder = LatencyRecorder()
+    try:
+        started = time.monotonic()
+        asyncio.run(_run_ws_rooms(args, f"ws://127.0.0.1:{args.ws_port}", recorder,
+                                  started + args.duration))
+        elapsed = time.monotonic() - started
+    finally:
+        server.stop()
+    return _result('server.py', recorder, elapsed, server, server.log_path)
+
+
+# ========== RAPOR ==========
+
+
+def _result(name: str, recorder: LatencyRecorder, elapsed: float, server: ServerProcess, log_path: str) -> dict:
+    routes = recorder.summary()
+    total = sum(r['count'] for r in routes.values())
+    return {
+        'server': name,
+        'elapsed_s': elapsed,
+        'requests': total,
+        'throughput_rps': total / elapsed if elapsed > 0 else 0.0,
+        'errors': sum(r['errors'] for r in routes.values()),
+        'rejected': sum(r['rejected'] for r in routes.values()),
+        'broadcasts': recorder.broadcasts,
+        'memory': server.memory_report(),
+        'server_log': log_path,
+        'routes': routes,
+    }
+
+
+def _mb(value) -> str:
+    return f"{value / (1024 * 1024):.1f} MB" if value else "?"
+
+
+def print_report(report: dict):
+    """Sonuç tablolarını yazdır"""
+    cfg = report['config']
+    print(f"Python {report['python']} | {cfg['rooms']} oda x {cfg['players']} oyuncu | "
+          f"{cfg['duration']} sn | düşünme {cfg['think']} sn | polling {cfg['poll_mode']}")
+    for result in report['results']:
+        mem = result['memory']
+        print()
+        print(f"== {result['server']} ==")
+        print(f"İstek: {result['requests']} | verim {result['throughput_rps']:.1f} istek/sn | "
+              f"hata {result['errors']} | red {result['rejected']}"
+              + (f" | yayın {result['broadcasts']}" if result['broadcasts'] else ""))
+        print(f"RSS: başlangıç {_mb(mem['rss_start'])}, tepe {_mb(mem['rss_peak'])}, son {_mb(mem['rss_end'])}")
+        header = (f"{'Rota':<16}{'adet':>8}{'hata %':>9}{'red %':>8}"
+                  f"{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'maks ms':>10}")
+        print(header)
+        print("-" * len(header))
+        for route, stats in result['routes'].items():
+            count = stats['count']
+            print(f"{route:<16}{count:>8}{stats['errors'] / count * 100:>8.1f}%"
+                  f"{stats['rejected'] / count * 100:>7.1f}%{stats['p50_ms']:>10.1f}"
+                  f"{stats['p95_ms']:>10.1f}{stats['p99_ms']:>10.1f}{stats['max_ms']:>10.1f}")
+        print(f"Sunucu günlüğü: {result['server_log']}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Çok odalı sunucu yük testi")
+    parser.add_argument('--target', choices=['http', 'ws', 'both'], default='both', help="Yüklenecek sunucu")
+    parser.add_argument('--rooms', type=int, default=10, help="Oda sayısı")
+    parser.add_argument('--players', type=int, default=4, help="Oda başına oyuncu (2-10)")
+    parser.add_argument('--duration', type=float, default=30.0, help="Oyun aşaması süresi (sn)")
+    parser.add_argument('--think', type=float, default=3.0, help="Aksiyonlar arası ortalama düşünme süresi (sn)")
+    parser.add_argument('--poll-mode', choices=['long', 'interval'], default='long',
+                        help="HTTP polling: long-poll (?wait=) veya sabit aralık")
+    parser.add_argument('--poll-interval', type=float, default=2.0, help="Aralıklı polling süresi (sn)")
+    parser.add_argument('--ramp', type=float, default=2.0, help="Tüm oyuncuların bağlanma süresi (sn)")
+    parser.add_argument('--threads', type=int, default=32, help="HTTP sunucusu iş parçacığı sayısı")
+    parser.add_argument('--http-port', type=int, default=DEFAULT_HTTP_PORT)
+    parser.add_argument('--ws-port', type=int, default=DEFAULT_WS_PORT)
+    parser.add_argument('--seed', type=int, default=1520, help="Simülasyon tohumu")
+    parser.add_argument('--json', dest='json_path', default=None, help="Sonuçları bu JSON dosyasına yaz")
+    args = parser.parse_args()
+    args.players = max(2, min(10, args.players))
+
+    results = []
+    if args.target in ('http', 'both'):
+        spread_ips = _loopback_pool_available()
+        if not spread_ips:
+            print("Uyarı: 127.0.0.0/8 kaynak adresleri kullanılamıyor; IP hız sınırı redleri beklenir.")
+        results.append(run_http_load(args, spread_ips))
+    if args.target in ('ws', 'both'):
+        if websockets is None:
+            print("websockets kütüphanesi gerekli: pip install websockets")
+        else:
+            results.append(run_ws_load(args))
+
+    report = {
+        'python': platform.python_version(),
+        'config': {
+            'rooms': args.rooms, 'players': args.players, 'duration': args.duration,
+            'think': args.think, 'poll_mode': args.poll_mode, 'poll_interval': args.poll_interval,
+            'threads': args.threads,
+        },
+        'results': results,
+    }
+    print_report(report)
+
+    if args.json_path:
+        with open(args.json_path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"\nSonuçlar yazıldı: {args.json_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,375 @@
+# -*- coding: utf-8 -*-
+"""
+Osmanlı Eyalet Simülasyonu - Tur Hattı Kıyaslama (Benchmark) Paketi
+===================================================================
+Sentetik geç oyun durumları kurar ve tur hattının sıcak noktalarını tek tek
+ölçer. Kurulum sabit tohumla yapıldığından sonuçlar commit'ler arasında
+karşılaştırılabilir: imparatorluk büyüdükçe maliyetin nasıl arttığı tahmin
+edilmek yerine ölçülür.
+
+Geç oyun durumu: tüm bina türleri azami seviyede ve eklentileriyle, 100+ işçi,
+100 top, büyük donanma, uzun event_history / war_history listeleri ve çok
+sayıda diplomatik ilişki.
+
+Kullanım:
+    python tools/turn_benchmark.py
+    python tools/turn_benchmark.py --scale 2 --json bench_new.json
+    python tools/turn_benchmark.py --compare bench_old.json
+
+Not: Headless modda çalışır; kayıt yuvalarına ve kalıcı başarılara dokunmaz.
+"""
+
+import argparse
+import copy
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+
+# Proje kökünü yol listesine ekle (tools/ altından çalıştırıldığında)
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from game.game_manager import GameManager
+from game.rng import seed_rng
+from game.systems.construction import Building, BuildingType, BUILDING_DEFINITIONS
+from game.systems.workers import WorkerType
+from game.systems.artillery import Cannon, CannonType
+from game.systems.naval import Ship, ShipType
+from game.systems.military import UnitType
+from game.systems.diplomacy import Relation, RelationType, AIPersonality
+from game.systems.events import EVENT_POOL
+from game.systems.warfare import BattlePhase
+
+DEFAULT_SEED = 1520
+
+
+def build_late_game(seed: int = DEFAULT_SEED, scale: int = 1) -> GameManager:
+    """
+    Sentetik geç oyun GameManager'ı kur.
+    scale: Liste boyutlarının çarpanı (işçi, top, gemi, geçmiş, ilişki)
+    """
+    gm = GameManager(headless=True)
+    gm.new_game("Rum Eyaleti", seed=seed)
+    gm.province.is_coastal = True
+
+    # Zaman: ~8 yıl ilerlemiş sefer
+    gm.current_year = 1528
+    gm.current_month = 6
+    gm.current_day = 15
+    gm.turn_count = 3000
+
+    # Ekonomi ve ordu
+    res = gm.economy.resources
+    res.gold = 400000
+    res.food = 200000
+    res.wood = res.iron = res.stone = 50000
+    for unit_type in UnitType:
+        gm.military.units[unit_type] = 2000 * scale
+    gm.population.population.farmers *= 3
+
+    # İnşaat: her bina türü azami seviyede, tüm eklentileriyle
+    buildings = gm.construction.buildings
+    for building_type in BuildingType:
+        stats = BUILDING_DEFINITIONS[building_type]
+        building = Building(building_type, level=stats.max_level)
+        if stats.available_modules:
+            for module_id in stats.available_modules:
+                building.install_module(module_id)
+        buildings[building_type] = building
+    gm.construction.rebuild_aggregate_cache()
+
+    # İşçiler (100+)
+    worker_types = list(WorkerType)
+    for i in range(120 * scale):
+        gm.workers.hire_worker(worker_types[i % len(worker_types)], skill=1 + i % 5)
+
+    # Topçu (100 top)
+    cannon_types = list(CannonType)
+    for i in range(100 * scale):
+        cannon_type = cannon_types[i % len(cannon_types)]
+        gm.artillery.cannons.append(Cannon(
+            cannon_id=f"bench_cannon_{i}",
+            cannon_type=cannon_type,
+            name=f"{cannon_type.value} {i}",
+            experience=i % 100
+        ))
+
+    # Donanma
+    ship_types = list(ShipType)
+    for i in range(60 * scale):
+        ship_type = ship_types[i % len(ship_types)]
+        gm.naval.ships.append(Ship(
+            ship_id=f"bench_ship_{i}",
+            ship_type=ship_type,
+            name=f"{ship_type.value} {i}",
+            experience=i % 100
+        ))
+
+    # Uzun olay ve savaş geçmişi
+    event_ids = [e.id for e in EVENT_POOL]
+    gm.events.event_history = [event_ids[i % len(event_ids)] for i in range(2000 * scale)]
+    gm.warfare.war_history = [
+        {
+            'target': f"Hedef {i}",
+            'type': ('raid', 'siege', 'naval_raid')[i % 3],
+            'victory': i % 2 == 0,
+            'terrain': 'plains',
+            'weather': 'clear',
+        }
+        for i in range(1000 * scale)
+    ]
+    for i in range(gm.history.max_entries):
+        gm.history.add_entry(turn=i, year=1520 + i // 360, message=f"Geçmiş kaydı {i}", category="general")
+
+    # Diplomasi: çok sayıda ilişki, vassal ve ittifak
+    personalities = list(AIPersonality)
+    for i in range(40 * scale):
+        relation = Relation(f"Devlet {i}", (i * 37) % 200 - 100, RelationType.NEUTRAL,
+                            personalities[i % len(personalities)])
+        relation.update_type()
+        gm.diplomacy.neighbors[relation.target] = relation
+    gm.diplomacy.vassals = [
+        {'name': f"Devlet {i}", 'tribute': 300, 'loyalty': 60, 'military_support': 100}
+        for i in range(5 * scale)
+    ]
+    gm.diplomacy.marriage_alliances = [
+        {'partner': f"Devlet {i}", 'turns_active': i, 'relation_bonus': 20}
+        for i in range(5 * scale)
+    ]
+
+    # Aktif savaşlar (process_battles için)
+    gm.warfare.protection_disabled = True
+    gm.warfare.start_raid("Bosna Sancağı", gm.military, gm.economy, gm.turn_count)
+    gm.warfare.start_siege("Belgrad Kalesi", gm.military, gm.economy, gm.turn_count)
+
+    return gm
+
+
+def _time_calls(fn, setup=None, repeat: int = 50) -> list:
+    """fn'i `repeat` kez çağır; her çağrıdan önce (ölçüm dışı) setup çalışır. ms listesi döner."""
+    samples = []
+    for _ in range(repeat):
+        if setup:
+            setup()
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000.0)
+    return samples
+
+
+def bench_process_turn(seed: int, scale: int, repeat: int) -> list:
+    """Taze geç oyun durumundan art arda `repeat` tur"""
+    with build_late_game(seed, scale) as gm:
+        def setup():
+            # Açık olay ve UI raporları sonraki turu kilitlemesin (ölçüm dışı)
+            gm.events.dismiss_event()
+            gm.consume_pending_raid_report()
+            gm.consume_pending_siege_battle()
+            gm.consume_pending_raid_battle()
+
+        seed_rng(gm.rng, seed)
+        return _time_calls(gm.process_turn, setup, repeat)
+
+
+class _OpenGateRng(random.Random):
+    """
+    Kurulumdan sonraki ilk randint çağrısında alt sınırı döndüren akış.
+    check_for_event'teki olay şansı kapısı (randint(1, 100) > base_chance)
+    böylece her çağrıda geçilir; sonraki çekilişler normal akıştan gelir.
+    """
+
+    def __init__(self, seed: int):
+        super().__init__(seed)
+        self.open_gate = False
+
+    def randint(self, a: int, b: int) -> int:
+        if self.open_gate:
+            self.open_gate = False
+            return a
+        return super().randint(a, b)
+
+
+def bench_check_for_event(gm: GameManager, seed: int, repeat: int) -> list:
+    """
+    EventSystem.check_for_event — olay şansı kapısı her çağrıda açılır, ölçüm
+    erken dönüşü değil tür seçimi ve aday süzmeyi (EventIndex) kapsar
+    """
+    events = gm.events
+    game_state = {
+        'happiness': 40,
+        'at_war': True,
+        'loyalty': gm.diplomacy.sultan_loyalty,
+        'player_gender': 'male',
+        'player_title': None,
+        'turn_count': gm.turn_count,
+    }
+
+    gate_rng = _OpenGateRng(seed)
+
+    def setup():
+        events.current_event = None
+        events.events_this_year = 0
+        gate_rng.open_gate = True
+
+    campaign_rng, events.rng = events.rng, gate_rng
+    try:
+        return _time_calls(lambda: events.check_for_event(gm.current_year, game_state), setup, repeat)
+    finally:
+        events.rng = campaign_rng
+
+
+def bench_process_battles(gm: GameManager, seed: int, repeat: int) -> list:
+    """WarfareSystem.process_battles — savaşlar çözüm aşamasında"""
+    warfare = gm.warfare
+    for battle in warfare.active_battles:
+        battle.phase = BattlePhase.COMBAT
+        battle.turns_remaining = 1
+        battle.combat_ready = False
+    template_battles = copy.deepcopy(warfare.active_battles)
+    template_units = dict(gm.military.units)
+    war_history_len = len(warfare.war_history)
+
+    def setup():
+        warfare.active_battles = copy.deepcopy(template_battles)
+        gm.military.units = dict(template_units)
+        del warfare.war_history[war_history_len:]
+
+    seed_rng(gm.rng, seed)
+    return _time_calls(
+        lambda: warfare.process_battles(gm.military, artillery_power=500, siege_bonus=50,
+                                        naval_power=300, naval_system=gm.naval),
+        setup, repeat
+    )
+
+
+def bench_check_achievements(gm: GameManager, repeat: int) -> list:
+    """AchievementSystem.check_achievements — tüm başarılar kilitli, tüm girdiler değişmiş"""
+    achievements = gm.achievements
+
+    def setup():
+        for ach in achievements.achievements.values():
+            ach.unlocked = False
+        achievements.reset_evaluation()
+
+    return _time_calls(lambda: achievements.check_achievements(gm), setup, repeat)
+
+
+def bench_analyze_turn(gm: GameManager, repeat: int) -> list:
+    """DivanSystem.analyze_turn"""
+    divan = gm.divan
+
+    def setup():
+        divan.last_analysis_turn = -1
+
+    return _time_calls(lambda: divan.analyze_turn(gm), setup, repeat)
+
+
+def bench_build_save_data(gm: GameManager, repeat: int) -> list:
+    """GameManager._build_save_data"""
+    return _time_calls(lambda: gm._build_save_data(1), repeat=repeat)
+
+
+def _summarize(samples: list) -> dict:
+    return {
+        'median_ms': statistics.median(samples),
+        'min_ms': min(samples),
+        'mean_ms': statistics.fmean(samples),
+        'max_ms': max(samples),
+        'samples': len(samples),
+    }
+
+
+def _git_revision() -> str:
+    try:
+        return subprocess.check_output(
+            ['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT, stderr=subprocess.DEVNULL
+        ).decode().strip()
+    except Exception:
+        return "unknown"
+
+
+def run_suite(seed: int = DEFAULT_SEED, scale: int = 1, repeat: int = 50) -> dict:
+    """Tüm sıcak noktaları ölç ve sonuç dict'i döndür"""
+    with build_late_game(seed, scale) as gm:
+        fixture = {
+            'buildings': len(gm.construction.buildings),
+            'workers': len(gm.workers.workers),
+            'cannons': len(gm.artillery.cannons),
+            'ships': len(gm.naval.ships),
+            'event_history': len(gm.events.event_history),
+            'war_history': len(gm.warfare.war_history),
+            'relations': len(gm.diplomacy.neighbors),
+        }
+
+        results = {
+            'process_turn': bench_process_turn(seed, scale, repeat),
+            'check_for_event': bench_check_for_event(gm, seed, repeat),
+            'process_battles': bench_process_battles(gm, seed, repeat),
+            'check_achievements': bench_check_achievements(gm, repeat),
+            'analyze_turn': bench_analyze_turn(gm, repeat),
+            'build_save_data': bench_build_save_data(gm, repeat),
+        }
+
+    return {
+        'revision': _git_revision(),
+        'python': platform.python_version(),
+        'seed': seed,
+        'scale': scale,
+        'repeat': repeat,
+        'fixture': fixture,
+        'results': {name: _summarize(samples) for name, samples in results.items()},
+    }
+
+
+def print_report(report: dict, baseline: dict = None):
+    """Sonuç tablosunu yazdır (baseline verilirse medyan farkıyla)"""
+    fixture = ", ".join(f"{k}={v}" for k, v in report['fixture'].items())
+    print(f"Revizyon {report['revision']} | Python {report['python']} | "
+          f"tohum {report['seed']} | ölçek {report['scale']} | tekrar {report['repeat']}")
+    print(f"Durum: {fixture}")
+    print()
+    header = f"{'Sıcak nokta':<20}{'medyan ms':>12}{'min ms':>12}{'maks ms':>12}"
+    if baseline:
+        header += f"{'önceki ms':>12}{'fark':>10}"
+    print(header)
+    print("-" * len(header))
+    for name, stats in report['results'].items():
+        line = f"{name:<20}{stats['median_ms']:>12.3f}{stats['min_ms']:>12.3f}{stats['max_ms']:>12.3f}"
+        if baseline:
+            old = baseline.get('results', {}).get(name)
+            if old and old['median_ms'] > 0:
+                change = (stats['median_ms'] - old['median_ms']) / old['median_ms'] * 100.0
+                line += f"{old['median_ms']:>12.3f}{change:>+9.1f}%"
+        print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Tur hattı kıyaslama paketi")
+    parser.add_argument('--seed', type=int, default=DEFAULT_SEED, help="Kurulum ve ölçüm tohumu")
+    parser.add_argument('--scale', type=int, default=1, help="Geç oyun liste boyutu çarpanı")
+    parser.add_argument('--repeat', type=int, default=50, help="Her sıcak nokta için ölçüm sayısı")
+    parser.add_argument('--json', dest='json_path', default=None, help="Sonuçları bu JSON dosyasına yaz")
+    parser.add_argument('--compare', default=None, help="Önceki bir JSON sonucuyla karşılaştır")
+    args = parser.parse_args()
+
+    report = run_suite(seed=args.seed, scale=args.scale, repeat=args.repeat)
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+    print_report(report, baseline)
+
+    if args.json_path:
+        with open(args.json_path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"\nSonuçlar yazıldı: {args.json_path}")
+
+
+if __name__ == "__main__":
+    main()
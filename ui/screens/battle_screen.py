@@ -97,6 +97,12 @@ class BattleScreen(BaseScreen):
             self.player_morale = battle_data.get('attacker_army', {}).get('morale', 100)
             self.enemy_morale = battle_data.get('defender_army', {}).get('morale', 80)
     
+    @property
+    def rng(self):
+        """Sefer akışı: zar, ganimet ve doktrin seçimleri kayıttan tekrarlanabilir olsun"""
+        gm = self.screen_manager.game_manager
+        return gm.rng if gm else random
+    
     def on_enter(self):
         """Savaş ekranına girildiğinde"""
         self._initialize_battle()
@@ -165,7 +171,7 @@ class BattleScreen(BaseScreen):
             
         # Düşman Komutan Profili Atama (Doktrin)
         doctrines = ['SERDENGECTI', 'MUHENDIS', 'AKINCI_BEYI', 'DENGE']
-        self.enemy_doctrine = random.choice(doctrines)
+        self.enemy_doctrine = self.rng.choice(doctrines)
         
         # Topları moda göre filtrele
         self.deployed_cannons = []
@@ -833,8 +839,8 @@ class BattleScreen(BaseScreen):
                 loot_gold = 0
                 loot_food = 0
                 if self.victory:
-                    loot_gold = random.randint(500, 2000)
-                    loot_food = random.randint(100, 500)
+                    loot_gold = self.rng.randint(500, 2000)
+                    loot_food = self.rng.randint(100, 500)
                     if is_naval:
                         loot_gold = int(loot_gold * 1.5)
                     gm.economy.add_resources(gold=loot_gold, food=loot_food)
@@ -848,12 +854,12 @@ class BattleScreen(BaseScreen):
                 
                 # Deniz akınında gemi hasarı
                 if is_naval and hasattr(gm, 'naval'):
-                    damage_roll = random.randint(10, 30)
+                    damage_roll = self.rng.randint(10, 30)
                     if not self.victory:
                         damage_roll = int(damage_roll * 1.5)
                     warships = [s for s in gm.naval.ships if s.get_definition().is_warship]
                     for ship in warships:
-                        dmg = int(damage_roll * random.uniform(0.5, 1.5))
+                        dmg = int(damage_roll * self.rng.uniform(0.5, 1.5))
                         ship.health -= dmg
                         if ship.health <= 0:
                             gm.naval.ships.remove(ship)
@@ -866,7 +872,7 @@ class BattleScreen(BaseScreen):
                 # Normal Kuşatma Sonu (Saldıran Biziz)
                 if self.victory:
                     get_music_manager().play_context(MusicContext.VICTORY, force=True)
-                    loot = random.randint(5000, 15000)
+                    loot = self.rng.randint(5000, 15000)
                     gm.economy.add_resources(gold=loot)
                     gm.diplomacy.sultan_loyalty = min(100, gm.diplomacy.sultan_loyalty + 10)
                     gm.military.experience = min(100, gm.military.experience + 15)
@@ -927,21 +933,21 @@ class BattleScreen(BaseScreen):
         if self.enemy_morale < 30:
             choices.extend(['defend', 'defend', 'surrender'])
             
-        return random.choice(choices)
+        return self.rng.choice(choices)
 
     def _resolve_tactics(self, pt: str, et: str):
         """Seçilen iki taktiği çaprazlaştırarak Taş-Kağıt-Makas matrisi uygula"""
         
         if pt == 'surrender':
             surrender_chance = (100 - self.enemy_morale) / 100
-            if random.random() < surrender_chance or et == 'surrender':
+            if self.rng.random() < surrender_chance or et == 'surrender':
                 self.victory = True
                 self.battle_ended = True
                 self.last_action_result = "ZAFER! Düşman teslim oldu!"
                 self.combat_log.append(f"Tur {self.current_round}: Düşman teslimiyet çağrımızı kabul etti. Savaş sona erdi.")
                 return
             else:
-                self.player_morale -= random.randint(10, 20)
+                self.player_morale -= self.rng.randint(10, 20)
                 self.last_action_result = "Teslim çağrısı reddedildi! Düşman savaşa devam ediyor."
                 self.combat_log.append(f"Tur {self.current_round}: Teslim çağrısı yaptık ancak düşman reddetti. Moralimiz bozuldu.")
                 return
@@ -1110,7 +1116,7 @@ class BattleScreen(BaseScreen):
             if weather == WeatherType.SNOW:
                 # Kış şartları yıpranma (attrition) yapar
                 attrition_morale = 5
-                attrition_cas = random.randint(30, 80)
+                attrition_cas = self.rng.randint(30, 80)
                 
                 # Paşa Lojistikçi ise kış hasarını engeller
                 cmdr = self.current_battle.attacker_army.commander
@@ -1197,7 +1203,7 @@ class BattleScreen(BaseScreen):
             self._artillery_result = None  # Temizle
         
         # Çözümleme ve Ses Efekti (Stereo Panning)
-        base_e_dmg = random.randint(15, 30)
+        base_e_dmg = self.rng.randint(15, 30)
         
         # Pan ayarları: -1.0 Sol Kulak, 1.0 Sağ Kulak
         # Oyuncu flank (kanat): Sol ağırlıklı (-0.6)
@@ -1230,8 +1236,8 @@ class BattleScreen(BaseScreen):
                 self.current_battle.abilities_used.append(ability.name_tr)
                 
             # Yetenek hasarı
-            final_p_dmg = ability.morale_damage + random.randint(-5, 5)
-            e_cas = int(ability.damage_multiplier * random.randint(60, 120))
+            final_p_dmg = ability.morale_damage + self.rng.randint(-5, 5)
+            e_cas = int(ability.damage_multiplier * self.rng.randint(60, 120))
             
             if ability_type == SpecialAbilityType.JANISSARY_VOLLEY:
                 matchup_desc += "Yoğun tüfek volisi düşmanı taradı! "
@@ -1240,21 +1246,21 @@ class BattleScreen(BaseScreen):
             elif ability_type == SpecialAbilityType.CANNON_BARRAGE:
                 matchup_desc += "Tüm toplar ateş açıp surları sarstı! "
                 if self.current_battle and self.current_battle.siege_state:
-                    self.current_battle.siege_state.wall_integrity -= random.randint(10, 25)
+                    self.current_battle.siege_state.wall_integrity -= self.rng.randint(10, 25)
             elif ability_type == SpecialAbilityType.CAVALRY_CHARGE:
                 matchup_desc += "Ağır süvariler düşman hattına dalıp kırdı! "
                 
             final_e_dmg = int(base_e_dmg * e_dmg_mult)
-            p_cas = int(random.randint(40, 100) * e_dmg_mult)
+            p_cas = int(self.rng.randint(40, 100) * e_dmg_mult)
             
         else:
             # Standart taktik hasarı
-            base_p_dmg = random.randint(15, 30)
+            base_p_dmg = self.rng.randint(15, 30)
             final_p_dmg = int(base_p_dmg * p_dmg_mult)
             final_e_dmg = int(base_e_dmg * e_dmg_mult)
             
-            p_cas = int(random.randint(40, 100) * e_dmg_mult)
-            e_cas = int(random.randint(40, 100) * p_dmg_mult)
+            p_cas = int(self.rng.randint(40, 100) * e_dmg_mult)
+            e_cas = int(self.rng.randint(40, 100) * p_dmg_mult)
             
             if pt == 'artillery':
                 self.audio.play_game_sound_panned('military', 'cannon', pan=player_pan)
@@ -611,7 +611,6 @@ class BuildingInteriorScreen(BaseScreen):
         if not gm or not self.building_type:
             return
             
-        building = gm.construction.buildings[self.building_type]
         stats = BUILDING_DEFINITIONS[self.building_type]
         module_stats = stats.available_modules[module_id]
         
@@ -622,7 +621,7 @@ class BuildingInteriorScreen(BaseScreen):
             
         # Harcama ve Kurulum
         gm.economy.spend(module_stats.cost_gold, module_stats.cost_wood, module_stats.cost_iron)
-        building.install_module(module_id)
+        gm.construction.install_module(self.building_type, module_id)
         
         # Ses ve Bildirim
         self.audio.play_ui_sound('build')
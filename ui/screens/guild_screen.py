@@ -74,7 +74,7 @@ class GuildScreen(BaseScreen):
         if not gm:
             return None
         if not hasattr(gm, 'guild_system'):
-            gm.guild_system = GuildSystem()
+            gm.guild_system = GuildSystem(rng=gm.rng)
         return gm.guild_system
     
     def _setup_guild_menu(self):
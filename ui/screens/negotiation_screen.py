@@ -409,9 +409,8 @@ class NegotiationScreen(BaseScreen):
         # Olay zinciri modu mu?
         use_chain = self.offer_values.get('use_event_chain', 0)
         
-        # Rastgele sonuç
-        import random
-        success = random.randint(1, 100) <= acceptance
+        # Rastgele sonuç (sefer akışından)
+        success = gm.rng.randint(1, 100) <= acceptance
         
         # ========================
         # EVLİLİK
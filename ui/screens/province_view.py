@@ -411,6 +411,15 @@ class ProvinceViewScreen(BaseScreen):
                 self.audio.speak(f"Müzik sesi: yüzde {int(new_vol * 100)}", interrupt=True)
                 return True
             
+            # F12 - Debug: son tur aşama süreleri (Shift+F12: JSON'a dök)
+            if event.key == pygame.K_F12:
+                if gm:
+                    if event.mod & pygame.KMOD_SHIFT:
+                        self._dump_turn_timings()
+                    else:
+                        self._announce_turn_timings()
+                return True
+            
             # Tab - Erişilebilir istatistik paneli aç/kapat
             if event.key == pygame.K_TAB:
                 if self._stats_mode:
@@ -580,6 +589,40 @@ class ProvinceViewScreen(BaseScreen):
         else:
             self.audio.speak(f"Net kayıp: {abs(net):,} altın her tur", interrupt=False)
     
+    def _announce_turn_timings(self):
+        """Son turun en yavaş aşamalarını oku (debug)"""
+        gm = self.screen_manager.game_manager
+        last = gm.profiler.get_last()
+        if not last:
+            self.audio.speak("Henüz ölçülmüş tur yok.", interrupt=True)
+            return
+        
+        self.audio.speak(
+            f"Tur {last['turn']} süresi: {last['total_ms']:.1f} milisaniye.",
+            interrupt=True
+        )
+        slowest = sorted(last['stages'].items(), key=lambda s: s[1], reverse=True)[:5]
+        for stage, ms in slowest:
+            self.audio.speak(f"{stage}: {ms:.1f} ms", interrupt=False)
+        
+        stats = gm.profiler.get_stage_stats()
+        if stats:
+            worst = stats[0]
+            self.audio.speak(
+                f"Son {len(gm.profiler.records)} turda en yavaş aşama {worst['stage']}: "
+                f"ortalama {worst['avg_ms']:.1f}, en yüksek {worst['max_ms']:.1f} ms.",
+                interrupt=False
+            )
+    
+    def _dump_turn_timings(self):
+        """Tur aşama sürelerini JSON'a dök (debug)"""
+        gm = self.screen_manager.game_manager
+        try:
+            path = gm.dump_turn_timings()
+            self.audio.speak(f"Tur süreleri kaydedildi: {path}", interrupt=True)
+        except Exception as e:
+            self.audio.announce_action_result("Tur süreleri kaydetme", False, str(e))
+    
     def _announce_warnings(self):
         """Uyarıları oku"""
         gm = self.screen_manager.game_manager
@@ -24,10 +24,11 @@ class SaveLoadScreen(BaseScreen):
         # Yuva menüsü
         self.slot_menu = MenuList(
             x=(SCREEN_WIDTH - 500) // 2,
-            y=250,
+            y=200,
             width=500,
-            item_height=80
+            item_height=40
         )
+        self.slot_numbers = []  # Menü sırasına göre yuva numaraları
         
         self.back_button = Button(
             x=20,
@@ -57,6 +58,7 @@ class SaveLoadScreen(BaseScreen):
     def _update_slots(self):
         """Yuva listesini güncelle"""
         self.slot_menu.clear()
+        self.slot_numbers = []
         gm = self.screen_manager.game_manager
         if not gm:
             return
@@ -68,12 +70,17 @@ class SaveLoadScreen(BaseScreen):
                 text = f"Yuva {info['slot']}: Boş"
             else:
                 text = f"Yuva {info['slot']}: {info['province']} - Yıl {info['year']} ({info['turn']} tur)"
+                if info.get('gold') is not None:
+                    text += f", {int(info['gold']):,} altın"
+                if info.get('auto_save'):
+                    text += " [otomatik]"
             
             slot_num = info['slot']
+            self.slot_numbers.append(slot_num)
             self.slot_menu.add_item(
                 text,
                 lambda s=slot_num: self._select_slot(s),
-                str(slot_num)
+                str(slot_num) if slot_num <= 9 else None  # 1-9 tuş kısayolu
             )
     
     def announce_screen(self):
@@ -81,7 +88,7 @@ class SaveLoadScreen(BaseScreen):
             self.audio.announce_screen_change("Oyun Kaydet")
         else:
             self.audio.announce_screen_change("Oyun Yükle")
-        self.audio.speak("Bir yuva seçin. 1, 2 veya 3 tuşlarına basın. Delete ile silin.", interrupt=False)
+        self.audio.speak("Bir yuva seçin. 1-9 tuşlarına basın veya oklarla gezinin. Delete ile silin.", interrupt=False)
     
     def handle_event(self, event) -> bool:
         # Onay bekleniyorsa özel işle
@@ -107,22 +114,13 @@ class SaveLoadScreen(BaseScreen):
                 self._go_back()
                 return True
             
-            # 1, 2, 3 - Doğrudan yuva seç
-            if event.key == pygame.K_1:
-                self._select_slot(1)
-                return True
-            if event.key == pygame.K_2:
-                self._select_slot(2)
-                return True
-            if event.key == pygame.K_3:
-                self._select_slot(3)
-                return True
+            # 1-9 tuşları yuva menüsünün kısayollarıyla işlenir
             
             # Delete - Seçili yuvayı sil
             if event.key == pygame.K_DELETE:
-                selected = self.slot_menu.selected_index + 1  # 1-indexed
-                if 1 <= selected <= 3:
-                    self._request_delete(selected)
+                index = self.slot_menu.selected_index
+                if 0 <= index < len(self.slot_numbers):
+                    self._request_delete(self.slot_numbers[index])
                 return True
         
         return False
@@ -127,8 +127,12 @@ class WorkerInterviewScreen(BaseScreen):
         """İşçi türü seçildi, görüşme başlat"""
         self.selected_worker_type = worker_type
         
-        # Rastgele aday getir
-        candidate = get_random_candidate(worker_type)
+        gm = self.screen_manager.game_manager
+        if not gm:
+            return
+        
+        # Rastgele aday getir (sefer akışından: kayıttan tekrarlanabilir)
+        candidate = get_random_candidate(worker_type, gm.rng)
         if not candidate:
             self.audio.speak("Bu türde aday bulunamadı.", interrupt=True)
             return
@@ -282,7 +286,10 @@ class WorkerInterviewScreen(BaseScreen):
         self.audio.speak("Reddettiniz. Başka adaylar arıyoruz...", interrupt=True)
         
         # Aynı türde yeni aday
-        candidate = get_random_candidate(self.selected_worker_type)
+        gm = self.screen_manager.game_manager
+        if not gm:
+            return
+        candidate = get_random_candidate(self.selected_worker_type, gm.rng)
         if candidate:
             self.interview_state = InterviewState(candidate=candidate)
             self._update_candidate_panel()